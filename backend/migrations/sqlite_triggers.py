@@ -0,0 +1,182 @@
+"""
+SQLite trigger DDL shared by the migrations.
+
+SQLite cannot alter a trigger, and rebuilding a table in batch mode drops the
+triggers on it, so several revisions drop and re-create the search (0003) and
+counter (0006, 0007) triggers. Each function here returns the (name, statement)
+pairs of one trigger family; its arguments pick the variant a revision needs,
+so every revision re-creates exactly what was in place at that point rather than
+a pasted copy. The current definitions live in schema.py (SEARCH_DDL, STATS_DDL);
+a change there needs a new revision that calls these with the new variant, or
+extends them with a new argument.
+"""
+from typing import List, Tuple
+
+Trigger = Tuple[str, str]
+
+
+def task_search_triggers() -> List[Trigger]:
+    """The FTS5 mirror triggers of 0003 on tasks: title and description."""
+    return [
+        (
+            "tasks_fts_insert",
+            """
+            CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+                INSERT INTO tasks_fts (title, description, checklist_text)
+                VALUES (NEW.title, coalesce(NEW.description, ''), '');
+                INSERT INTO tasks_fts_rows (task_id, fts_rowid) VALUES (NEW.id, last_insert_rowid());
+            END
+            """,
+        ),
+        (
+            "tasks_fts_update",
+            """
+            CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+                UPDATE tasks_fts SET title = NEW.title, description = coalesce(NEW.description, '')
+                WHERE rowid = (SELECT fts_rowid FROM tasks_fts_rows WHERE task_id = NEW.id);
+            END
+            """,
+        ),
+        (
+            "tasks_fts_delete",
+            """
+            CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+                DELETE FROM tasks_fts WHERE rowid = (SELECT fts_rowid FROM tasks_fts_rows WHERE task_id = OLD.id);
+                DELETE FROM tasks_fts_rows WHERE task_id = OLD.id;
+            END
+            """,
+        ),
+    ]
+
+
+def checklist_search_triggers() -> List[Trigger]:
+    """The FTS5 mirror triggers of 0003 on checklist_items: the checklist text of their task."""
+    triggers = []
+    for name, operation, row in (
+        ("insert", "INSERT", "NEW"), ("update", "UPDATE OF content", "NEW"), ("delete", "DELETE", "OLD")
+    ):
+        triggers.append((
+            f"checklist_items_fts_{name}",
+            f"""
+            CREATE TRIGGER checklist_items_fts_{name} AFTER {operation} ON checklist_items BEGIN
+                UPDATE tasks_fts SET checklist_text = coalesce((
+                    SELECT group_concat(ci.content, ' ')
+                    FROM checklist_items ci JOIN checklists c ON c.id = ci.checklist_id
+                    WHERE c.task_id = (SELECT task_id FROM checklists WHERE id = {row}.checklist_id)
+                ), '')
+                WHERE rowid = (
+                    SELECT r.fts_rowid FROM tasks_fts_rows r JOIN checklists c ON c.task_id = r.task_id
+                    WHERE c.id = {row}.checklist_id
+                );
+            END
+            """,
+        ))
+    return triggers
+
+
+def stats_triggers(tombstones: bool) -> List[Trigger]:
+    """
+    The user_task_stats triggers of 0006. With `tombstones` (0011 on) tasks with deleted_at
+    set are not counted, and setting or clearing deleted_at moves a task out of or into the counts.
+    """
+    insert_when = " WHEN NEW.deleted_at IS NULL" if tombstones else ""
+    update_columns = "user_id, status, priority" + (", deleted_at" if tombstones else "")
+    update_when = "OLD.user_id IS NOT NEW.user_id OR OLD.status IS NOT NEW.status OR OLD.priority IS NOT NEW.priority"
+    old_live = ""
+    new_row = "VALUES (NEW.user_id, NEW.status, NEW.priority, 1)"
+    if tombstones:
+        update_when += "\n                OR OLD.deleted_at IS NOT NEW.deleted_at"
+        old_live = "OLD.deleted_at IS NULL\n                    AND "
+        new_row = "SELECT NEW.user_id, NEW.status, NEW.priority, 1\n                WHERE NEW.deleted_at IS NULL"
+    return [
+        (
+            "tasks_stats_insert",
+            f"""
+            CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks{insert_when} BEGIN
+                INSERT INTO user_task_stats (user_id, status, priority, task_count)
+                VALUES (NEW.user_id, NEW.status, NEW.priority, 1)
+                ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = task_count + 1;
+            END
+            """,
+        ),
+        (
+            "tasks_stats_update",
+            f"""
+            CREATE TRIGGER tasks_stats_update AFTER UPDATE OF {update_columns} ON tasks
+            WHEN {update_when}
+            BEGIN
+                UPDATE user_task_stats SET task_count = task_count - 1
+                WHERE {old_live}user_id = OLD.user_id AND status = OLD.status AND priority = OLD.priority;
+                INSERT INTO user_task_stats (user_id, status, priority, task_count)
+                {new_row}
+                ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = task_count + 1;
+            END
+            """,
+        ),
+        (
+            "tasks_stats_delete",
+            f"""
+            CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks{insert_when.replace("NEW", "OLD")} BEGIN
+                UPDATE user_task_stats SET task_count = task_count - 1
+                WHERE user_id = OLD.user_id AND status = OLD.status AND priority = OLD.priority;
+            END
+            """,
+        ),
+    ]
+
+
+def due_stats_triggers(done: str, tombstones: bool) -> List[Trigger]:
+    """
+    The user_task_due_stats triggers of 0007, counting open tasks with a due date. `done` is the
+    SQL literal of the done status as stored at that revision: 'done' before 0009, 2 after it.
+    `tombstones` (0011 on) leaves tasks with deleted_at set out, as in stats_triggers.
+    """
+    def is_open(row: str) -> str:
+        condition = f"{row}.due_date IS NOT NULL AND {row}.status <> {done}"
+        return condition + (f" AND {row}.deleted_at IS NULL" if tombstones else "")
+
+    update_columns = "user_id, status, due_date" + (", deleted_at" if tombstones else "")
+    update_when = "OLD.user_id IS NOT NEW.user_id OR OLD.status IS NOT NEW.status OR OLD.due_date IS NOT NEW.due_date"
+    if tombstones:
+        update_when += "\n                OR OLD.deleted_at IS NOT NEW.deleted_at"
+    return [
+        (
+            "tasks_due_stats_insert",
+            f"""
+            CREATE TRIGGER tasks_due_stats_insert AFTER INSERT ON tasks
+            WHEN {is_open("NEW")}
+            BEGIN
+                INSERT INTO user_task_due_stats (user_id, due_on, open_count)
+                VALUES (NEW.user_id, date(NEW.due_date), 1)
+                ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = open_count + 1;
+            END
+            """,
+        ),
+        (
+            "tasks_due_stats_update",
+            f"""
+            CREATE TRIGGER tasks_due_stats_update AFTER UPDATE OF {update_columns} ON tasks
+            WHEN {update_when}
+            BEGIN
+                UPDATE user_task_due_stats SET open_count = open_count - 1
+                WHERE {is_open("OLD")}
+                    AND user_id = OLD.user_id AND due_on = date(OLD.due_date);
+                INSERT INTO user_task_due_stats (user_id, due_on, open_count)
+                SELECT NEW.user_id, date(NEW.due_date), 1
+                WHERE {is_open("NEW")}
+                ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = open_count + 1;
+            END
+            """,
+        ),
+        (
+            "tasks_due_stats_delete",
+            f"""
+            CREATE TRIGGER tasks_due_stats_delete AFTER DELETE ON tasks
+            WHEN {is_open("OLD")}
+            BEGIN
+                UPDATE user_task_due_stats SET open_count = open_count - 1
+                WHERE user_id = OLD.user_id AND due_on = date(OLD.due_date);
+            END
+            """,
+        ),
+    ]
@@ -0,0 +1,51 @@
+"""task hot path indexes
+
+Indexes shaped after the repository queries: owner listings ordered by
+creation time, owner + status filters, foreign-key lookups for child rows,
+and a partial index for the open-task due date scan.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_user_created_id", "tasks",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index("ix_tasks_user_status", "tasks", ["user_id", "status"])
+    op.create_index("ix_tasks_task_list_id", "tasks", ["task_list_id"])
+    op.create_index(
+        "ix_tasks_due_date_open", "tasks", ["due_date"],
+        postgresql_where=sa.text("status <> 'done'"),
+        sqlite_where=sa.text("status <> 'done'"),
+    )
+    # Superseded by ix_tasks_user_status for owner filters and ix_tasks_due_date_open for scans
+    op.drop_index("ix_tasks_status", table_name="tasks")
+
+    op.create_index("ix_task_lists_user_created", "task_lists", ["user_id", "created_at"])
+    op.create_index("ix_checklists_task_id", "checklists", ["task_id"])
+    op.create_index("ix_checklist_items_checklist_position", "checklist_items", ["checklist_id", "position"])
+    op.create_index("ix_attachments_task_id", "attachments", ["task_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attachments_task_id", table_name="attachments")
+    op.drop_index("ix_checklist_items_checklist_position", table_name="checklist_items")
+    op.drop_index("ix_checklists_task_id", table_name="checklists")
+    op.drop_index("ix_task_lists_user_created", table_name="task_lists")
+
+    op.create_index("ix_tasks_status", "tasks", ["status"])
+    op.drop_index("ix_tasks_due_date_open", table_name="tasks")
+    op.drop_index("ix_tasks_task_list_id", table_name="tasks")
+    op.drop_index("ix_tasks_user_status", table_name="tasks")
+    op.drop_index("ix_tasks_user_created_id", table_name="tasks")
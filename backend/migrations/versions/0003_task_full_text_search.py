@@ -0,0 +1,128 @@
+"""task full-text search
+
+Postgres: weighted tasks.search_vector maintained by triggers on tasks and
+checklist_items, served by a GIN index on (user_id, search_vector).
+SQLite: an FTS5 table mirrored by triggers.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+
+from backend.migrations.sqlite_triggers import checklist_search_triggers, task_search_triggers
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+POSTGRES_UPGRADE = [
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION task_search_vector(p_task_id uuid, p_title text, p_description text)
+    RETURNS tsvector LANGUAGE sql STABLE AS $$
+        SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(p_description, '')), 'B')
+            || setweight(to_tsvector('english', coalesce((
+                SELECT string_agg(ci.content, ' ')
+                FROM checklist_items ci JOIN checklists c ON c.id = ci.checklist_id
+                WHERE c.task_id = p_task_id
+            ), '')), 'C')
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION tasks_search_vector_refresh() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := task_search_vector(NEW.id, NEW.title, NEW.description);
+        RETURN NEW;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_search_vector_refresh
+    BEFORE INSERT OR UPDATE OF title, description ON tasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_refresh()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION checklist_items_search_vector_refresh() RETURNS trigger LANGUAGE plpgsql AS $$
+    DECLARE
+        v_checklist_id uuid;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            v_checklist_id := OLD.checklist_id;
+        ELSE
+            v_checklist_id := NEW.checklist_id;
+        END IF;
+        UPDATE tasks t SET search_vector = task_search_vector(t.id, t.title, t.description)
+        FROM checklists c
+        WHERE c.id = v_checklist_id AND t.id = c.task_id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER checklist_items_search_vector_refresh
+    AFTER INSERT OR UPDATE OF content OR DELETE ON checklist_items
+    FOR EACH ROW EXECUTE FUNCTION checklist_items_search_vector_refresh()
+    """,
+    "UPDATE tasks SET search_vector = task_search_vector(id, title, description)",
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (user_id, search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_tasks_search_vector",
+    "DROP TRIGGER IF EXISTS checklist_items_search_vector_refresh ON checklist_items",
+    "DROP FUNCTION IF EXISTS checklist_items_search_vector_refresh()",
+    "DROP TRIGGER IF EXISTS tasks_search_vector_refresh ON tasks",
+    "DROP FUNCTION IF EXISTS tasks_search_vector_refresh()",
+    "DROP FUNCTION IF EXISTS task_search_vector(uuid, text, text)",
+    "ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, checklist_text, tokenize='porter unicode61')",
+    """
+    CREATE TABLE tasks_fts_rows (
+        task_id CHAR(32) PRIMARY KEY,
+        fts_rowid INTEGER NOT NULL UNIQUE
+    )
+    """,
+    *(statement for _, statement in task_search_triggers() + checklist_search_triggers()),
+    # Backfill: FTS rowids are assigned in tasks rowid order, then mapped back the same way
+    """
+    INSERT INTO tasks_fts (rowid, title, description, checklist_text)
+    SELECT t.rowid, t.title, coalesce(t.description, ''), coalesce((
+        SELECT group_concat(ci.content, ' ')
+        FROM checklist_items ci JOIN checklists c ON c.id = ci.checklist_id
+        WHERE c.task_id = t.id
+    ), '')
+    FROM tasks t
+    """,
+    "INSERT INTO tasks_fts_rows (task_id, fts_rowid) SELECT id, rowid FROM tasks",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS checklist_items_fts_delete",
+    "DROP TRIGGER IF EXISTS checklist_items_fts_update",
+    "DROP TRIGGER IF EXISTS checklist_items_fts_insert",
+    "DROP TRIGGER IF EXISTS tasks_fts_delete",
+    "DROP TRIGGER IF EXISTS tasks_fts_update",
+    "DROP TRIGGER IF EXISTS tasks_fts_insert",
+    "DROP TABLE IF EXISTS tasks_fts_rows",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+
+
+def _run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    _run({"postgresql": POSTGRES_UPGRADE, "sqlite": SQLITE_UPGRADE})
+
+
+def downgrade() -> None:
+    _run({"postgresql": POSTGRES_DOWNGRADE, "sqlite": SQLITE_DOWNGRADE})
@@ -0,0 +1,25 @@
+"""task tags gin index
+
+GIN index on (user_id, tags) serving the any-of (&&) and all-of (@>)
+tag filters. Postgres only; relies on btree_gin from 0003.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE INDEX IF NOT EXISTS ix_tasks_user_tags ON tasks USING gin (user_id, tags)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_tasks_user_tags")
@@ -0,0 +1,81 @@
+"""cascading foreign keys
+
+Every parent/child foreign key gets ON DELETE CASCADE so a single DELETE
+on the parent removes its children inside the database.
+
+Postgres alters the constraints in place. SQLite cannot alter a
+constraint, so batch mode rebuilds each table. A rebuild drops the table's
+triggers, and renaming a table fails while another table's trigger refers
+to it, so the FTS triggers from 0003 are dropped first and re-created
+afterwards. Reflection also loses the DESC ordering of
+ix_tasks_user_created_id, so that index is rebuilt too.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.sqlite_triggers import checklist_search_triggers, task_search_triggers
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# (table, column, referred table), children after parents
+FOREIGN_KEYS = [
+    ("task_lists", "user_id", "users"),
+    ("tasks", "user_id", "users"),
+    ("tasks", "task_list_id", "task_lists"),
+    ("checklists", "task_id", "tasks"),
+    ("checklist_items", "checklist_id", "checklists"),
+    ("attachments", "task_id", "tasks"),
+]
+
+# Reflected SQLite constraints are unnamed; batch mode names them with this convention
+SQLITE_NAMING = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+# Replaces the copy of the 0003 search triggers this revision used to carry
+SQLITE_TRIGGERS = task_search_triggers() + checklist_search_triggers()
+
+
+def _constraint_name(table: str, column: str, referred: str) -> str:
+    if op.get_bind().dialect.name == "sqlite":
+        return SQLITE_NAMING["fk"] % {
+            "table_name": table, "column_0_name": column, "referred_table_name": referred
+        }
+    # Postgres default name for an unnamed column-level foreign key
+    return f"{table}_{column}_fkey"
+
+
+def _set_ondelete(ondelete) -> None:
+    sqlite = op.get_bind().dialect.name == "sqlite"
+    if sqlite:
+        for name, _ in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for table in dict.fromkeys(table for table, _, _ in FOREIGN_KEYS):
+        with op.batch_alter_table(table, naming_convention=SQLITE_NAMING) as batch_op:
+            for fk_table, column, referred in FOREIGN_KEYS:
+                if fk_table != table:
+                    continue
+                name = _constraint_name(table, column, referred)
+                batch_op.drop_constraint(name, type_="foreignkey")
+                batch_op.create_foreign_key(name, referred, [column], ["id"], ondelete=ondelete)
+    if sqlite:
+        for _, statement in SQLITE_TRIGGERS:
+            op.execute(statement)
+        op.drop_index("ix_tasks_user_created_id", table_name="tasks")
+        op.create_index(
+            "ix_tasks_user_created_id", "tasks",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        )
+
+
+def upgrade() -> None:
+    _set_ondelete("CASCADE")
+
+
+def downgrade() -> None:
+    _set_ondelete(None)
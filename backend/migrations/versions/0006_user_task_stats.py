@@ -0,0 +1,126 @@
+"""user task stats
+
+user_task_stats holds task counts per user, status and priority, maintained
+by triggers on tasks in the writing transaction. Postgres uses
+statement-level triggers over transition tables; SQLite uses row triggers.
+The triggers are created before the backfill: on Postgres CREATE TRIGGER
+blocks writes to tasks until this migration commits, so no write is missed
+or counted twice.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from backend.migrations.sqlite_triggers import stats_triggers
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+POSTGRES_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION user_task_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+        SELECT user_id, status, priority, count(*) FROM new_rows GROUP BY user_id, status, priority
+        ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_task_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+        SELECT user_id, status, priority, sum(delta) FROM (
+            SELECT user_id, status, priority, -1 AS delta FROM old_rows
+            UNION ALL
+            SELECT user_id, status, priority, 1 AS delta FROM new_rows
+        ) changes
+        GROUP BY user_id, status, priority
+        HAVING sum(delta) <> 0
+        ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_task_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE user_task_stats s SET task_count = s.task_count - d.removed
+        FROM (
+            SELECT user_id, status, priority, count(*) AS removed
+            FROM old_rows GROUP BY user_id, status, priority
+        ) d
+        WHERE s.user_id = d.user_id AND s.status = d.status AND s.priority = d.priority;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_task_stats_insert()
+    """,
+    """
+    CREATE TRIGGER tasks_stats_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_task_stats_update()
+    """,
+    """
+    CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_task_stats_delete()
+    """,
+]
+
+# Later revisions that rebuild tasks re-create these from the same helper
+SQLITE_TRIGGERS = [statement for _, statement in stats_triggers(tombstones=False)]
+
+BACKFILL = """
+    INSERT INTO user_task_stats (user_id, status, priority, task_count)
+    SELECT user_id, status, priority, count(*) FROM tasks GROUP BY user_id, status, priority
+"""
+
+POSTGRES_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_stats_delete ON tasks",
+    "DROP TRIGGER IF EXISTS tasks_stats_update ON tasks",
+    "DROP TRIGGER IF EXISTS tasks_stats_insert ON tasks",
+    "DROP FUNCTION IF EXISTS user_task_stats_delete()",
+    "DROP FUNCTION IF EXISTS user_task_stats_update()",
+    "DROP FUNCTION IF EXISTS user_task_stats_insert()",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_stats_delete",
+    "DROP TRIGGER IF EXISTS tasks_stats_update",
+    "DROP TRIGGER IF EXISTS tasks_stats_insert",
+]
+
+
+def _run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_task_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("priority", sa.String(), nullable=False),
+        sa.Column("task_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "status", "priority"),
+    )
+    _run({"postgresql": POSTGRES_TRIGGERS, "sqlite": SQLITE_TRIGGERS})
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    _run({"postgresql": POSTGRES_DOWNGRADE, "sqlite": SQLITE_DOWNGRADE})
+    op.drop_table("user_task_stats")
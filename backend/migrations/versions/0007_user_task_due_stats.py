@@ -0,0 +1,143 @@
+"""user task due stats
+
+user_task_due_stats counts open (not done) tasks per user and due day, for
+the dashboard's overdue and due-this-week figures. Like user_task_stats
+(0006) it is maintained by triggers on tasks and backfilled after they are
+created. ix_tasks_user_due_open serves the part of today that is already
+overdue, which day buckets cannot split.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from backend.migrations.sqlite_triggers import due_stats_triggers
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+POSTGRES_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION user_task_due_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+        SELECT user_id, due_date::date, count(*) FROM new_rows
+        WHERE due_date IS NOT NULL AND status <> 'done'
+        GROUP BY user_id, due_date::date
+        ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_task_due_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+        SELECT user_id, due_on, sum(delta) FROM (
+            SELECT user_id, due_date::date AS due_on, -1 AS delta FROM old_rows
+            WHERE due_date IS NOT NULL AND status <> 'done'
+            UNION ALL
+            SELECT user_id, due_date::date AS due_on, 1 AS delta FROM new_rows
+            WHERE due_date IS NOT NULL AND status <> 'done'
+        ) changes
+        GROUP BY user_id, due_on
+        HAVING sum(delta) <> 0
+        ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_task_due_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE user_task_due_stats s SET open_count = s.open_count - d.removed
+        FROM (
+            SELECT user_id, due_date::date AS due_on, count(*) AS removed FROM old_rows
+            WHERE due_date IS NOT NULL AND status <> 'done'
+            GROUP BY user_id, due_date::date
+        ) d
+        WHERE s.user_id = d.user_id AND s.due_on = d.due_on;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_due_stats_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_task_due_stats_insert()
+    """,
+    """
+    CREATE TRIGGER tasks_due_stats_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_task_due_stats_update()
+    """,
+    """
+    CREATE TRIGGER tasks_due_stats_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_task_due_stats_delete()
+    """,
+]
+
+# Later revisions that rebuild tasks re-create these from the same helper
+SQLITE_TRIGGERS = [statement for _, statement in due_stats_triggers("'done'", tombstones=False)]
+
+POSTGRES_BACKFILL = """
+    INSERT INTO user_task_due_stats (user_id, due_on, open_count)
+    SELECT user_id, due_date::date, count(*) FROM tasks
+    WHERE due_date IS NOT NULL AND status <> 'done'
+    GROUP BY user_id, due_date::date
+"""
+
+SQLITE_BACKFILL = """
+    INSERT INTO user_task_due_stats (user_id, due_on, open_count)
+    SELECT user_id, date(due_date), count(*) FROM tasks
+    WHERE due_date IS NOT NULL AND status <> 'done'
+    GROUP BY user_id, date(due_date)
+"""
+
+POSTGRES_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_due_stats_delete ON tasks",
+    "DROP TRIGGER IF EXISTS tasks_due_stats_update ON tasks",
+    "DROP TRIGGER IF EXISTS tasks_due_stats_insert ON tasks",
+    "DROP FUNCTION IF EXISTS user_task_due_stats_delete()",
+    "DROP FUNCTION IF EXISTS user_task_due_stats_update()",
+    "DROP FUNCTION IF EXISTS user_task_due_stats_insert()",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_due_stats_delete",
+    "DROP TRIGGER IF EXISTS tasks_due_stats_update",
+    "DROP TRIGGER IF EXISTS tasks_due_stats_insert",
+]
+
+
+def _run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_task_due_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("due_on", sa.Date(), nullable=False),
+        sa.Column("open_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "due_on"),
+    )
+    op.create_index(
+        "ix_tasks_user_due_open", "tasks", ["user_id", "due_date"],
+        postgresql_where=sa.text("status <> 'done'"),
+        sqlite_where=sa.text("status <> 'done'"),
+    )
+    _run({"postgresql": POSTGRES_TRIGGERS + [POSTGRES_BACKFILL], "sqlite": SQLITE_TRIGGERS + [SQLITE_BACKFILL]})
+
+
+def downgrade() -> None:
+    _run({"postgresql": POSTGRES_DOWNGRADE, "sqlite": SQLITE_DOWNGRADE})
+    op.drop_index("ix_tasks_user_due_open", table_name="tasks")
+    op.drop_table("user_task_due_stats")
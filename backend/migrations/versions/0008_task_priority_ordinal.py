@@ -0,0 +1,98 @@
+"""task priority ordinal and sort indexes
+
+tasks.priority and user_task_stats.priority become SMALLINT ordinals
+(low=0, medium=1, high=2, urgent=3) so that sorting by priority follows its
+meaning and can be served by an index. Each listing sort gets a composite
+(user_id, <sort key>, id) index in the direction of its ORDER BY.
+
+Postgres converts the columns in place. SQLite cannot change a column type,
+so batch mode rebuilds both tables; as in 0005, every trigger on tasks is
+dropped first and re-created afterwards, and the indexes reflection cannot
+reproduce (DESC, partial) are rebuilt.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.sqlite_triggers import due_stats_triggers, stats_triggers, task_search_triggers
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+PRIORITIES = ["low", "medium", "high", "urgent"]
+
+TO_ORDINAL = "CASE priority " + " ".join(
+    f"WHEN '{name}' THEN {ordinal}" for ordinal, name in enumerate(PRIORITIES)
+) + " END"
+
+# CAST also covers SQLite, where the ordinals are briefly stored in a text column
+TO_NAME = "CASE CAST(priority AS INTEGER) " + " ".join(
+    f"WHEN {ordinal} THEN '{name}'" for ordinal, name in enumerate(PRIORITIES)
+) + " END"
+
+PRIORITY_TABLES = ["tasks", "user_task_stats"]
+
+SORT_INDEXES = [
+    ("ix_tasks_user_due_id", ["user_id", "due_date", "id"]),
+    (
+        "ix_tasks_user_priority_created_id",
+        ["user_id", sa.text("priority DESC"), sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    ("ix_tasks_user_updated_id", ["user_id", sa.text("updated_at DESC"), sa.text("id DESC")]),
+]
+
+# Replaces the copies of the 0003 task search, 0006 stats and 0007 due-stats triggers
+# this revision used to carry
+SQLITE_TRIGGERS = (
+    task_search_triggers() + stats_triggers(tombstones=False)
+    + due_stats_triggers("'done'", tombstones=False)
+)
+
+
+def _rebuild_sqlite_indexes() -> None:
+    op.drop_index("ix_tasks_user_created_id", table_name="tasks")
+    op.create_index(
+        "ix_tasks_user_created_id", "tasks",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    for name, columns in (("ix_tasks_due_date_open", ["due_date"]), ("ix_tasks_user_due_open", ["user_id", "due_date"])):
+        op.drop_index(name, table_name="tasks")
+        op.create_index(name, "tasks", columns, sqlite_where=sa.text("status <> 'done'"))
+
+
+def _convert(to_type, from_type, expression) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        for table in PRIORITY_TABLES:
+            op.alter_column(
+                table, "priority", type_=to_type, existing_type=from_type,
+                postgresql_using=expression,
+            )
+        return
+
+    for name, _ in SQLITE_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    # Values are rewritten while the column still has its old type: the rebuild only copies them
+    for table in PRIORITY_TABLES:
+        op.execute(f"UPDATE {table} SET priority = {expression}")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column("priority", type_=to_type, existing_type=from_type)
+    for _, statement in SQLITE_TRIGGERS:
+        op.execute(statement)
+    _rebuild_sqlite_indexes()
+
+
+def upgrade() -> None:
+    _convert(sa.SmallInteger(), sa.String(), TO_ORDINAL)
+    for name, columns in SORT_INDEXES:
+        op.create_index(name, "tasks", columns)
+
+
+def downgrade() -> None:
+    for name, _ in SORT_INDEXES:
+        op.drop_index(name, table_name="tasks")
+    _convert(sa.String(), sa.SmallInteger(), TO_NAME)
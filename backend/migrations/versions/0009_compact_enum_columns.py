@@ -0,0 +1,169 @@
+"""compact enum columns
+
+tasks.status, user_task_stats.status and users.role become SMALLINT
+ordinals, like priority in 0008: todo=0, in_progress=1, done=2 and user=0,
+admin=1. The partial indexes and the due-stats triggers test for "not done",
+so they are rebuilt against the code instead of the string.
+
+On Postgres the columns are converted in place and the due-stats trigger
+functions are replaced. SQLite rebuilds the tables in batch mode, so as in
+0008 the tasks triggers are dropped first, re-created afterwards, and the
+DESC indexes are rebuilt.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.sqlite_triggers import due_stats_triggers, stats_triggers, task_search_triggers
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+TASK_STATUSES = ["todo", "in_progress", "done"]
+USER_ROLES = ["user", "admin"]
+
+# (table, column, names in ordinal order)
+ENUM_COLUMNS = [
+    ("tasks", "status", TASK_STATUSES),
+    ("user_task_stats", "status", TASK_STATUSES),
+    ("users", "role", USER_ROLES),
+]
+
+# The "not done" predicate per storage: the string before this revision, the code after it
+DONE = {"upgrade": str(TASK_STATUSES.index("done")), "downgrade": "'done'"}
+
+OPEN_INDEXES = [
+    ("ix_tasks_due_date_open", ["due_date"]),
+    ("ix_tasks_user_due_open", ["user_id", "due_date"]),
+]
+
+DESC_INDEXES = [
+    ("ix_tasks_user_created_id", ["user_id", sa.text("created_at DESC"), sa.text("id DESC")]),
+    (
+        "ix_tasks_user_priority_created_id",
+        ["user_id", sa.text("priority DESC"), sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    ("ix_tasks_user_updated_id", ["user_id", sa.text("updated_at DESC"), sa.text("id DESC")]),
+]
+
+POSTGRES_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION user_task_due_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+        SELECT user_id, due_date::date, count(*) FROM new_rows
+        WHERE due_date IS NOT NULL AND status <> {done}
+        GROUP BY user_id, due_date::date
+        ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_task_due_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+        SELECT user_id, due_on, sum(delta) FROM (
+            SELECT user_id, due_date::date AS due_on, -1 AS delta FROM old_rows
+            WHERE due_date IS NOT NULL AND status <> {done}
+            UNION ALL
+            SELECT user_id, due_date::date AS due_on, 1 AS delta FROM new_rows
+            WHERE due_date IS NOT NULL AND status <> {done}
+        ) changes
+        GROUP BY user_id, due_on
+        HAVING sum(delta) <> 0
+        ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_task_due_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE user_task_due_stats s SET open_count = s.open_count - d.removed
+        FROM (
+            SELECT user_id, due_date::date AS due_on, count(*) AS removed FROM old_rows
+            WHERE due_date IS NOT NULL AND status <> {done}
+            GROUP BY user_id, due_date::date
+        ) d
+        WHERE s.user_id = d.user_id AND s.due_on = d.due_on;
+        RETURN NULL;
+    END
+    $$
+    """,
+]
+
+def _sqlite_triggers(done: str):
+    # Replaces the copies of the 0003 task search, 0006 stats and 0007 due-stats triggers this
+    # revision used to carry, which had a {done} placeholder where `done` now goes
+    return (
+        task_search_triggers() + stats_triggers(tombstones=False)
+        + due_stats_triggers(done, tombstones=False)
+    )
+
+
+def _to_ordinal(column: str, names) -> str:
+    return f"CASE {column} " + " ".join(
+        f"WHEN '{name}' THEN {ordinal}" for ordinal, name in enumerate(names)
+    ) + " END"
+
+
+def _to_name(column: str, names) -> str:
+    # CAST also covers SQLite, where the codes are briefly stored in a text column
+    return f"CASE CAST({column} AS INTEGER) " + " ".join(
+        f"WHEN {ordinal} THEN '{name}'" for ordinal, name in enumerate(names)
+    ) + " END"
+
+
+def _convert(direction: str) -> None:
+    upgrading = direction == "upgrade"
+    to_type, from_type = (sa.SmallInteger(), sa.String()) if upgrading else (sa.String(), sa.SmallInteger())
+    convert = _to_ordinal if upgrading else _to_name
+    sqlite = op.get_bind().dialect.name == "sqlite"
+
+    # The partial index predicates compare status with the old representation
+    for name, _ in OPEN_INDEXES:
+        op.drop_index(name, table_name="tasks")
+
+    if sqlite:
+        triggers = _sqlite_triggers(DONE[direction])
+        for name, _ in triggers:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        # Values are rewritten while the column still has its old type: the rebuild only copies them
+        for table, column, names in ENUM_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = {convert(column, names)}")
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(column, type_=to_type, existing_type=from_type)
+        for _, statement in triggers:
+            op.execute(statement)
+        for name, columns in DESC_INDEXES:
+            op.drop_index(name, table_name="tasks")
+            op.create_index(name, "tasks", columns)
+    else:
+        for table, column, names in ENUM_COLUMNS:
+            op.alter_column(
+                table, column, type_=to_type, existing_type=from_type,
+                postgresql_using=convert(column, names),
+            )
+        for statement in POSTGRES_FUNCTIONS:
+            op.execute(statement.format(done=DONE[direction]))
+
+    for name, columns in OPEN_INDEXES:
+        op.create_index(
+            name, "tasks", columns,
+            postgresql_where=sa.text(f"status <> {DONE[direction]}"),
+            sqlite_where=sa.text(f"status <> {DONE[direction]}"),
+        )
+
+
+def upgrade() -> None:
+    _convert("upgrade")
+
+
+def downgrade() -> None:
+    _convert("downgrade")
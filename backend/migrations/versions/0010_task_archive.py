@@ -0,0 +1,111 @@
+"""task archive
+
+archived_tasks, archived_checklists, archived_checklist_items and
+archived_attachments mirror the live tables, plus archived_tasks.archived_at.
+The archive_done_tasks worker job moves old done tasks into them. The
+partial index ix_tasks_done_updated finds those tasks without reading
+open work.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import StringArray
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+# TaskStatus.DONE's code since 0009
+DONE = "2"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archived_tasks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column(
+            "task_list_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("task_lists.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.SmallInteger(), nullable=True),
+        sa.Column("priority", sa.SmallInteger(), nullable=True),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("tags", StringArray(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index(
+        "ix_archived_tasks_user_created_id", "archived_tasks",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index("ix_archived_tasks_task_list_id", "archived_tasks", ["task_list_id"])
+
+    op.create_table(
+        "archived_checklists",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("archived_tasks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_archived_checklists_task_id", "archived_checklists", ["task_id"])
+
+    op.create_table(
+        "archived_checklist_items",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "checklist_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("archived_checklists.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.Column("is_completed", sa.Boolean(), nullable=True),
+        sa.Column("position", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_archived_checklist_items_checklist_position", "archived_checklist_items", ["checklist_id", "position"]
+    )
+
+    op.create_table(
+        "archived_attachments",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("archived_tasks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("file_url", sa.String(), nullable=False),
+        sa.Column("file_size_bytes", sa.Integer(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_archived_attachments_task_id", "archived_attachments", ["task_id"])
+
+    op.create_index(
+        "ix_tasks_done_updated", "tasks", ["updated_at"],
+        postgresql_where=sa.text(f"status = {DONE}"),
+        sqlite_where=sa.text(f"status = {DONE}"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_done_updated", table_name="tasks")
+    op.drop_table("archived_attachments")
+    op.drop_table("archived_checklist_items")
+    op.drop_table("archived_checklists")
+    op.drop_table("archived_tasks")
@@ -0,0 +1,234 @@
+"""task tombstones
+
+tasks.deleted_at marks a deleted task; reads skip it and the purge_deleted_tasks
+worker job removes the row later. The partial index ix_tasks_deleted_at finds
+purge candidates. The counter triggers stop counting a task when it is
+tombstoned and count it again when it is restored, so the Postgres trigger
+functions are replaced and the SQLite triggers re-created (they also fire on
+changes to deleted_at now).
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.sqlite_triggers import due_stats_triggers, stats_triggers
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+POSTGRES_FUNCTIONS = {
+    "upgrade": [
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+            SELECT user_id, status, priority, count(*) FROM new_rows WHERE deleted_at IS NULL
+            GROUP BY user_id, status, priority
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+            SELECT user_id, status, priority, sum(delta) FROM (
+                SELECT user_id, status, priority, -1 AS delta FROM old_rows WHERE deleted_at IS NULL
+                UNION ALL
+                SELECT user_id, status, priority, 1 AS delta FROM new_rows WHERE deleted_at IS NULL
+            ) changes
+            GROUP BY user_id, status, priority
+            HAVING sum(delta) <> 0
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE user_task_stats s SET task_count = s.task_count - d.removed
+            FROM (
+                SELECT user_id, status, priority, count(*) AS removed
+                FROM old_rows WHERE deleted_at IS NULL GROUP BY user_id, status, priority
+            ) d
+            WHERE s.user_id = d.user_id AND s.status = d.status AND s.priority = d.priority;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+            SELECT user_id, due_date::date, count(*) FROM new_rows
+            WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+            GROUP BY user_id, due_date::date
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+            SELECT user_id, due_on, sum(delta) FROM (
+                SELECT user_id, due_date::date AS due_on, -1 AS delta FROM old_rows
+                WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+                UNION ALL
+                SELECT user_id, due_date::date AS due_on, 1 AS delta FROM new_rows
+                WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+            ) changes
+            GROUP BY user_id, due_on
+            HAVING sum(delta) <> 0
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE user_task_due_stats s SET open_count = s.open_count - d.removed
+            FROM (
+                SELECT user_id, due_date::date AS due_on, count(*) AS removed FROM old_rows
+                WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+                GROUP BY user_id, due_date::date
+            ) d
+            WHERE s.user_id = d.user_id AND s.due_on = d.due_on;
+            RETURN NULL;
+        END
+        $$
+        """,
+    ],
+    "downgrade": [
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+            SELECT user_id, status, priority, count(*) FROM new_rows GROUP BY user_id, status, priority
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+            SELECT user_id, status, priority, sum(delta) FROM (
+                SELECT user_id, status, priority, -1 AS delta FROM old_rows
+                UNION ALL
+                SELECT user_id, status, priority, 1 AS delta FROM new_rows
+            ) changes
+            GROUP BY user_id, status, priority
+            HAVING sum(delta) <> 0
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE user_task_stats s SET task_count = s.task_count - d.removed
+            FROM (
+                SELECT user_id, status, priority, count(*) AS removed
+                FROM old_rows GROUP BY user_id, status, priority
+            ) d
+            WHERE s.user_id = d.user_id AND s.status = d.status AND s.priority = d.priority;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+            SELECT user_id, due_date::date, count(*) FROM new_rows
+            WHERE due_date IS NOT NULL AND status <> 2
+            GROUP BY user_id, due_date::date
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+            SELECT user_id, due_on, sum(delta) FROM (
+                SELECT user_id, due_date::date AS due_on, -1 AS delta FROM old_rows
+                WHERE due_date IS NOT NULL AND status <> 2
+                UNION ALL
+                SELECT user_id, due_date::date AS due_on, 1 AS delta FROM new_rows
+                WHERE due_date IS NOT NULL AND status <> 2
+            ) changes
+            GROUP BY user_id, due_on
+            HAVING sum(delta) <> 0
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE user_task_due_stats s SET open_count = s.open_count - d.removed
+            FROM (
+                SELECT user_id, due_date::date AS due_on, count(*) AS removed FROM old_rows
+                WHERE due_date IS NOT NULL AND status <> 2
+                GROUP BY user_id, due_date::date
+            ) d
+            WHERE s.user_id = d.user_id AND s.due_on = d.due_on;
+            RETURN NULL;
+        END
+        $$
+        """,
+    ],
+}
+
+# Replaces the copies of the 0006 stats and 0007 due-stats triggers (as rebuilt in 0009)
+# this revision used to carry, one per direction
+SQLITE_TRIGGERS = {
+    "upgrade": stats_triggers(tombstones=True) + due_stats_triggers("2", tombstones=True),
+    "downgrade": stats_triggers(tombstones=False) + due_stats_triggers("2", tombstones=False),
+}
+
+
+def _replace_counter_triggers(direction: str) -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for name, _ in SQLITE_TRIGGERS[direction]:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for _, statement in SQLITE_TRIGGERS[direction]:
+            op.execute(statement)
+    else:
+        # The statement-level triggers stay; only the functions they call change
+        for statement in POSTGRES_FUNCTIONS[direction]:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "ix_tasks_deleted_at", "tasks", ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        sqlite_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    _replace_counter_triggers("upgrade")
+
+
+def downgrade() -> None:
+    # Tombstoned tasks were already left out of the counters, so dropping them keeps those exact
+    op.execute("DELETE FROM tasks WHERE deleted_at IS NOT NULL")
+    op.drop_index("ix_tasks_deleted_at", table_name="tasks")
+    # The triggers must stop referencing deleted_at before SQLite lets the column go
+    _replace_counter_triggers("downgrade")
+    op.drop_column("tasks", "deleted_at")
@@ -0,0 +1,221 @@
+"""sync change log
+
+sync_changes holds the latest change to every task, task list, checklist and
+checklist item, with a change_seq from one increasing sequence and a deleted
+flag for tombstones. Triggers on the four tables keep it current, and
+ix_sync_changes_user_seq answers "what changed for this user after N". Existing
+rows are backfilled so a client's first sync sees everything.
+
+Postgres draws change_seq from the sync_change_seq sequence and takes a
+per-user advisory lock in every trigger so a user's changes commit in sequence
+order. SQLite keeps the counter in the one-row sync_sequence table.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+# (table, SyncEntity code, owner of NEW on SQLite, owner join on Postgres)
+TABLES = [
+    ("tasks", 0, "NEW.user_id", "SELECT n.id, n.user_id FROM new_rows n"),
+    ("task_lists", 1, "NEW.user_id", "SELECT n.id, n.user_id FROM new_rows n"),
+    (
+        "checklists", 2,
+        "(SELECT user_id FROM tasks WHERE id = NEW.task_id)",
+        "SELECT n.id, t.user_id FROM new_rows n JOIN tasks t ON t.id = n.task_id",
+    ),
+    (
+        "checklist_items", 3,
+        "(SELECT t.user_id FROM checklists c JOIN tasks t ON t.id = c.task_id WHERE c.id = NEW.checklist_id)",
+        "SELECT n.id, t.user_id FROM new_rows n JOIN checklists c ON c.id = n.checklist_id "
+        "JOIN tasks t ON t.id = c.task_id",
+    ),
+]
+
+# Every existing row with its owner, per table
+BACKFILL = [
+    (0, "SELECT id, user_id FROM tasks"),
+    (1, "SELECT id, user_id FROM task_lists"),
+    (2, "SELECT c.id, t.user_id FROM checklists c JOIN tasks t ON t.id = c.task_id"),
+    (
+        3,
+        "SELECT i.id, t.user_id FROM checklist_items i JOIN checklists c ON c.id = i.checklist_id "
+        "JOIN tasks t ON t.id = c.task_id",
+    ),
+]
+
+POSTGRES_FUNCTIONS = [
+    "CREATE SEQUENCE IF NOT EXISTS sync_change_seq",
+    """
+    CREATE OR REPLACE FUNCTION sync_lock_users(p_user_ids uuid[]) RETURNS void LANGUAGE plpgsql AS $$
+    DECLARE
+        v_user_id uuid;
+    BEGIN
+        FOR v_user_id IN SELECT DISTINCT u FROM unnest(p_user_ids) AS u ORDER BY u LOOP
+            PERFORM pg_advisory_xact_lock(hashtextextended(v_user_id::text, 0));
+        END LOOP;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION sync_changes_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM sync_lock_users(ARRAY(
+            SELECT s.user_id FROM sync_changes s JOIN new_rows n ON s.entity_id = n.id
+            WHERE s.entity_type = TG_ARGV[0]::smallint
+        ));
+        UPDATE sync_changes s SET change_seq = nextval('sync_change_seq')
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE s.entity_type = TG_ARGV[0]::smallint AND s.entity_id = n.id
+            AND to_jsonb(n) - 'search_vector' IS DISTINCT FROM to_jsonb(o) - 'search_vector';
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION sync_changes_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM sync_lock_users(ARRAY(
+            SELECT s.user_id FROM sync_changes s JOIN old_rows o ON s.entity_id = o.id
+            WHERE s.entity_type = TG_ARGV[0]::smallint
+        ));
+        UPDATE sync_changes s SET change_seq = nextval('sync_change_seq'), deleted = true
+        FROM old_rows o
+        WHERE s.entity_type = TG_ARGV[0]::smallint AND s.entity_id = o.id;
+        RETURN NULL;
+    END
+    $$
+    """,
+]
+
+
+def _postgres_triggers(table: str, code: int, owned: str) -> list:
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {table}_sync_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM sync_lock_users(ARRAY(SELECT user_id FROM ({owned}) owned));
+            INSERT INTO sync_changes (entity_type, entity_id, user_id, change_seq, deleted)
+            SELECT {code}, id, user_id, nextval('sync_change_seq'), false FROM ({owned}) owned
+            ON CONFLICT (entity_type, entity_id) DO UPDATE
+            SET user_id = EXCLUDED.user_id, change_seq = EXCLUDED.change_seq, deleted = false;
+            RETURN NULL;
+        END
+        $$
+        """,
+        f"""
+        CREATE TRIGGER {table}_sync_insert AFTER INSERT ON {table}
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION {table}_sync_insert()
+        """,
+        f"""
+        CREATE TRIGGER {table}_sync_update AFTER UPDATE ON {table}
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION sync_changes_update('{code}')
+        """,
+        f"""
+        CREATE TRIGGER {table}_sync_delete AFTER DELETE ON {table}
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION sync_changes_delete('{code}')
+        """,
+    ]
+
+
+def _sqlite_triggers(table: str, code: int, owner: str) -> list:
+    return [
+        f"""
+        CREATE TRIGGER {table}_sync_insert AFTER INSERT ON {table} BEGIN
+            UPDATE sync_sequence SET value = value + 1;
+            INSERT INTO sync_changes (entity_type, entity_id, user_id, change_seq, deleted)
+            VALUES ({code}, NEW.id, {owner}, (SELECT value FROM sync_sequence), 0)
+            ON CONFLICT (entity_type, entity_id) DO UPDATE
+            SET user_id = excluded.user_id, change_seq = excluded.change_seq, deleted = 0;
+        END
+        """,
+        f"""
+        CREATE TRIGGER {table}_sync_update AFTER UPDATE ON {table} BEGIN
+            UPDATE sync_sequence SET value = value + 1;
+            UPDATE sync_changes SET change_seq = (SELECT value FROM sync_sequence)
+            WHERE entity_type = {code} AND entity_id = NEW.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER {table}_sync_delete AFTER DELETE ON {table} BEGIN
+            UPDATE sync_sequence SET value = value + 1;
+            UPDATE sync_changes SET change_seq = (SELECT value FROM sync_sequence), deleted = 1
+            WHERE entity_type = {code} AND entity_id = OLD.id;
+        END
+        """,
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_changes",
+        sa.Column("entity_type", sa.SmallInteger(), primary_key=True),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("deleted", sa.Boolean(), nullable=False),
+    )
+    op.create_index("ix_sync_changes_user_seq", "sync_changes", ["user_id", "change_seq"])
+
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("CREATE TABLE sync_sequence (id INTEGER PRIMARY KEY CHECK (id = 1), value INTEGER NOT NULL)")
+        op.execute("INSERT INTO sync_sequence (id, value) VALUES (1, 0)")
+        for table, code, owner, _ in TABLES:
+            for statement in _sqlite_triggers(table, code, owner):
+                op.execute(statement)
+        for code, owned in BACKFILL:
+            op.execute(f"""
+                INSERT INTO sync_changes (entity_type, entity_id, user_id, change_seq, deleted)
+                SELECT {code}, id, user_id,
+                    (SELECT value FROM sync_sequence) + row_number() OVER (ORDER BY id), 0
+                FROM ({owned}) owned
+            """)
+            op.execute("""
+                UPDATE sync_sequence
+                SET value = coalesce((SELECT max(change_seq) FROM sync_changes), value)
+            """)
+    else:
+        for statement in POSTGRES_FUNCTIONS:
+            op.execute(statement)
+        for table, code, _, owned in TABLES:
+            for statement in _postgres_triggers(table, code, owned):
+                op.execute(statement)
+        # Triggers first, so rows written during the backfill are not missed; they win any conflict
+        for code, owned in BACKFILL:
+            op.execute(f"""
+                INSERT INTO sync_changes (entity_type, entity_id, user_id, change_seq, deleted)
+                SELECT {code}, id, user_id, nextval('sync_change_seq'), false FROM ({owned}) owned
+                ON CONFLICT (entity_type, entity_id) DO NOTHING
+            """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for table, _, _, _ in TABLES:
+            for operation in ("insert", "update", "delete"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_{operation}")
+        op.execute("DROP TABLE IF EXISTS sync_sequence")
+    else:
+        for table, _, _, _ in TABLES:
+            for operation in ("insert", "update", "delete"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_{operation} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS {table}_sync_insert()")
+        op.execute("DROP FUNCTION IF EXISTS sync_changes_delete()")
+        op.execute("DROP FUNCTION IF EXISTS sync_changes_update()")
+        op.execute("DROP FUNCTION IF EXISTS sync_lock_users(uuid[])")
+        op.execute("DROP SEQUENCE IF EXISTS sync_change_seq")
+    op.drop_index("ix_sync_changes_user_seq", table_name="sync_changes")
+    op.drop_table("sync_changes")
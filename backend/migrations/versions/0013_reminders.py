@@ -0,0 +1,131 @@
+"""reminders queue
+
+reminders holds the pending due-date reminder of every open task, with
+fire_at 24 hours before the due date, and ix_reminders_fire_at lets the
+reminder job take the due ones in order. Triggers on tasks add a row when a
+task gets a due date, is reopened or restored, or its due date moves, and drop
+it when the task is done, tombstoned or loses its due date; deleted and
+archived tasks take theirs along through ON DELETE CASCADE. Open tasks still
+due in the future are backfilled.
+
+ix_tasks_due_date_open only served the old due-soon scan over tasks and is
+dropped.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+ELIGIBLE = "due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL"
+
+POSTGRES_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION reminders_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO reminders (task_id, due_date, fire_at)
+        SELECT id, due_date, due_date - interval '24 hours' FROM new_rows
+        WHERE {ELIGIBLE};
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION reminders_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        DELETE FROM reminders r USING new_rows n
+        WHERE r.task_id = n.id AND NOT (n.due_date IS NOT NULL AND n.status <> 2 AND n.deleted_at IS NULL);
+        INSERT INTO reminders (task_id, due_date, fire_at)
+        SELECT n.id, n.due_date, n.due_date - interval '24 hours'
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE n.due_date IS NOT NULL AND n.status <> 2 AND n.deleted_at IS NULL
+            AND (o.due_date IS DISTINCT FROM n.due_date OR o.status = 2 OR o.deleted_at IS NOT NULL)
+        ON CONFLICT (task_id) DO UPDATE SET due_date = EXCLUDED.due_date, fire_at = EXCLUDED.fire_at;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_reminders_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reminders_insert()
+    """,
+    """
+    CREATE TRIGGER tasks_reminders_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION reminders_update()
+    """,
+]
+
+SQLITE_DDL = [
+    """
+    CREATE TRIGGER tasks_reminders_insert AFTER INSERT ON tasks
+    WHEN NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL BEGIN
+        INSERT INTO reminders (task_id, due_date, fire_at)
+        VALUES (NEW.id, NEW.due_date, datetime(NEW.due_date, '-24 hours'));
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_reminders_update AFTER UPDATE OF due_date, status, deleted_at ON tasks BEGIN
+        DELETE FROM reminders
+        WHERE task_id = NEW.id AND NOT (NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL);
+        INSERT INTO reminders (task_id, due_date, fire_at)
+        SELECT NEW.id, NEW.due_date, datetime(NEW.due_date, '-24 hours')
+        WHERE NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL
+            AND (OLD.due_date IS NOT NEW.due_date OR OLD.status = 2 OR OLD.deleted_at IS NOT NULL)
+        ON CONFLICT (task_id) DO UPDATE SET due_date = excluded.due_date, fire_at = excluded.fire_at;
+    END
+    """,
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminders",
+        sa.Column(
+            "task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("due_date", sa.DateTime(), nullable=False),
+        sa.Column("fire_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_reminders_fire_at", "reminders", ["fire_at"])
+
+    sqlite = op.get_bind().dialect.name == "sqlite"
+    for statement in SQLITE_DDL if sqlite else POSTGRES_DDL:
+        op.execute(statement)
+    # Triggers first, so tasks written during the backfill are not missed; they win any conflict
+    fire_at = "datetime(due_date, '-24 hours')" if sqlite else "due_date - interval '24 hours'"
+    now = "datetime('now')" if sqlite else "(now() AT TIME ZONE 'utc')"
+    op.execute(f"""
+        INSERT INTO reminders (task_id, due_date, fire_at)
+        SELECT id, due_date, {fire_at} FROM tasks
+        WHERE {ELIGIBLE} AND due_date > {now}
+        ON CONFLICT (task_id) DO NOTHING
+    """)
+
+    op.drop_index("ix_tasks_due_date_open", table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_tasks_due_date_open", "tasks", ["due_date"],
+        postgresql_where=sa.text("status <> 2"),
+        sqlite_where=sa.text("status <> 2"),
+    )
+
+    if op.get_bind().dialect.name == "sqlite":
+        for operation in ("insert", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS tasks_reminders_{operation}")
+    else:
+        for operation in ("insert", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS tasks_reminders_{operation} ON tasks")
+            op.execute(f"DROP FUNCTION IF EXISTS reminders_{operation}()")
+    op.drop_index("ix_reminders_fire_at", table_name="reminders")
+    op.drop_table("reminders")
@@ -0,0 +1,39 @@
+"""reminder delivery ledger
+
+reminder_deliveries records every reminder sent under the primary key
+(task_id, due_date, kind), so the reminder job can claim a whole batch with
+one INSERT ... ON CONFLICT DO NOTHING and skip the reminders it already
+delivered, e.g. to a task reopened or restored with the same due date.
+ix_reminder_deliveries_due_date lets the job prune entries whose due date
+has passed. Nothing is backfilled: earlier deliveries were not recorded.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminder_deliveries",
+        sa.Column(
+            "task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("due_date", sa.DateTime(), primary_key=True),
+        sa.Column("kind", sa.SmallInteger(), primary_key=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_reminder_deliveries_due_date", "reminder_deliveries", ["due_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminder_deliveries_due_date", table_name="reminder_deliveries")
+    op.drop_table("reminder_deliveries")
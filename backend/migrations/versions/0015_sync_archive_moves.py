@@ -0,0 +1,115 @@
+"""sync log ignores archive moves
+
+Archiving deletes tasks, checklists and checklist items from the live tables
+after copying them into the archive tables, and the 0012 delete triggers
+turned that into sync tombstones. The delete triggers of those three tables
+now skip rows whose id is already in the matching archive table, so clients
+keep archived entities. Task list deletes are unchanged.
+
+On Postgres the shared sync_changes_delete(code) function is replaced by one
+delete function per table. SQLite re-creates the three delete triggers with a
+WHEN condition.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+# (table, SyncEntity code, archive table or None)
+TABLES = [
+    ("tasks", 0, "archived_tasks"),
+    ("task_lists", 1, None),
+    ("checklists", 2, "archived_checklists"),
+    ("checklist_items", 3, "archived_checklist_items"),
+]
+
+
+def _not_archived(archive, row_id: str, keyword: str) -> str:
+    return f" {keyword} NOT EXISTS (SELECT 1 FROM {archive} a WHERE a.id = {row_id})" if archive else ""
+
+
+def _postgres_delete_function(table: str, code: int, archive) -> str:
+    return f"""
+    CREATE OR REPLACE FUNCTION {table}_sync_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM sync_lock_users(ARRAY(
+            SELECT s.user_id FROM sync_changes s JOIN old_rows o ON s.entity_id = o.id
+            WHERE s.entity_type = {code}
+        ));
+        UPDATE sync_changes s SET change_seq = nextval('sync_change_seq'), deleted = true
+        FROM old_rows o
+        WHERE s.entity_type = {code} AND s.entity_id = o.id{_not_archived(archive, "o.id", "AND")};
+        RETURN NULL;
+    END
+    $$
+    """
+
+
+# The 0012 function, restored on downgrade
+POSTGRES_SHARED_DELETE = """
+    CREATE OR REPLACE FUNCTION sync_changes_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM sync_lock_users(ARRAY(
+            SELECT s.user_id FROM sync_changes s JOIN old_rows o ON s.entity_id = o.id
+            WHERE s.entity_type = TG_ARGV[0]::smallint
+        ));
+        UPDATE sync_changes s SET change_seq = nextval('sync_change_seq'), deleted = true
+        FROM old_rows o
+        WHERE s.entity_type = TG_ARGV[0]::smallint AND s.entity_id = o.id;
+        RETURN NULL;
+    END
+    $$
+"""
+
+
+def _postgres_delete_trigger(table: str, function: str) -> str:
+    return f"""
+    CREATE TRIGGER {table}_sync_delete AFTER DELETE ON {table}
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION {function}
+    """
+
+
+def _sqlite_delete_trigger(table: str, code: int, archive) -> str:
+    return f"""
+    CREATE TRIGGER {table}_sync_delete AFTER DELETE ON {table}{_not_archived(archive, "OLD.id", "WHEN")}
+    BEGIN
+        UPDATE sync_sequence SET value = value + 1;
+        UPDATE sync_changes SET change_seq = (SELECT value FROM sync_sequence), deleted = 1
+        WHERE entity_type = {code} AND entity_id = OLD.id;
+    END
+    """
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for table, code, archive in TABLES:
+            if archive:
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_delete")
+                op.execute(_sqlite_delete_trigger(table, code, archive))
+    else:
+        for table, code, archive in TABLES:
+            op.execute(_postgres_delete_function(table, code, archive))
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_delete ON {table}")
+            op.execute(_postgres_delete_trigger(table, f"{table}_sync_delete()"))
+        op.execute("DROP FUNCTION IF EXISTS sync_changes_delete()")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for table, code, archive in TABLES:
+            if archive:
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_delete")
+                op.execute(_sqlite_delete_trigger(table, code, None))
+    else:
+        op.execute(POSTGRES_SHARED_DELETE)
+        for table, code, _ in TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_delete ON {table}")
+            op.execute(_postgres_delete_trigger(table, f"sync_changes_delete('{code}')"))
+            op.execute(f"DROP FUNCTION IF EXISTS {table}_sync_delete()")
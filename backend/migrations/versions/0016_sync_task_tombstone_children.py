@@ -0,0 +1,107 @@
+"""sync log follows task tombstones to checklists and items
+
+Tombstoning a task hides its checklists and checklist items and restoring it
+brings them back, but neither wrote their sync log rows, so /sync kept sending
+them as live. tasks_sync_tombstone re-logs a task's children whenever its
+deleted_at is set or cleared; the reader reports children of a tombstoned
+task as tombstones. Children of tasks already tombstoned are re-logged once
+here so clients that synced them learn they are gone.
+
+Postgres gets a statement-level trigger that bumps the children's
+sync_changes rows. On SQLite a no-op update of the children fires their own
+0012 sync triggers.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17 00:00:00
+"""
+from alembic import op
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+POSTGRES_UPGRADE = [
+    """
+    CREATE OR REPLACE FUNCTION tasks_sync_tombstone() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM sync_lock_users(ARRAY(
+            SELECT n.user_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE (n.deleted_at IS NULL) <> (o.deleted_at IS NULL)
+        ));
+        WITH flipped AS (
+            SELECT n.id FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE (n.deleted_at IS NULL) <> (o.deleted_at IS NULL)
+        ), children AS (
+            SELECT 2 AS entity_type, c.id AS entity_id FROM flipped f JOIN checklists c ON c.task_id = f.id
+            UNION ALL
+            SELECT 3, i.id FROM flipped f JOIN checklists c ON c.task_id = f.id
+            JOIN checklist_items i ON i.checklist_id = c.id
+        )
+        UPDATE sync_changes s SET change_seq = nextval('sync_change_seq')
+        FROM children
+        WHERE s.entity_type = children.entity_type AND s.entity_id = children.entity_id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_sync_tombstone AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_sync_tombstone()
+    """,
+    """
+    UPDATE sync_changes s SET change_seq = nextval('sync_change_seq')
+    FROM (
+        SELECT 2 AS entity_type, c.id AS entity_id
+        FROM tasks t JOIN checklists c ON c.task_id = t.id WHERE t.deleted_at IS NOT NULL
+        UNION ALL
+        SELECT 3, i.id
+        FROM tasks t JOIN checklists c ON c.task_id = t.id JOIN checklist_items i ON i.checklist_id = c.id
+        WHERE t.deleted_at IS NOT NULL
+    ) children
+    WHERE s.entity_type = children.entity_type AND s.entity_id = children.entity_id
+    """,
+]
+
+SQLITE_UPGRADE = [
+    """
+    CREATE TRIGGER tasks_sync_tombstone AFTER UPDATE OF deleted_at ON tasks
+    WHEN (OLD.deleted_at IS NULL) <> (NEW.deleted_at IS NULL)
+    BEGIN
+        UPDATE checklists SET title = title WHERE task_id = NEW.id;
+        UPDATE checklist_items SET position = position
+        WHERE checklist_id IN (SELECT id FROM checklists WHERE task_id = NEW.id);
+    END
+    """,
+    "UPDATE checklists SET title = title WHERE task_id IN (SELECT id FROM tasks WHERE deleted_at IS NOT NULL)",
+    """
+    UPDATE checklist_items SET position = position
+    WHERE checklist_id IN (
+        SELECT c.id FROM checklists c JOIN tasks t ON t.id = c.task_id WHERE t.deleted_at IS NOT NULL
+    )
+    """,
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_sync_tombstone ON tasks",
+    "DROP FUNCTION IF EXISTS tasks_sync_tombstone()",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_sync_tombstone",
+]
+
+
+def _run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    _run({"postgresql": POSTGRES_UPGRADE, "sqlite": SQLITE_UPGRADE})
+
+
+def downgrade() -> None:
+    _run({"postgresql": POSTGRES_DOWNGRADE, "sqlite": SQLITE_DOWNGRADE})
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, ConfigDict
+from typing import ClassVar, List
+from datetime import datetime
+from uuid import UUID
+from backend.src.domain.entities.models import SyncEntity
+from backend.src.application.dtos.token_dtos import OpaqueTokenDTO
+from backend.src.application.dtos.task_dtos import TaskCoreDTO, ChecklistItemResponseDTO
+from backend.src.application.dtos.task_list_dtos import TaskListResponseDTO
+
+class SyncTokenDTO(OpaqueTokenDTO):
+    """How far a client has synced: the last change sequence number it has seen."""
+    invalid_message: ClassVar[str] = "Invalid sync token"
+
+    change_seq: int
+
+class SyncTombstoneDTO(BaseModel):
+    entity: SyncEntity
+    id: UUID
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SyncChecklistDTO(BaseModel):
+    """Checklist fields without the items, which sync reports on their own."""
+    id: UUID
+    task_id: UUID
+    title: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SyncResponseDTO(BaseModel):
+    """
+    Everything created, updated or deleted since the client's token. Pass next_token on the
+    next sync; while has_more is set there are further changes to fetch right away.
+    """
+    tasks: List[TaskCoreDTO]
+    task_lists: List[TaskListResponseDTO]
+    checklists: List[SyncChecklistDTO]
+    checklist_items: List[ChecklistItemResponseDTO]
+    deleted: List[SyncTombstoneDTO]
+    next_token: str
+    has_more: bool
@@ -1,8 +1,10 @@
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
-from typing import Optional, List, Any, Union
+from typing import ClassVar, Optional, List, Any, Dict, Literal, Union
 from datetime import datetime
 from uuid import UUID
-from backend.src.domain.entities.models import TaskStatus, TaskPriority
+from backend.src.config import settings
+from backend.src.domain.entities.models import TaskStatus, TaskPriority, TaskSort
+from backend.src.application.dtos.token_dtos import OpaqueTokenDTO
 
 class AttachmentDTO(BaseModel):
     id: UUID
@@ -61,7 +63,32 @@ class TaskUpdateDTO(BaseModel):
     due_date: Optional[datetime] = None
     tags: Optional[List[str]] = None
 
-class TaskResponseDTO(BaseModel):
+class TaskPatchDTO(BaseModel):
+    """
+    JSON merge patch (RFC 7386) for a task: absent fields are left unchanged,
+    null clears a nullable field.
+    """
+    task_list_id: Optional[UUID] = None
+    title: Optional[str] = Field(None, min_length=1, max_length=200)
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    due_date: Optional[datetime] = None
+    tags: Optional[List[str]] = None
+
+    @model_validator(mode='after')
+    def reject_null_for_required_fields(self) -> "TaskPatchDTO":
+        for field in ('title', 'status', 'priority', 'tags'):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+    def changes(self) -> dict:
+        """The fields the client sent, including explicit nulls."""
+        return self.model_dump(exclude_unset=True)
+
+class TaskCoreDTO(BaseModel):
+    """Task scalar fields without the child collections."""
     id: UUID
     user_id: UUID
     task_list_id: Optional[UUID]
@@ -73,8 +100,7 @@ class TaskResponseDTO(BaseModel):
     tags: List[str]
     created_at: datetime
     updated_at: datetime
-    attachments: List[AttachmentDTO]
-    checklists: List[ChecklistResponseDTO]
+    archived_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
     
@@ -89,4 +115,239 @@ class TaskResponseDTO(BaseModel):
         # Fallback: try to get value attribute
         if hasattr(v, 'value'):
             return v.value
-        return str(v)
\ No newline at end of file
+        return str(v)
+
+class TaskResponseDTO(TaskCoreDTO):
+    attachments: List[AttachmentDTO]
+    checklists: List[ChecklistResponseDTO]
+
+class TaskSummaryDTO(BaseModel):
+    id: UUID
+    task_list_id: Optional[UUID]
+    title: str
+    status: str
+    priority: str
+    due_date: Optional[datetime]
+    attachment_count: int
+    checklist_item_count: int
+    completed_item_count: int
+    created_at: datetime
+    updated_at: datetime
+    archived_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('status', 'priority', mode='before')
+    @classmethod
+    def convert_enum_to_string(cls, v: Any) -> str:
+        """Convert enum values to strings"""
+        if hasattr(v, 'value'):
+            return v.value
+        return str(v)
+
+class TaskBatchCreateDTO(BaseModel):
+    """
+    Items are kept as raw objects and validated one by one against TaskCreateDTO,
+    so a bad item is reported in its result instead of rejecting the whole batch.
+    """
+    tasks: List[Dict[str, Any]] = Field(..., min_length=1, max_length=settings.TASK_BATCH_MAX_SIZE)
+
+class TaskBatchItemResultDTO(BaseModel):
+    index: int
+    status: int
+    task: Optional[TaskCoreDTO] = None
+    error: Optional[str] = None
+
+class TaskBatchResultDTO(BaseModel):
+    created: int
+    failed: int
+    results: List[TaskBatchItemResultDTO]
+
+class TaskFilterDTO(BaseModel):
+    """The task listing filters, as a request body."""
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    task_list_id: Optional[UUID] = None
+    tags: Optional[List[str]] = None
+    tag_match: Literal["any", "all"] = "any"
+    search: Optional[str] = None
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    def to_filters(self) -> dict:
+        return self.model_dump(exclude_none=True)
+
+class TaskSelectionDTO(BaseModel):
+    """Selects the caller's tasks either by explicit IDs or by a filter, never both."""
+    ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=settings.TASK_BATCH_MAX_SIZE)
+    filter: Optional[TaskFilterDTO] = None
+
+    @model_validator(mode='after')
+    def require_one_selector(self) -> "TaskSelectionDTO":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        if self.filter is not None and not (self.filter.to_filters().keys() - {"tag_match"}):
+            raise ValueError("filter must set at least one criterion")
+        return self
+
+    def to_filters(self) -> dict:
+        if self.ids is not None:
+            return {"task_ids": self.ids}
+        return self.filter.to_filters()
+
+class TaskBulkChangesDTO(BaseModel):
+    """Merge patch applied to every selected task; null clears task_list_id."""
+    task_list_id: Optional[UUID] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    tags: Optional[List[str]] = None
+
+    @model_validator(mode='after')
+    def validate_changes(self) -> "TaskBulkChangesDTO":
+        if not self.model_fields_set:
+            raise ValueError("No changes given")
+        for field in ('status', 'priority', 'tags'):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+    def changes(self) -> dict:
+        return self.model_dump(exclude_unset=True)
+
+class TaskBulkUpdateDTO(TaskSelectionDTO):
+    changes: TaskBulkChangesDTO
+
+class TaskBulkResultDTO(BaseModel):
+    count: int
+    ids: List[UUID]
+
+class TaskStatsDTO(BaseModel):
+    total: int
+    by_status: Dict[TaskStatus, int]
+    by_priority: Dict[TaskPriority, int]
+    overdue: int
+    due_this_week: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class TagCountDTO(BaseModel):
+    name: str
+    count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class TagRenameDTO(BaseModel):
+    old_name: str = Field(..., min_length=1)
+    new_name: str = Field(..., min_length=1)
+
+class TagMergeDTO(BaseModel):
+    sources: List[str] = Field(..., min_length=1)
+    target: str = Field(..., min_length=1)
+
+class TagOperationResultDTO(BaseModel):
+    updated: int
+
+class TaskExportItemDTO(BaseModel):
+    """A checklist item flattened together with its checklist."""
+    checklist_id: UUID
+    checklist_title: str
+    id: UUID
+    content: str
+    is_completed: bool
+    position: int
+
+class TaskExportDTO(TaskCoreDTO):
+    """An exported task; checklist_items is only set when the export asked for them."""
+    checklist_items: Optional[List[TaskExportItemDTO]] = None
+
+    @classmethod
+    def from_task(cls, task: Any, with_checklist_items: bool) -> "TaskExportDTO":
+        dto = cls.model_validate(task)
+        if with_checklist_items:
+            dto.checklist_items = [
+                TaskExportItemDTO(
+                    checklist_id=checklist.id,
+                    checklist_title=checklist.title,
+                    id=item.id,
+                    content=item.content,
+                    is_completed=item.is_completed,
+                    position=item.position,
+                )
+                for checklist in task.checklists
+                for item in checklist.items
+            ]
+        return dto
+
+class TaskImportItemDTO(BaseModel):
+    """A checklist item of an imported task; items sharing a checklist_title form one checklist."""
+    checklist_title: str = Field("Checklist", min_length=1, max_length=100)
+    content: str = Field(..., min_length=1, max_length=500)
+    is_completed: bool = False
+    position: Optional[int] = None
+
+class TaskImportRowDTO(TaskCreateDTO):
+    """
+    One imported task: the TaskCreateDTO fields plus what a migration carries over,
+    its status, a task list by name (created when the user has none by that name)
+    and its checklist items. Other fields, such as those an export adds, are ignored.
+    """
+    status: TaskStatus = TaskStatus.TODO
+    task_list: Optional[str] = Field(None, min_length=1, max_length=100)
+    checklist_items: List[TaskImportItemDTO] = []
+
+    @model_validator(mode='after')
+    def check_task_list(self) -> "TaskImportRowDTO":
+        if self.task_list is not None and self.task_list_id is not None:
+            raise ValueError("Give task_list or task_list_id, not both")
+        return self
+
+class TaskImportErrorDTO(BaseModel):
+    row: int
+    error: str
+
+class TaskImportResultDTO(BaseModel):
+    """
+    Outcome of an import. Rows are numbered from 1: NDJSON lines, or CSV records after
+    the header. At most TASK_IMPORT_MAX_ERRORS errors are listed; `failed` counts them all.
+    """
+    imported: int = 0
+    failed: int = 0
+    errors: List[TaskImportErrorDTO] = []
+
+# Task fields making up each sort's keyset, ahead of the id tiebreaker
+CURSOR_KEYS = {
+    TaskSort.NEWEST: ("created_at",),
+    TaskSort.DUE_DATE: ("due_date",),
+    TaskSort.PRIORITY: ("priority", "created_at"),
+    TaskSort.RECENTLY_UPDATED: ("updated_at",),
+}
+
+class TaskCursorDTO(OpaqueTokenDTO):
+    """Keyset position in a task listing: the sort it belongs to, that sort's key values and the id."""
+    invalid_message: ClassVar[str] = "Invalid cursor"
+
+    sort: TaskSort = TaskSort.NEWEST
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    priority: Optional[TaskPriority] = None
+    id: UUID
+
+    @model_validator(mode="after")
+    def check_sort_keys(self) -> "TaskCursorDTO":
+        # due_date is the only key that may legitimately be null
+        if any(getattr(self, key) is None for key in CURSOR_KEYS[self.sort] if key != "due_date"):
+            raise ValueError("Cursor is missing its sort key")
+        return self
+
+    @classmethod
+    def after(cls, task: Any, sort: TaskSort) -> "TaskCursorDTO":
+        """The cursor positioned just past `task` in `sort` order."""
+        return cls(sort=sort, id=task.id, **{key: getattr(task, key) for key in CURSOR_KEYS[sort]})
+
+    def keyset(self) -> tuple:
+        """The sort key values followed by the id, as the repository seeks on them."""
+        return tuple(getattr(self, key) for key in CURSOR_KEYS[self.sort]) + (self.id,)
+
+    def token_fields(self) -> set:
+        return {"sort", "id", *CURSOR_KEYS[self.sort]}
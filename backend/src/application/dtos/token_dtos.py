@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ValidationError
+from typing import ClassVar, Optional, Set, Type, TypeVar
+import base64
+import binascii
+
+TokenT = TypeVar("TokenT", bound="OpaqueTokenDTO")
+
+class OpaqueTokenDTO(BaseModel):
+    """
+    Base for state handed to clients as an opaque URL-safe token (unpadded base64 of the
+    JSON), so clients never depend on its contents.
+    """
+    invalid_message: ClassVar[str] = "Invalid token"
+
+    def token_fields(self) -> Optional[Set[str]]:
+        """The fields written into the token; all of them by default."""
+        return None
+
+    def encode(self) -> str:
+        payload = self.model_dump_json(include=self.token_fields())
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls: Type[TokenT], token: str) -> TokenT:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            return cls.model_validate_json(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, ValueError, ValidationError) as exc:
+            raise ValueError(cls.invalid_message) from exc
@@ -1,13 +1,20 @@
 from typing import Optional
 from uuid import UUID
 from backend.src.domain.entities.models import Checklist, ChecklistItem, Task
-from backend.src.domain.ports.repositories.base import IChecklistRepository, ITaskRepository
+from backend.src.domain.ports.repositories.base import IChecklistRepository, ITaskRepository, IUnitOfWork
 from backend.src.application.dtos.task_dtos import ChecklistCreateDTO, ChecklistItemCreateDTO, ChecklistItemUpdateDTO
+from backend.src.application.use_cases.read_only import read_only
 
 class ChecklistUseCase:
-    def __init__(self, checklist_repo: IChecklistRepository, task_repo: ITaskRepository):
+    def __init__(
+        self,
+        checklist_repo: IChecklistRepository,
+        task_repo: ITaskRepository,
+        uow: Optional[IUnitOfWork] = None
+    ):
         self.checklist_repo = checklist_repo
         self.task_repo = task_repo
+        self.uow = uow
 
     async def create_checklist(self, task_id: UUID, user_id: UUID, dto: ChecklistCreateDTO) -> Optional[Checklist]:
         task = await self.task_repo.get_by_id(task_id)
@@ -78,6 +85,7 @@ class ChecklistUseCase:
             
         return await self.checklist_repo.delete_item(item_id)
     
+    @read_only
     async def get_checklist(self, checklist_id: UUID, user_id: UUID) -> Optional[Checklist]:
         checklist = await self.checklist_repo.get_checklist_by_id(checklist_id)
         if not checklist:
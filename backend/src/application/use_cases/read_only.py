@@ -0,0 +1,20 @@
+import functools
+import inspect
+
+
+def read_only(method):
+    """
+    Marks a use-case method that only reads. The call runs through the use case's
+    unit of work, which may serve it from a read replica. The method must take `user_id`.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        uow = getattr(self, "uow", None)
+        if uow is None:
+            return await method(self, *args, **kwargs)
+        user_id = signature.bind(self, *args, **kwargs).arguments["user_id"]
+        return await uow.read(user_id, lambda: method(self, *args, **kwargs))
+
+    return wrapper
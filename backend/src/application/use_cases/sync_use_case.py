@@ -0,0 +1,21 @@
+from typing import Optional, Tuple
+from uuid import UUID
+from backend.src.domain.entities.models import SyncChanges
+from backend.src.domain.ports.repositories.base import ISyncRepository, IUnitOfWork
+from backend.src.application.dtos.sync_dtos import SyncTokenDTO
+from backend.src.application.use_cases.read_only import read_only
+
+class SyncUseCase:
+    def __init__(self, sync_repo: ISyncRepository, uow: Optional[IUnitOfWork] = None):
+        self.sync_repo = sync_repo
+        self.uow = uow
+
+    @read_only
+    async def get_changes(self, user_id: UUID, token: Optional[str], limit: int) -> Tuple[SyncChanges, str]:
+        """
+        The user's changes since `token`, or everything when there is none,
+        along with the token to send on the next sync.
+        """
+        since = SyncTokenDTO.decode(token).change_seq if token else 0
+        changes = await self.sync_repo.changes_since(user_id, since, limit)
+        return changes, SyncTokenDTO(change_seq=changes.last_seq).encode()
@@ -0,0 +1,76 @@
+import csv
+import io
+from typing import AsyncIterator, List, Literal, Optional
+from uuid import UUID
+from backend.src.domain.ports.repositories.base import ITaskExport
+from backend.src.application.dtos.task_dtos import TaskCoreDTO, TaskExportDTO
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Output is handed to the response in chunks of about this size rather than per row
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+CSV_TASK_COLUMNS = list(TaskCoreDTO.model_fields)
+# With checklist items a task takes one CSV row per item; these columns describe the item
+CSV_ITEM_COLUMNS = ["checklist_id", "checklist_title", "item_id", "item_content", "item_is_completed", "item_position"]
+
+def _csv_value(value) -> str:
+    """A JSON-mode value as a CSV cell: empty for null, tags comma-separated, booleans as in JSON."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return ",".join(value)
+    return str(value)
+
+class TaskExportUseCase:
+    def __init__(self, task_export: ITaskExport):
+        self.task_export = task_export
+
+    async def export_tasks(
+        self,
+        user_id: UUID,
+        export_format: ExportFormat,
+        filters: Optional[dict] = None,
+        with_checklist_items: bool = False,
+        include_archived: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        The user's tasks serialized as NDJSON (one task per line) or CSV, produced
+        incrementally as the tasks stream in, so the whole export is never held in memory.
+        """
+        tasks = self.task_export.stream_by_user(user_id, filters, with_checklist_items, include_archived)
+        buffer = io.StringIO()
+        if export_format == "csv":
+            writer = csv.writer(buffer)
+            writer.writerow(CSV_TASK_COLUMNS + (CSV_ITEM_COLUMNS if with_checklist_items else []))
+        async for task in tasks:
+            dto = TaskExportDTO.from_task(task, with_checklist_items)
+            if export_format == "csv":
+                writer.writerows(self._csv_rows(dto, with_checklist_items))
+            else:
+                buffer.write(dto.model_dump_json(exclude=None if with_checklist_items else {"checklist_items"}))
+                buffer.write("\n")
+            if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _csv_rows(dto: TaskExportDTO, with_checklist_items: bool) -> List[list]:
+        values = dto.model_dump(mode="json", include=set(CSV_TASK_COLUMNS))
+        task_row = [_csv_value(values[column]) for column in CSV_TASK_COLUMNS]
+        if not with_checklist_items:
+            return [task_row]
+        if not dto.checklist_items:
+            return [task_row + [""] * len(CSV_ITEM_COLUMNS)]
+        return [
+            task_row + [
+                str(item.checklist_id), item.checklist_title, str(item.id), item.content,
+                _csv_value(item.is_completed), str(item.position),
+            ]
+            for item in dto.checklist_items
+        ]
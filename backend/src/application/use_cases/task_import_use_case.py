@@ -0,0 +1,242 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, List, Literal, NamedTuple, Optional
+from uuid import UUID
+from pydantic import ValidationError
+from backend.src.config import settings
+from backend.src.domain.entities.models import Task, TaskList, Checklist, ChecklistItem
+from backend.src.domain.ports.repositories.base import ITaskImport, ITaskListRepository, IUnitOfWork
+from backend.src.application.dtos.task_dtos import (
+    TaskImportRowDTO, TaskImportItemDTO, TaskImportErrorDTO, TaskImportResultDTO
+)
+from backend.src.application.use_cases.task_use_case import validation_message
+
+ImportFormat = Literal["ndjson", "csv"]
+
+class ImportRow(NamedTuple):
+    """A parsed input row: its number and either its fields or why it could not be parsed."""
+    row: int
+    data: Optional[dict]
+    error: Optional[str] = None
+
+# CSV columns read into the task; item_* and checklist_title describe one checklist item
+CSV_TASK_FIELDS = set(TaskImportRowDTO.model_fields) - {"checklist_items"}
+CSV_ITEM_FIELDS = {
+    "checklist_title": "checklist_title",
+    "item_content": "content",
+    "item_is_completed": "is_completed",
+    "item_position": "position",
+}
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decodes a byte stream into lines, newline kept, without holding more than one line."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                yield line + "\n"
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValueError("Import must be UTF-8 text")
+    if pending:
+        yield pending
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """One task per line, numbered by line; blank lines are skipped."""
+    number = 0
+    async for line in _lines(chunks):
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportRow(number, None, f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRow(number, None, "Expected a JSON object")
+            continue
+        yield ImportRow(number, data)
+
+def _csv_fields(cells: Dict[str, str]) -> tuple:
+    """The task fields and checklist item (if any) of one CSV record; empty cells are left out."""
+    task = {name: value for name, value in cells.items() if name in CSV_TASK_FIELDS and value != ""}
+    if "tags" in task:
+        task["tags"] = [tag.strip() for tag in task["tags"].split(",") if tag.strip()]
+    item = {field: cells[column] for column, field in CSV_ITEM_FIELDS.items() if cells.get(column)}
+    return task, item if "content" in item else None
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """
+    A header row, then one task per record. Consecutive records with the same non-empty
+    `id` (as an export writes them, one per checklist item) are one task.
+    """
+    header: Optional[List[str]] = None
+    record = ""
+    number = 0
+    current: Optional[ImportRow] = None
+    current_id = None
+    async for line in _lines(chunks):
+        record += line
+        # An odd number of quotes means a quoted field continues on the next line
+        if record.count('"') % 2:
+            continue
+        values = next(csv.reader([record]), [])
+        record = ""
+        if not any(values):
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        number += 1
+        if len(values) != len(header):
+            if current:
+                yield current
+            current, current_id = None, None
+            yield ImportRow(number, None, f"Expected {len(header)} fields, got {len(values)}")
+            continue
+        cells = dict(zip(header, values))
+        task, item = _csv_fields(cells)
+        task_id = cells.get("id")
+        if current and task_id and task_id == current_id:
+            if item:
+                current.data["checklist_items"].append(item)
+            continue
+        if current:
+            yield current
+        task["checklist_items"] = [item] if item else []
+        current, current_id = ImportRow(number, task), task_id
+    if record:
+        number += 1
+        if current:
+            yield current
+        current = None
+        yield ImportRow(number, None, "Unterminated quoted field")
+    if current:
+        yield current
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+class TaskImportUseCase:
+    def __init__(
+        self,
+        task_import: ITaskImport,
+        task_list_repo: ITaskListRepository,
+        uow: Optional[IUnitOfWork] = None
+    ):
+        self.task_import = task_import
+        self.task_list_repo = task_list_repo
+        self.uow = uow
+
+    async def import_tasks(
+        self, user_id: UUID, import_format: ImportFormat, chunks: AsyncIterator[bytes]
+    ) -> TaskImportResultDTO:
+        """
+        Parses the input as it arrives and loads it TASK_IMPORT_CHUNK_SIZE rows at a time,
+        committing each chunk. Rows that fail to parse or validate are reported and skipped;
+        when the database rejects a chunk, each of its rows is reported with that error.
+        """
+        result = TaskImportResultDTO()
+        task_lists: Optional[Dict[str, UUID]] = None
+        chunk: List[ImportRow] = []
+        async for row in PARSERS[import_format](chunks):
+            chunk.append(row)
+            if len(chunk) >= settings.TASK_IMPORT_CHUNK_SIZE:
+                task_lists = await self._import_chunk(user_id, chunk, task_lists, result)
+                chunk = []
+        if chunk:
+            await self._import_chunk(user_id, chunk, task_lists, result)
+        return result
+
+    @staticmethod
+    def _fail(result: TaskImportResultDTO, row: int, error: str) -> None:
+        result.failed += 1
+        if len(result.errors) < settings.TASK_IMPORT_MAX_ERRORS:
+            result.errors.append(TaskImportErrorDTO(row=row, error=error))
+
+    async def _import_chunk(
+        self,
+        user_id: UUID,
+        chunk: List[ImportRow],
+        task_lists: Optional[Dict[str, UUID]],
+        result: TaskImportResultDTO
+    ) -> Optional[Dict[str, UUID]]:
+        """Validates and loads one chunk; returns the user's task lists by name once they were needed."""
+        valid: List[tuple] = []
+        for row in chunk:
+            if row.error:
+                self._fail(result, row.row, row.error)
+                continue
+            try:
+                valid.append((row.row, TaskImportRowDTO.model_validate(row.data)))
+            except ValidationError as e:
+                self._fail(result, row.row, validation_message(e))
+
+        # One ownership lookup per chunk for lists given by id
+        task_list_ids = list({dto.task_list_id for _, dto in valid if dto.task_list_id})
+        owned = await self.task_list_repo.get_owned_ids(user_id, task_list_ids) if task_list_ids else set()
+
+        tasks: List[Task] = []
+        task_rows: List[int] = []
+        checklists: List[Checklist] = []
+        items: List[ChecklistItem] = []
+        for row, dto in valid:
+            if dto.task_list_id and dto.task_list_id not in owned:
+                self._fail(result, row, "Invalid task list ID")
+                continue
+            task_list_id = dto.task_list_id
+            if dto.task_list:
+                if task_lists is None:
+                    task_lists = {}
+                    for task_list in await self.task_list_repo.list_by_user(user_id):
+                        task_lists.setdefault(task_list.name, task_list.id)
+                if dto.task_list not in task_lists:
+                    created = await self.task_list_repo.create(TaskList(user_id=user_id, name=dto.task_list))
+                    task_lists[dto.task_list] = created.id
+                task_list_id = task_lists[dto.task_list]
+
+            task = Task(
+                user_id=user_id,
+                task_list_id=task_list_id,
+                title=dto.title,
+                description=dto.description,
+                status=dto.status,
+                priority=dto.priority,
+                due_date=dto.due_date,
+                tags=dto.tags
+            )
+            tasks.append(task)
+            task_rows.append(row)
+            self._add_checklists(task, dto.checklist_items, checklists, items)
+
+        if tasks:
+            try:
+                await self.task_import.load(tasks, checklists, items)
+                result.imported += len(tasks)
+            except ValueError as e:
+                for row in task_rows:
+                    self._fail(result, row, str(e))
+        # Earlier chunks stay imported whatever happens to later ones
+        if self.uow:
+            await self.uow.commit()
+        return task_lists
+
+    @staticmethod
+    def _add_checklists(
+        task: Task, entries: List[TaskImportItemDTO], checklists: List[Checklist], items: List[ChecklistItem]
+    ) -> None:
+        by_title: Dict[str, Checklist] = {}
+        for entry in entries:
+            checklist = by_title.get(entry.checklist_title)
+            if checklist is None:
+                checklist = by_title[entry.checklist_title] = Checklist(task_id=task.id, title=entry.checklist_title)
+                checklists.append(checklist)
+            position = entry.position if entry.position is not None else len(checklist.items)
+            item = ChecklistItem(
+                checklist_id=checklist.id, content=entry.content, is_completed=entry.is_completed, position=position
+            )
+            checklist.items.append(item)
+            items.append(item)
@@ -1,12 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 from backend.src.domain.entities.models import TaskList
-from backend.src.domain.ports.repositories.base import ITaskListRepository
+from backend.src.domain.ports.repositories.base import ITaskListRepository, IUnitOfWork
 from backend.src.application.dtos.task_list_dtos import TaskListCreateDTO, TaskListUpdateDTO
+from backend.src.application.use_cases.read_only import read_only
 
 class TaskListUseCase:
-    def __init__(self, task_list_repo: ITaskListRepository):
+    def __init__(self, task_list_repo: ITaskListRepository, uow: Optional[IUnitOfWork] = None):
         self.task_list_repo = task_list_repo
+        self.uow = uow
 
     async def create_task_list(self, user_id: UUID, dto: TaskListCreateDTO) -> TaskList:
         task_list = TaskList(
@@ -15,17 +17,22 @@ class TaskListUseCase:
         )
         return await self.task_list_repo.create(task_list)
 
+    @read_only
     async def get_user_task_lists(self, user_id: UUID) -> List[TaskList]:
         return await self.task_list_repo.list_by_user(user_id)
 
+    @read_only
     async def get_task_list(self, task_list_id: UUID, user_id: UUID) -> Optional[TaskList]:
+        return await self._get_owned_task_list(task_list_id, user_id)
+
+    async def _get_owned_task_list(self, task_list_id: UUID, user_id: UUID) -> Optional[TaskList]:
         task_list = await self.task_list_repo.get_by_id(task_list_id)
         if task_list and task_list.user_id == user_id:
             return task_list
         return None
 
     async def update_task_list(self, task_list_id: UUID, user_id: UUID, dto: TaskListUpdateDTO) -> Optional[TaskList]:
-        task_list = await self.get_task_list(task_list_id, user_id)
+        task_list = await self._get_owned_task_list(task_list_id, user_id)
         if not task_list:
             return None
         
@@ -35,7 +42,7 @@ class TaskListUseCase:
         return await self.task_list_repo.update(task_list)
 
     async def delete_task_list(self, task_list_id: UUID, user_id: UUID) -> bool:
-        task_list = await self.get_task_list(task_list_id, user_id)
+        task_list = await self._get_owned_task_list(task_list_id, user_id)
         if not task_list:
             return False
         return await self.task_list_repo.delete(task_list_id)
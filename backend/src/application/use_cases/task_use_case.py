@@ -1,20 +1,31 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
-from backend.src.domain.entities.models import Task
-from backend.src.domain.ports.repositories.base import ITaskRepository, IFileStorage, ITaskListRepository
-from backend.src.application.dtos.task_dtos import TaskCreateDTO, TaskUpdateDTO, TaskResponseDTO
+from backend.src.domain.entities.models import Task, TaskSort, TaskSummary, TagCount, TaskStats
+from backend.src.domain.ports.repositories.base import (
+    ITaskRepository, IFileStorage, ITaskListRepository, ITaskSearch, IUnitOfWork
+)
+from pydantic import ValidationError
+from backend.src.application.dtos.task_dtos import (
+    TaskCreateDTO, TaskUpdateDTO, TaskPatchDTO, TaskResponseDTO, TaskCursorDTO, TaskCoreDTO,
+    TaskBatchItemResultDTO, TaskBatchResultDTO, TaskBulkUpdateDTO, TaskSelectionDTO
+)
 from backend.src.domain.entities.models import Attachment
+from backend.src.application.use_cases.read_only import read_only
 
 class TaskUseCase:
     def __init__(
         self, 
         task_repo: ITaskRepository, 
         file_storage: IFileStorage,
-        task_list_repo: Optional[ITaskListRepository] = None
+        task_list_repo: Optional[ITaskListRepository] = None,
+        task_search: Optional[ITaskSearch] = None,
+        uow: Optional[IUnitOfWork] = None
     ):
         self.task_repo = task_repo
         self.file_storage = file_storage
         self.task_list_repo = task_list_repo
+        self.task_search = task_search
+        self.uow = uow
 
     async def create_task(self, user_id: UUID, dto: TaskCreateDTO) -> Task:
         # Verify task_list ownership if provided
@@ -23,7 +34,42 @@ class TaskUseCase:
             if not task_list or task_list.user_id != user_id:
                 raise ValueError("Invalid task list ID")
 
-        task = Task(
+        return await self.task_repo.create(self._new_task(user_id, dto))
+
+    async def create_tasks_batch(self, user_id: UUID, items: List[dict]) -> TaskBatchResultDTO:
+        """
+        Validates each item on its own and inserts every valid one in a single
+        multi-row insert. Results keep the input order; failed items carry an error.
+        """
+        results: List[Optional[TaskBatchItemResultDTO]] = [None] * len(items)
+        valid: List[Tuple[int, TaskCreateDTO]] = []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, TaskCreateDTO.model_validate(item)))
+            except ValidationError as e:
+                results[index] = TaskBatchItemResultDTO(index=index, status=422, error=validation_message(e))
+
+        # One ownership lookup covering every distinct task list in the batch
+        task_list_ids = list({dto.task_list_id for _, dto in valid if dto.task_list_id})
+        owned = set(task_list_ids)
+        if task_list_ids and self.task_list_repo:
+            owned = await self.task_list_repo.get_owned_ids(user_id, task_list_ids)
+
+        pending: List[Tuple[int, Task]] = []
+        for index, dto in valid:
+            if dto.task_list_id and dto.task_list_id not in owned:
+                results[index] = TaskBatchItemResultDTO(index=index, status=400, error="Invalid task list ID")
+            else:
+                pending.append((index, self._new_task(user_id, dto)))
+
+        created = await self.task_repo.create_many([task for _, task in pending])
+        for (index, _), task in zip(pending, created):
+            results[index] = TaskBatchItemResultDTO(index=index, status=201, task=TaskCoreDTO.model_validate(task))
+        return TaskBatchResultDTO(created=len(created), failed=len(items) - len(created), results=results)
+
+    @staticmethod
+    def _new_task(user_id: UUID, dto: TaskCreateDTO) -> Task:
+        return Task(
             user_id=user_id,
             task_list_id=dto.task_list_id,
             title=dto.title,
@@ -32,8 +78,8 @@ class TaskUseCase:
             due_date=dto.due_date,
             tags=dto.tags
         )
-        return await self.task_repo.create(task)
 
+    @read_only
     async def get_user_tasks(
         self, 
         user_id: UUID, 
@@ -43,14 +89,133 @@ class TaskUseCase:
     ) -> List[Task]:
         return await self.task_repo.list_by_user(user_id, filters, limit, offset)
 
+    @read_only
+    async def get_user_tasks_page(
+        self,
+        user_id: UUID,
+        filters: dict,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+        sort: Optional[TaskSort] = None,
+        include_archived: bool = False
+    ) -> Tuple[Union[List[Task], List[TaskSummary]], Optional[str]]:
+        """
+        Returns a page of tasks plus the cursor for the next page (None on the last page).
+        A cursor takes precedence over offset; raises ValueError if it cannot be decoded
+        or was issued for a different sort. Tasks come newest first unless `sort` says otherwise.
+        With `summary`, returns lightweight TaskSummary rows instead of full aggregates.
+        With `include_archived`, archived tasks are listed alongside live ones.
+        A search filter is answered by the search index in relevance order, paged by offset only;
+        the index covers live tasks only.
+        """
+        if filters.get("search") and self.task_search:
+            if include_archived:
+                raise ValueError("Search does not cover archived tasks")
+            if cursor:
+                raise ValueError("Cursor pagination is not supported with search; use offset")
+            if sort:
+                raise ValueError("Search results are ordered by relevance and cannot be sorted")
+            return await self._search_tasks_page(user_id, filters, limit, offset, summary), None
+
+        sort = sort or TaskSort.NEWEST
+        after = None
+        if cursor:
+            position = TaskCursorDTO.decode(cursor)
+            if position.sort != sort:
+                raise ValueError("Cursor was issued for a different sort")
+            after = position.keyset()
+            offset = 0
+
+        listing = self.task_repo.list_summaries_by_user if summary else self.task_repo.list_by_user
+        tasks = await listing(
+            user_id, filters, limit, offset, sort=sort, after=after, include_archived=include_archived
+        )
+
+        next_cursor = None
+        if tasks and len(tasks) == limit:
+            next_cursor = TaskCursorDTO.after(tasks[-1], sort).encode()
+        return tasks, next_cursor
+
+    async def _search_tasks_page(
+        self,
+        user_id: UUID,
+        filters: dict,
+        limit: int,
+        offset: int,
+        summary: bool
+    ) -> Union[List[Task], List[TaskSummary]]:
+        ranked_ids = await self.task_search.search(user_id, filters["search"], filters, limit, offset)
+        if not ranked_ids:
+            return []
+
+        page_filters = {"task_ids": ranked_ids}
+        if summary:
+            tasks = await self.task_repo.list_summaries_by_user(user_id, page_filters, len(ranked_ids))
+        else:
+            tasks = await self.task_repo.list_by_user(user_id, page_filters, len(ranked_ids))
+        rank = {task_id: position for position, task_id in enumerate(ranked_ids)}
+        return sorted(tasks, key=lambda task: rank[task.id])
+
+    @read_only
+    async def count_user_tasks(
+        self, user_id: UUID, filters: dict, cap: int, include_archived: bool = False
+    ) -> Tuple[int, bool]:
+        """
+        Returns (total, exact) for a listing with `filters`. Status and priority filters are
+        read from the maintained task counters; other filters, search and archived tasks
+        included, stop counting past `cap` and return (cap, False).
+        """
+        if filters.get("search") and self.task_search:
+            return await self.task_search.count(user_id, filters["search"], filters, cap)
+        return await self.task_repo.count_by_user(user_id, filters, cap, include_archived=include_archived)
+
+    @read_only
+    async def get_task_stats(self, user_id: UUID) -> TaskStats:
+        return await self.task_repo.get_stats(user_id)
+
+    @read_only
+    async def get_tag_counts(self, user_id: UUID) -> List[TagCount]:
+        return await self.task_repo.count_tags_by_user(user_id)
+
+    async def rename_tag(self, user_id: UUID, old_name: str, new_name: str) -> int:
+        return await self.merge_tags(user_id, [old_name], new_name)
+
+    async def merge_tags(self, user_id: UUID, sources: List[str], target: str) -> int:
+        """Folds every tag in `sources` into `target` across the user's tasks; returns tasks changed."""
+        sources = [tag for tag in dict.fromkeys(sources) if tag != target]
+        if not sources:
+            return 0
+        return await self.task_repo.merge_tags(user_id, sources, target)
+
+    @read_only
     async def get_task(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
+        # Archived tasks are listed with include_archived, so they are served by ID too, read-only
+        task = await self._get_owned_task(task_id, user_id)
+        if task is None:
+            task = await self._get_owned_archived_task(task_id, user_id)
+        return task
+
+    async def is_archived(self, task_id: UUID, user_id: UUID) -> bool:
+        """Whether a write that found no live task hit an archived one of this user's."""
+        return await self._get_owned_archived_task(task_id, user_id) is not None
+
+    async def _get_owned_archived_task(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
+        task = await self.task_repo.get_archived_by_id(task_id)
+        if task and task.user_id == user_id:
+            return task
+        return None
+
+    async def _get_owned_task(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
+        # Write paths look the task up here, on the primary, rather than through get_task
         task = await self.task_repo.get_by_id(task_id)
         if task and task.user_id == user_id:
             return task
         return None
 
     async def update_task(self, task_id: UUID, user_id: UUID, dto: TaskUpdateDTO) -> Optional[Task]:
-        task = await self.get_task(task_id, user_id)
+        task = await self._get_owned_task(task_id, user_id)
         if not task:
             return None
 
@@ -76,16 +241,54 @@ class TaskUseCase:
 
         return await self.task_repo.update(task)
 
+    async def patch_task(
+        self,
+        task_id: UUID,
+        user_id: UUID,
+        dto: TaskPatchDTO,
+        include_children: bool = False
+    ) -> Optional[Task]:
+        """
+        Applies a merge patch in one owner-scoped UPDATE ... RETURNING.
+        Attachments and checklists are only loaded when `include_children` is set.
+        """
+        changes = dto.changes()
+        await self._check_target_task_list(user_id, changes)
+
+        task = await self.task_repo.patch(task_id, user_id, changes)
+        if task and include_children:
+            return await self.task_repo.get_by_id(task_id)
+        return task
+
+    async def bulk_update_tasks(self, user_id: UUID, dto: TaskBulkUpdateDTO) -> List[UUID]:
+        """Applies one change set to the selected tasks in a single set-based UPDATE."""
+        changes = dto.changes.changes()
+        await self._check_target_task_list(user_id, changes)
+        return await self.task_repo.bulk_update(user_id, dto.to_filters(), changes)
+
+    async def bulk_delete_tasks(self, user_id: UUID, dto: TaskSelectionDTO) -> List[UUID]:
+        """
+        Tombstones the selected tasks in one statement and returns their IDs.
+        Rows and stored files are removed later by the purge job.
+        """
+        return await self.task_repo.bulk_delete(user_id, dto.to_filters())
+
+    async def _check_target_task_list(self, user_id: UUID, changes: dict) -> None:
+        # Only a change that moves tasks into a list needs the ownership lookup
+        if changes.get("task_list_id") and self.task_list_repo:
+            task_list = await self.task_list_repo.get_by_id(changes["task_list_id"])
+            if not task_list or task_list.user_id != user_id:
+                raise ValueError("Invalid task list ID")
+
     async def delete_task(self, task_id: UUID, user_id: UUID) -> bool:
-        task = await self.get_task(task_id, user_id)
-        if not task:
-            return False
-            
-        # Delete attachments from storage
-        for attachment in task.attachments:
-            await self.file_storage.delete(attachment.file_url)
-            
-        return await self.task_repo.delete(task_id)
+        # Only a tombstone is written here; the purge job removes the rows and files
+        # once TASK_PURGE_AFTER_HOURS have passed, and restore_task can undo it until then
+        return await self.task_repo.delete(task_id, user_id)
+
+    async def restore_task(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
+        if not await self.task_repo.restore(task_id, user_id):
+            return None
+        return await self.task_repo.get_by_id(task_id)
 
     async def add_attachment(
         self, 
@@ -95,7 +298,7 @@ class TaskUseCase:
         filename: str, 
         content_type: str
     ) -> Optional[Task]:
-        task = await self.get_task(task_id, user_id)
+        task = await self._get_owned_task(task_id, user_id)
         if not task:
             return None
             
@@ -120,11 +323,22 @@ class TaskUseCase:
         if not attachment:
             return False
             
-        task = await self.get_task(attachment.task_id, user_id)
+        task = await self._get_owned_task(attachment.task_id, user_id)
         if not task:
             return False
             
+        deleted = await self.task_repo.delete_attachment(attachment_id)
+        # The only hard delete left on the request path (task deletes write a tombstone and the
+        # purge job removes files): commit first so the file goes only once the row is gone for good
+        if self.uow:
+            await self.uow.commit()
+
         # Remove from storage
         await self.file_storage.delete(attachment.file_url)
-        
-        return await self.task_repo.delete_attachment(attachment_id)
+        return deleted
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
@@ -38,6 +38,13 @@ class TaskPriority(str, Enum):
     HIGH = "high"
     URGENT = "urgent"
 
+class TaskSort(str, Enum):
+    """Supported task listing orders; a leading '-' means descending."""
+    NEWEST = "-created_at"
+    DUE_DATE = "due_date"
+    PRIORITY = "-priority"
+    RECENTLY_UPDATED = "-updated_at"
+
 class Attachment(BaseModel):
     """
     Attachment Domain Entity.
@@ -115,6 +122,8 @@ class Task(BaseModel):
     
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(default_factory=utc_now)
+    # Set on tasks read back from the archive, which are read-only
+    archived_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -124,3 +133,89 @@ class Task(BaseModel):
             return False
         return utc_now() > self.due_date and self.status != TaskStatus.DONE
 
+class TaskSummary(BaseModel):
+    """
+    TaskSummary Read Model.
+    Scalar task fields plus child counts, for list views that never need the full aggregate.
+    """
+    id: UUID
+    user_id: UUID
+    task_list_id: Optional[UUID] = None
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    due_date: Optional[datetime] = None
+    attachment_count: int = 0
+    checklist_item_count: int = 0
+    completed_item_count: int = 0
+    created_at: datetime
+    updated_at: datetime
+    archived_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class TaskStats(BaseModel):
+    """
+    TaskStats Read Model.
+    Dashboard counts over a user's tasks. `overdue` matches Task.is_overdue;
+    `due_this_week` counts open tasks due from now through the sixth day after today.
+    """
+    total: int
+    by_status: Dict[TaskStatus, int]
+    by_priority: Dict[TaskPriority, int]
+    overdue: int
+    due_this_week: int
+
+class TagCount(BaseModel):
+    """
+    TagCount Read Model.
+    How many of a user's tasks carry a given tag.
+    """
+    name: str
+    count: int
+
+class ReminderKind(str, Enum):
+    """Kinds of reminders sent for a task's due date."""
+    DUE_SOON = "due_soon"
+
+class Reminder(BaseModel):
+    """
+    Reminder Read Model.
+    A due-date reminder taken off the queue: the task it is for, its owner and title, the
+    due date it was queued for and its kind.
+    """
+    task_id: UUID
+    user_id: UUID
+    title: str
+    due_date: datetime
+    kind: ReminderKind = ReminderKind.DUE_SOON
+
+class SyncEntity(str, Enum):
+    """Kinds of entities the sync API reports changes for."""
+    TASK = "task"
+    TASK_LIST = "task_list"
+    CHECKLIST = "checklist"
+    CHECKLIST_ITEM = "checklist_item"
+
+class SyncTombstone(BaseModel):
+    """
+    SyncTombstone Read Model.
+    An entity deleted since the client's last sync.
+    """
+    entity: SyncEntity
+    id: UUID
+
+class SyncChanges(BaseModel):
+    """
+    SyncChanges Read Model.
+    A user's changes after a change sequence number: the current state of every created or
+    updated entity (checklists without their items, which are reported on their own), the
+    entities deleted, and the sequence number this batch reaches.
+    """
+    tasks: List[Task] = Field(default_factory=list)
+    task_lists: List[TaskList] = Field(default_factory=list)
+    checklists: List[Checklist] = Field(default_factory=list)
+    checklist_items: List[ChecklistItem] = Field(default_factory=list)
+    deleted: List[SyncTombstone] = Field(default_factory=list)
+    last_seq: int
+    has_more: bool = False
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional, List, Set, Tuple, TypeVar
 from uuid import UUID
-from backend.src.domain.entities.models import Attachment, User, Task, TaskList, Checklist, ChecklistItem
+from backend.src.domain.entities.models import (
+    Attachment, User, Task, TaskList, Checklist, ChecklistItem, TaskSummary, TagCount, TaskStats, TaskSort,
+    SyncChanges, Reminder
+)
+
+T = TypeVar("T")
 
 class IUserRepository(ABC):
     @abstractmethod
@@ -41,6 +47,11 @@ class ITaskListRepository(ABC):
     async def list_by_user(self, user_id: UUID) -> List[TaskList]:
         pass
 
+    @abstractmethod
+    async def get_owned_ids(self, user_id: UUID, task_list_ids: List[UUID]) -> Set[UUID]:
+        """The subset of task_list_ids that belong to user_id."""
+        pass
+
     @abstractmethod
     async def update(self, task_list: TaskList) -> TaskList:
         pass
@@ -83,18 +94,51 @@ class ITaskRepository(ABC):
     async def get_by_id(self, task_id: UUID) -> Optional[Task]:
         pass
 
+    @abstractmethod
+    async def get_archived_by_id(self, task_id: UUID) -> Optional[Task]:
+        """Gets an archived task with its children; archived tasks are read-only."""
+        pass
+
     @abstractmethod
     async def create(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        """Inserts all tasks in one transaction; returns them in input order."""
+        pass
+
     @abstractmethod
     async def list_by_user(
         self, 
         user_id: UUID,
         filters: dict = None, 
         limit: int = 20, 
-        offset: int = 0
+        offset: int = 0,
+        sort: TaskSort = TaskSort.NEWEST,
+        after: Optional[tuple] = None,
+        include_archived: bool = False
     ) -> List[Task]:
+        """
+        Lists a user's tasks in `sort` order, newest first by default.
+        When `after` is the keyset of the last task seen (its sort key values, then its id),
+        seeks past that position instead of using offset.
+        With `include_archived`, archived tasks are listed alongside live ones in the same order.
+        """
+        pass
+
+    @abstractmethod
+    async def list_summaries_by_user(
+        self,
+        user_id: UUID,
+        filters: dict = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort: TaskSort = TaskSort.NEWEST,
+        after: Optional[tuple] = None,
+        include_archived: bool = False
+    ) -> List[TaskSummary]:
+        """Same listing as list_by_user, projected to scalar columns and child counts in one query."""
         pass
 
     @abstractmethod
@@ -102,7 +146,43 @@ class ITaskRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete(self, task_id: UUID) -> bool:
+    async def patch(self, task_id: UUID, user_id: UUID, changes: dict) -> Optional[Task]:
+        """
+        Writes only the given columns of a task owned by `user_id` in a single statement.
+        Returns the task without its child collections, or None if it does not exist for that user.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, user_id: UUID, filters: dict, changes: dict) -> List[UUID]:
+        """Applies changes to every task of user_id matching filters in one UPDATE; returns the IDs updated."""
+        pass
+
+    @abstractmethod
+    async def bulk_delete(self, user_id: UUID, filters: dict) -> List[UUID]:
+        """Tombstones every task of user_id matching filters in one UPDATE; returns the IDs deleted."""
+        pass
+
+    @abstractmethod
+    async def delete(self, task_id: UUID, user_id: UUID) -> bool:
+        """
+        Tombstones a task owned by `user_id`: every read stops seeing it, while its rows
+        and files stay until purge_deleted_before. Returns False if there was no such live task.
+        """
+        pass
+
+    @abstractmethod
+    async def restore(self, task_id: UUID, user_id: UUID) -> bool:
+        """Clears the tombstone of a deleted, not yet purged task owned by `user_id`."""
+        pass
+
+    @abstractmethod
+    async def purge_deleted_before(self, cutoff: datetime, limit: int) -> Tuple[List[UUID], List[str]]:
+        """
+        Removes up to `limit` tasks tombstoned before `cutoff`, with their children.
+        Returns the IDs removed and the file URLs of their attachments, for the caller
+        to delete from storage; fewer than `limit` IDs means none are left.
+        """
         pass
         
     @abstractmethod
@@ -121,8 +201,127 @@ class ITaskRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_due_soon(self, hours: int = 24) -> List[Task]:
-        """Get tasks due within the next N hours that are not done."""
+    async def count_by_user(
+        self, user_id: UUID, filters: dict, cap: int, include_archived: bool = False
+    ) -> Tuple[int, bool]:
+        """
+        Counts a user's tasks matching list_by_user's `filters`; returns (total, exact).
+        Status and priority filters are answered exactly from maintained counters; any
+        other filter stops after `cap` + 1 rows and returns (cap, False) past the cap.
+        Archived tasks, when included, are always counted up to the cap.
+        """
+        pass
+
+    @abstractmethod
+    async def get_stats(self, user_id: UUID) -> TaskStats:
+        """Dashboard counts for a user, read from maintained counters rather than the tasks."""
+        pass
+
+    @abstractmethod
+    async def count_tags_by_user(self, user_id: UUID) -> List[TagCount]:
+        """Counts a user's tasks per tag, most used first."""
+        pass
+
+    @abstractmethod
+    async def merge_tags(self, user_id: UUID, sources: List[str], target: str) -> int:
+        """
+        Replaces every tag in `sources` with `target` on all of a user's tasks in one statement.
+        Renaming is a merge with a single source. Returns the number of tasks changed.
+        """
+        pass
+
+class ITaskArchive(ABC):
+    @abstractmethod
+    async def archive_done_before(self, cutoff: datetime, limit: int) -> int:
+        """
+        Moves up to `limit` done tasks last updated before `cutoff`, with their checklists
+        and attachment metadata, from the live tables into the archive.
+        Returns how many tasks were moved; fewer than `limit` means none are left.
+        """
+        pass
+
+class ITaskExport(ABC):
+    @abstractmethod
+    def stream_by_user(
+        self,
+        user_id: UUID,
+        filters: dict = None,
+        with_checklist_items: bool = False,
+        include_archived: bool = False
+    ) -> AsyncIterator[Task]:
+        """
+        Yields every task of the user matching `filters`, newest first, then the archived ones
+        when asked. Rows are fetched from a server-side cursor in batches, so memory does not
+        grow with the number of tasks. Attachments are never loaded; checklists and their items
+        only with `with_checklist_items`.
+        """
+        pass
+
+class ITaskImport(ABC):
+    @abstractmethod
+    async def load(self, tasks: List[Task], checklists: List[Checklist], items: List[ChecklistItem]) -> None:
+        """
+        Bulk-inserts new tasks, checklists and checklist items, ids and timestamps
+        already set, in the caller's transaction. Meant for thousands of rows at a time.
+        Raises ValueError when the database rejects the rows; then none of them are written
+        and the transaction stays usable.
+        """
+        pass
+
+class ISyncRepository(ABC):
+    @abstractmethod
+    async def changes_since(self, user_id: UUID, since: int, limit: int) -> SyncChanges:
+        """
+        The user's entities created, updated or deleted after change sequence number `since`,
+        at most `limit` of them in change order. `has_more` is set when the limit cut the batch short.
+        """
+        pass
+
+class IReminderRepository(ABC):
+    @abstractmethod
+    async def pop_due(self, now: datetime, limit: int) -> List[Reminder]:
+        """
+        Removes up to `limit` reminders due to fire at `now`, earliest first, and returns them.
+        Reminders another transaction is taking are skipped; fewer than `limit` means none are left.
+        """
+        pass
+
+    @abstractmethod
+    async def record_deliveries(self, reminders: List[Reminder], delivered_at: datetime) -> List[Reminder]:
+        """
+        Adds the reminders to the delivery ledger, keyed by task, due date and kind, in one
+        statement. Returns the ones not in it before; the rest were already delivered.
+        """
+        pass
+
+    @abstractmethod
+    async def prune_deliveries(self, before: datetime, limit: int) -> int:
+        """
+        Removes up to `limit` ledger entries for due dates before `before`, which no reminder
+        can fire for any more. Returns how many were removed; fewer than `limit` means none are left.
+        """
+        pass
+
+class ITaskSearch(ABC):
+    @abstractmethod
+    async def search(
+        self,
+        user_id: UUID,
+        text: str,
+        filters: dict = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[UUID]:
+        """
+        Full-text search over a user's tasks (title, description and checklist items).
+        Applies the same scalar filters as ITaskRepository.list_by_user and returns
+        the matching task ids, most relevant first.
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, user_id: UUID, text: str, filters: dict = None, cap: int = 1000) -> Tuple[int, bool]:
+        """Counts matches like `search`; returns (total, exact), giving (cap, False) past `cap`."""
         pass
 
 class IFileStorage(ABC):
@@ -134,3 +333,30 @@ class IFileStorage(ABC):
     @abstractmethod
     async def delete(self, file_url: str) -> bool:
         pass
+
+    @abstractmethod
+    async def delete_many(self, file_urls: List[str]) -> int:
+        """Deletes files in as few storage calls as possible; returns how many were removed."""
+        pass
+
+class IUnitOfWork(ABC):
+    """
+    The transaction shared by every repository in one request or job.
+    Repositories only flush; the owner of the unit of work commits once at the end.
+    """
+    @abstractmethod
+    async def commit(self) -> None:
+        """Makes the writes so far durable, e.g. before a side effect outside the database."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
+    async def read(self, user_id: Optional[UUID], operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs a call that only reads, on behalf of `user_id` (None for background jobs).
+        An implementation may serve it from a read replica, except shortly after that
+        user wrote; by default it reads in this unit of work's own transaction.
+        """
+        return await operation()
@@ -1,13 +1,59 @@
 from typing import AsyncGenerator
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from backend.src.config import settings
+from backend.src.config import Settings, settings
+from backend.src.infrastructure.persistence.sqlalchemy.pool import InstrumentedAsyncQueuePool
+from backend.src.infrastructure.persistence.sqlalchemy.routing import (
+    RedisRecentWrites, RoutingSession, SessionRouter
+)
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+
+def engine_options(url: str, name: str, config: Settings = settings) -> dict:
+    """create_async_engine arguments for the configured pool and driver settings.
+    `name` labels the engine's pool metrics."""
+    options = {"echo": config.DEBUG, "pool_logging_name": name}
+    if make_url(url).get_backend_name() != "postgresql":
+        # SQLite (tests, local runs) keeps SQLAlchemy's default pool for its driver
+        return options
+    server_settings = {}
+    if config.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(config.DB_STATEMENT_TIMEOUT_MS)
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args={
+            # asyncpg's own cache and SQLAlchemy's adapter cache both hold prepared statements
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        },
+    )
+    return options
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL, "primary"))
+
+replica_engines = [
+    create_async_engine(url, **engine_options(url, f"replica-{number}"))
+    for number, url in enumerate(settings.DATABASE_REPLICA_URLS, start=1)
+]
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+# Without replicas there is nothing to route: every session stays on the primary
+session_router = SessionRouter(
+    replica_engines,
+    RedisRecentWrites(settings.REDIS_URL, settings.DB_READ_YOUR_WRITES_SECONDS),
+    settings.DB_REPLICA_RETRY_SECONDS,
+) if replica_engines else None
 
 AsyncSessionLocal = async_sessionmaker(
     engine, 
     class_=AsyncSession, 
+    sync_session_class=RoutingSession,
+    router=session_router,
     expire_on_commit=False
 )
 
@@ -15,5 +61,6 @@ class Base(DeclarativeBase):
     pass
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+    # One transaction per request: repositories flush, the request commits once on success
+    async with AsyncSessionLocal() as session, SQLAlchemyUnitOfWork(session):
         yield session
@@ -1,10 +1,17 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Boolean, TypeDecorator
+from sqlalchemy import (
+    Column, String, Date, DateTime, ForeignKey, Integer, BigInteger, SmallInteger, Text, Boolean, TypeDecorator, Index,
+    DDL, event, bindparam
+)
 from sqlalchemy.dialects.postgresql import UUID, ARRAY as PG_ARRAY
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
 import uuid
 import json
 from datetime import datetime, timezone
 from sqlalchemy.sql import func
+from backend.src.domain.entities.models import ReminderKind, SyncEntity, TaskPriority, TaskStatus, UserRole
 from backend.src.infrastructure.persistence.sqlalchemy.database import Base
 
 def utc_now():
@@ -57,70 +64,238 @@ class StringArray(TypeDecorator):
                     return []
             return value if value else []
 
+    class comparator_factory(TypeDecorator.Comparator):
+        def contains_any(self, values):
+            """True when the array shares at least one element with `values`."""
+            return TagsMatch(self.expr, values, match_all=False)
+
+        def contains_all(self, values):
+            """True when the array holds every element of `values`."""
+            return TagsMatch(self.expr, values, match_all=True)
+
+        def merged(self, sources, target):
+            """The array with every element in `sources` replaced by `target`, deduplicated in order."""
+            return TagsMerge(self.expr, sources, target)
+
+
+class OrdinalEnum(TypeDecorator):
+    """
+    Stores a str Enum as the SMALLINT position of its member in declaration order,
+    so ORDER BY follows the enum's order. Members may only ever be appended.
+    Accepts members or their string values; loads members.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        return list(self.enum_class).index(self.enum_class(value))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        return list(self.enum_class)[value]
+
+
+class TagsMatch(ColumnElement):
+    """Array overlap / containment test, compiled per dialect for StringArray columns."""
+    inherit_cache = True
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("values", InternalTraversal.dp_clauseelement),
+        ("match_all", InternalTraversal.dp_boolean),
+    ]
+    type = Boolean()
+
+    def __init__(self, column, values, match_all: bool):
+        self.column = column
+        self.values = bindparam("tags", list(values), type_=StringArray(), unique=True)
+        self.match_all = match_all
+
+
+class TagsMerge(ColumnElement):
+    """Array rewrite replacing several elements with one, compiled per dialect for StringArray columns."""
+    inherit_cache = True
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("sources", InternalTraversal.dp_clauseelement),
+        ("target", InternalTraversal.dp_clauseelement),
+    ]
+    type = StringArray()
+
+    def __init__(self, column, sources, target: str):
+        self.column = column
+        self.sources = bindparam("sources", list(sources), type_=StringArray(), unique=True)
+        self.target = bindparam("target", target, type_=String(), unique=True)
+
+
+@compiles(TagsMatch, "postgresql")
+def _compile_tags_match_pg(element, compiler, **kw):
+    # Both operators are served by the GIN index on tasks.tags
+    operator = "@>" if element.match_all else "&&"
+    return f"{compiler.process(element.column, **kw)} {operator} {compiler.process(element.values, **kw)}"
+
+
+@compiles(TagsMatch)
+def _compile_tags_match_json(element, compiler, **kw):
+    column = compiler.process(element.column, **kw)
+    values = compiler.process(element.values, **kw)
+    if element.match_all:
+        return (
+            f"NOT EXISTS (SELECT 1 FROM json_each({values}) AS wanted "
+            f"WHERE wanted.value NOT IN (SELECT value FROM json_each({column})))"
+        )
+    return f"EXISTS (SELECT 1 FROM json_each({column}) WHERE value IN (SELECT value FROM json_each({values})))"
+
+
+@compiles(TagsMerge, "postgresql")
+def _compile_tags_merge_pg(element, compiler, **kw):
+    column = compiler.process(element.column, **kw)
+    sources = compiler.process(element.sources, **kw)
+    target = compiler.process(element.target, **kw)
+    return (
+        f"ARRAY(SELECT CASE WHEN t.tag = ANY({sources}) THEN {target} ELSE t.tag END "
+        f"FROM unnest({column}) WITH ORDINALITY AS t(tag, ord) GROUP BY 1 ORDER BY min(t.ord))"
+    )
+
+
+@compiles(TagsMerge)
+def _compile_tags_merge_json(element, compiler, **kw):
+    column = compiler.process(element.column, **kw)
+    sources = compiler.process(element.sources, **kw)
+    target = compiler.process(element.target, **kw)
+    return (
+        f"(SELECT json_group_array(tag) FROM ("
+        f"SELECT CASE WHEN value IN (SELECT value FROM json_each({sources})) THEN {target} ELSE value END AS tag, "
+        f"min(key) AS ord FROM json_each({column}) GROUP BY tag ORDER BY ord))"
+    )
+
 class UserModel(Base):
     __tablename__ = "users"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, index=True, nullable=False)
     password_hash = Column(String, nullable=False)
-    role = Column(String, default="user")
+    role = Column(OrdinalEnum(UserRole), default=UserRole.USER)
     is_verified = Column(Boolean, default=False)
     verification_token = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utc_now)
 
-    tasks = relationship("TaskModel", back_populates="user", cascade="all, delete-orphan")
-    task_lists = relationship("TaskListModel", back_populates="user", cascade="all, delete-orphan")
+    tasks = relationship("TaskModel", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    task_lists = relationship("TaskListModel", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
 class TaskListModel(Base):
     __tablename__ = "task_lists"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utc_now)
 
     user = relationship("UserModel", back_populates="task_lists")
-    tasks = relationship("TaskModel", back_populates="task_list", cascade="all, delete-orphan")
+    tasks = relationship("TaskModel", back_populates="task_list", cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (
+        Index("ix_task_lists_user_created", user_id, created_at),
+    )
 
 class TaskModel(Base):
     __tablename__ = "tasks"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    task_list_id = Column(UUID(as_uuid=True), ForeignKey("task_lists.id"), nullable=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_list_id = Column(UUID(as_uuid=True), ForeignKey("task_lists.id", ondelete="CASCADE"), nullable=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(String, default="todo", index=True)
-    priority = Column(String, default="medium")
+    status = Column(OrdinalEnum(TaskStatus), default=TaskStatus.TODO)
+    priority = Column(OrdinalEnum(TaskPriority), default=TaskPriority.MEDIUM)
     due_date = Column(DateTime, nullable=True)
     tags = Column(StringArray, default=list)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utc_now)
+    # Tombstone: set by delete, cleared by restore; the purge job removes the row later
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     user = relationship("UserModel", back_populates="tasks")
     task_list = relationship("TaskListModel", back_populates="tasks")
-    attachments = relationship("AttachmentModel", back_populates="task", cascade="all, delete-orphan")
-    checklists = relationship("ChecklistModel", back_populates="task", cascade="all, delete-orphan")
+    attachments = relationship("AttachmentModel", back_populates="task", cascade="all, delete-orphan", passive_deletes=True)
+    checklists = relationship("ChecklistModel", back_populates="task", cascade="all, delete-orphan", passive_deletes=True)
+
+    # Every index here must also exist in a migration under backend/migrations/versions
+    __table_args__ = (
+        # Matches the list ordering so keyset pagination is a single index seek
+        Index("ix_tasks_user_created_id", user_id, created_at.desc(), id.desc()),
+        # One per remaining TaskSort, in the same column order and direction as its ORDER BY
+        Index("ix_tasks_user_due_id", user_id, due_date, id),
+        Index("ix_tasks_user_priority_created_id", user_id, priority.desc(), created_at.desc(), id.desc()),
+        Index("ix_tasks_user_updated_id", user_id, updated_at.desc(), id.desc()),
+        Index("ix_tasks_user_status", user_id, status),
+        Index("ix_tasks_task_list_id", task_list_id),
+        # Today's overdue slice of the dashboard stats; earlier days come from user_task_due_stats
+        Index(
+            "ix_tasks_user_due_open", user_id, due_date,
+            postgresql_where=(status != TaskStatus.DONE),
+            sqlite_where=(status != TaskStatus.DONE),
+        ),
+        # Archive candidates: done tasks, oldest change first
+        Index(
+            "ix_tasks_done_updated", updated_at,
+            postgresql_where=(status == TaskStatus.DONE),
+            sqlite_where=(status == TaskStatus.DONE),
+        ),
+        # Purge candidates: tombstones only, oldest first
+        Index(
+            "ix_tasks_deleted_at", deleted_at,
+            postgresql_where=deleted_at.isnot(None),
+            sqlite_where=deleted_at.isnot(None),
+        ),
+    )
+
+class UserTaskStatsModel(Base):
+    """Task counts per user, status and priority, kept current by the triggers in STATS_DDL."""
+    __tablename__ = "user_task_stats"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(OrdinalEnum(TaskStatus), primary_key=True)
+    priority = Column(OrdinalEnum(TaskPriority), primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
+
+class UserTaskDueStatsModel(Base):
+    """Open (not done) tasks per user and due day, kept current by the triggers in STATS_DDL."""
+    __tablename__ = "user_task_due_stats"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    due_on = Column(Date, primary_key=True)
+    open_count = Column(Integer, nullable=False, default=0)
 
 class ChecklistModel(Base):
     __tablename__ = "checklists"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     title = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utc_now)
 
     task = relationship("TaskModel", back_populates="checklists")
-    items = relationship("ChecklistItemModel", back_populates="checklist", cascade="all, delete-orphan")
+    items = relationship("ChecklistItemModel", back_populates="checklist", cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (
+        Index("ix_checklists_task_id", task_id),
+    )
 
 class ChecklistItemModel(Base):
     __tablename__ = "checklist_items"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    checklist_id = Column(UUID(as_uuid=True), ForeignKey("checklists.id"), nullable=False)
+    checklist_id = Column(UUID(as_uuid=True), ForeignKey("checklists.id", ondelete="CASCADE"), nullable=False)
     content = Column(String, nullable=False)
     is_completed = Column(Boolean, default=False)
     position = Column(Integer, default=0)
@@ -128,11 +303,15 @@ class ChecklistItemModel(Base):
 
     checklist = relationship("ChecklistModel", back_populates="items")
 
+    __table_args__ = (
+        Index("ix_checklist_items_checklist_position", checklist_id, position),
+    )
+
 class AttachmentModel(Base):
     __tablename__ = "attachments"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String, nullable=False)
     file_url = Column(String, nullable=False)
     file_size_bytes = Column(Integer, nullable=False)
@@ -141,3 +320,755 @@ class AttachmentModel(Base):
 
     task = relationship("TaskModel", back_populates="attachments")
 
+    __table_args__ = (
+        Index("ix_attachments_task_id", task_id),
+    )
+
+
+# Archive
+#
+# Done tasks past TASK_ARCHIVE_AFTER_DAYS are moved here with their checklists and
+# attachment metadata by the archive_done_tasks worker job, keeping tasks and its indexes
+# down to live work. The tables mirror the live ones column for column so the task
+# mapping and listing code serves both; archived rows are read-only.
+
+class ArchivedTaskModel(Base):
+    __tablename__ = "archived_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_list_id = Column(UUID(as_uuid=True), ForeignKey("task_lists.id", ondelete="CASCADE"), nullable=True)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    status = Column(OrdinalEnum(TaskStatus))
+    priority = Column(OrdinalEnum(TaskPriority))
+    due_date = Column(DateTime, nullable=True)
+    tags = Column(StringArray, default=list)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    attachments = relationship("ArchivedAttachmentModel", passive_deletes=True)
+    checklists = relationship("ArchivedChecklistModel", passive_deletes=True)
+
+    __table_args__ = (
+        # Archived tasks are only listed together with live ones; the user_id prefix serves every sort
+        Index("ix_archived_tasks_user_created_id", user_id, created_at.desc(), id.desc()),
+        Index("ix_archived_tasks_task_list_id", task_list_id),
+    )
+
+class ArchivedChecklistModel(Base):
+    __tablename__ = "archived_checklists"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("archived_tasks.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+
+    items = relationship("ArchivedChecklistItemModel", passive_deletes=True)
+
+    __table_args__ = (
+        Index("ix_archived_checklists_task_id", task_id),
+    )
+
+class ArchivedChecklistItemModel(Base):
+    __tablename__ = "archived_checklist_items"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    checklist_id = Column(
+        UUID(as_uuid=True), ForeignKey("archived_checklists.id", ondelete="CASCADE"), nullable=False
+    )
+    content = Column(String, nullable=False)
+    is_completed = Column(Boolean, default=False)
+    position = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_archived_checklist_items_checklist_position", checklist_id, position),
+    )
+
+class ArchivedAttachmentModel(Base):
+    __tablename__ = "archived_attachments"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("archived_tasks.id", ondelete="CASCADE"), nullable=False)
+    filename = Column(String, nullable=False)
+    file_url = Column(String, nullable=False)
+    file_size_bytes = Column(Integer, nullable=False)
+    content_type = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_archived_attachments_task_id", task_id),
+    )
+
+
+# Sync change log
+
+class SyncChangeModel(Base):
+    """
+    The latest change to each task, task list, checklist and checklist item, kept current by
+    the triggers in SYNC_DDL. A deletion keeps the row as a tombstone. change_seq comes from
+    one increasing sequence, so (user_id, change_seq) orders a user's changes.
+    """
+    __tablename__ = "sync_changes"
+
+    entity_type = Column(OrdinalEnum(SyncEntity), primary_key=True)
+    entity_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+    deleted = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        Index("ix_sync_changes_user_seq", user_id, change_seq),
+    )
+
+
+# Reminders
+
+class ReminderModel(Base):
+    """
+    The pending due-date reminder of each open task, kept current by the triggers in
+    REMINDER_DDL. The reminder job deletes rows as it sends them, so the table only
+    holds reminders still to fire and ix_reminders_fire_at reads the due ones in order.
+    """
+    __tablename__ = "reminders"
+
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    due_date = Column(DateTime, nullable=False)
+    fire_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_reminders_fire_at", fire_at),
+    )
+
+
+class ReminderDeliveryModel(Base):
+    """
+    The ledger of reminders sent. The primary key makes each (task, due date, kind) deliverable
+    once, however often the task is requeued; entries go once their due date has passed.
+    """
+    __tablename__ = "reminder_deliveries"
+
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    due_date = Column(DateTime, primary_key=True)
+    kind = Column(OrdinalEnum(ReminderKind), primary_key=True)
+    delivered_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_reminder_deliveries_due_date", due_date),
+    )
+
+
+# Full-text search
+#
+# The search index is maintained by triggers rather than by the ORM so that every write
+# path (including bulk statements) keeps it current. It is kept out of the ORM models:
+# Postgres stores a weighted tsvector on tasks behind a GIN index, SQLite mirrors tasks
+# into an FTS5 table. Task title, description and checklist item content are indexed.
+# Migration 0003 creates the same objects on existing databases.
+
+SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector",
+        """
+        CREATE OR REPLACE FUNCTION task_search_vector(p_task_id uuid, p_title text, p_description text)
+        RETURNS tsvector LANGUAGE sql STABLE AS $$
+            SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(p_description, '')), 'B')
+                || setweight(to_tsvector('english', coalesce((
+                    SELECT string_agg(ci.content, ' ')
+                    FROM checklist_items ci JOIN checklists c ON c.id = ci.checklist_id
+                    WHERE c.task_id = p_task_id
+                ), '')), 'C')
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION tasks_search_vector_refresh() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := task_search_vector(NEW.id, NEW.title, NEW.description);
+            RETURN NEW;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER tasks_search_vector_refresh
+        BEFORE INSERT OR UPDATE OF title, description ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_refresh()
+        """,
+        """
+        CREATE OR REPLACE FUNCTION checklist_items_search_vector_refresh() RETURNS trigger LANGUAGE plpgsql AS $$
+        DECLARE
+            v_checklist_id uuid;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                v_checklist_id := OLD.checklist_id;
+            ELSE
+                v_checklist_id := NEW.checklist_id;
+            END IF;
+            UPDATE tasks t SET search_vector = task_search_vector(t.id, t.title, t.description)
+            FROM checklists c
+            WHERE c.id = v_checklist_id AND t.id = c.task_id;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER checklist_items_search_vector_refresh
+        AFTER INSERT OR UPDATE OF content OR DELETE ON checklist_items
+        FOR EACH ROW EXECUTE FUNCTION checklist_items_search_vector_refresh()
+        """,
+        # btree_gin lets one GIN index serve the owner filter and the text match together
+        "CREATE EXTENSION IF NOT EXISTS btree_gin",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (user_id, search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, checklist_text, tokenize='porter unicode61')",
+        # Maps tasks to FTS rows; tasks has no INTEGER PRIMARY KEY, so its rowid is not stable to reuse
+        """
+        CREATE TABLE tasks_fts_rows (
+            task_id CHAR(32) PRIMARY KEY,
+            fts_rowid INTEGER NOT NULL UNIQUE
+        )
+        """,
+        """
+        CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (title, description, checklist_text)
+            VALUES (NEW.title, coalesce(NEW.description, ''), '');
+            INSERT INTO tasks_fts_rows (task_id, fts_rowid) VALUES (NEW.id, last_insert_rowid());
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+            UPDATE tasks_fts SET title = NEW.title, description = coalesce(NEW.description, '')
+            WHERE rowid = (SELECT fts_rowid FROM tasks_fts_rows WHERE task_id = NEW.id);
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            DELETE FROM tasks_fts WHERE rowid = (SELECT fts_rowid FROM tasks_fts_rows WHERE task_id = OLD.id);
+            DELETE FROM tasks_fts_rows WHERE task_id = OLD.id;
+        END
+        """,
+    ] + [
+        f"""
+        CREATE TRIGGER checklist_items_fts_{name} AFTER {op} ON checklist_items BEGIN
+            UPDATE tasks_fts SET checklist_text = coalesce((
+                SELECT group_concat(ci.content, ' ')
+                FROM checklist_items ci JOIN checklists c ON c.id = ci.checklist_id
+                WHERE c.task_id = (SELECT task_id FROM checklists WHERE id = {row}.checklist_id)
+            ), '')
+            WHERE rowid = (
+                SELECT r.fts_rowid FROM tasks_fts_rows r JOIN checklists c ON c.task_id = r.task_id
+                WHERE c.id = {row}.checklist_id
+            );
+        END
+        """
+        for name, op, row in (
+            ("insert", "INSERT", "NEW"), ("update", "UPDATE OF content", "NEW"), ("delete", "DELETE", "OLD")
+        )
+    ],
+}
+
+SEARCH_DROP_DDL = {
+    "sqlite": ["DROP TABLE IF EXISTS tasks_fts", "DROP TABLE IF EXISTS tasks_fts_rows"],
+}
+
+# Tag filters (&& / @>) on Postgres use a GIN index; btree_gin (see SEARCH_DDL) lets it lead with user_id.
+# SQLite has no equivalent index type, so tag filters there rely on the user_id indexes alone.
+TAG_DDL = {
+    "postgresql": [
+        "CREATE INDEX IF NOT EXISTS ix_tasks_user_tags ON tasks USING gin (user_id, tags)",
+    ],
+}
+
+# Task counters
+#
+# user_task_stats and user_task_due_stats are maintained by triggers on tasks, in the
+# writing transaction, so every write path (bulk statements and ON DELETE CASCADE
+# included) keeps the counts exact. Postgres uses statement-level triggers over transition
+# tables: a bulk write costs one upsert per counter row it touches instead of one per task.
+# Migrations 0006 (user_task_stats) and 0007 (user_task_due_stats) create the same objects
+# on existing databases. Status and priority are OrdinalEnum codes: `status <> 2` is "not done".
+# Tombstoned tasks (deleted_at set) are not counted; migration 0011 added that condition.
+
+STATS_DDL = {
+    "postgresql": [
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+            SELECT user_id, status, priority, count(*) FROM new_rows WHERE deleted_at IS NULL
+            GROUP BY user_id, status, priority
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_stats AS s (user_id, status, priority, task_count)
+            SELECT user_id, status, priority, sum(delta) FROM (
+                SELECT user_id, status, priority, -1 AS delta FROM old_rows WHERE deleted_at IS NULL
+                UNION ALL
+                SELECT user_id, status, priority, 1 AS delta FROM new_rows WHERE deleted_at IS NULL
+            ) changes
+            GROUP BY user_id, status, priority
+            HAVING sum(delta) <> 0
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = s.task_count + EXCLUDED.task_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            -- UPDATE only: when the user itself is being deleted its counter rows are already gone
+            UPDATE user_task_stats s SET task_count = s.task_count - d.removed
+            FROM (
+                SELECT user_id, status, priority, count(*) AS removed
+                FROM old_rows WHERE deleted_at IS NULL GROUP BY user_id, status, priority
+            ) d
+            WHERE s.user_id = d.user_id AND s.status = d.status AND s.priority = d.priority;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION user_task_stats_insert()
+        """,
+        """
+        CREATE TRIGGER tasks_stats_update AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION user_task_stats_update()
+        """,
+        """
+        CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION user_task_stats_delete()
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+            SELECT user_id, due_date::date, count(*) FROM new_rows
+            WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+            GROUP BY user_id, due_date::date
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO user_task_due_stats AS s (user_id, due_on, open_count)
+            SELECT user_id, due_on, sum(delta) FROM (
+                SELECT user_id, due_date::date AS due_on, -1 AS delta FROM old_rows
+                WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+                UNION ALL
+                SELECT user_id, due_date::date AS due_on, 1 AS delta FROM new_rows
+                WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+            ) changes
+            GROUP BY user_id, due_on
+            HAVING sum(delta) <> 0
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = s.open_count + EXCLUDED.open_count;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION user_task_due_stats_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE user_task_due_stats s SET open_count = s.open_count - d.removed
+            FROM (
+                SELECT user_id, due_date::date AS due_on, count(*) AS removed FROM old_rows
+                WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL
+                GROUP BY user_id, due_date::date
+            ) d
+            WHERE s.user_id = d.user_id AND s.due_on = d.due_on;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER tasks_due_stats_insert AFTER INSERT ON tasks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION user_task_due_stats_insert()
+        """,
+        """
+        CREATE TRIGGER tasks_due_stats_update AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION user_task_due_stats_update()
+        """,
+        """
+        CREATE TRIGGER tasks_due_stats_delete AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION user_task_due_stats_delete()
+        """,
+    ],
+    "sqlite": [
+        """
+        CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks WHEN NEW.deleted_at IS NULL BEGIN
+            INSERT INTO user_task_stats (user_id, status, priority, task_count)
+            VALUES (NEW.user_id, NEW.status, NEW.priority, 1)
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = task_count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_stats_update AFTER UPDATE OF user_id, status, priority, deleted_at ON tasks
+        WHEN OLD.user_id IS NOT NEW.user_id OR OLD.status IS NOT NEW.status OR OLD.priority IS NOT NEW.priority
+            OR OLD.deleted_at IS NOT NEW.deleted_at
+        BEGIN
+            UPDATE user_task_stats SET task_count = task_count - 1
+            WHERE OLD.deleted_at IS NULL
+                AND user_id = OLD.user_id AND status = OLD.status AND priority = OLD.priority;
+            INSERT INTO user_task_stats (user_id, status, priority, task_count)
+            SELECT NEW.user_id, NEW.status, NEW.priority, 1
+            WHERE NEW.deleted_at IS NULL
+            ON CONFLICT (user_id, status, priority) DO UPDATE SET task_count = task_count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks WHEN OLD.deleted_at IS NULL BEGIN
+            UPDATE user_task_stats SET task_count = task_count - 1
+            WHERE user_id = OLD.user_id AND status = OLD.status AND priority = OLD.priority;
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_due_stats_insert AFTER INSERT ON tasks
+        WHEN NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL
+        BEGIN
+            INSERT INTO user_task_due_stats (user_id, due_on, open_count)
+            VALUES (NEW.user_id, date(NEW.due_date), 1)
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = open_count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_due_stats_update AFTER UPDATE OF user_id, status, due_date, deleted_at ON tasks
+        WHEN OLD.user_id IS NOT NEW.user_id OR OLD.status IS NOT NEW.status OR OLD.due_date IS NOT NEW.due_date
+            OR OLD.deleted_at IS NOT NEW.deleted_at
+        BEGIN
+            UPDATE user_task_due_stats SET open_count = open_count - 1
+            WHERE OLD.due_date IS NOT NULL AND OLD.status <> 2 AND OLD.deleted_at IS NULL
+                AND user_id = OLD.user_id AND due_on = date(OLD.due_date);
+            INSERT INTO user_task_due_stats (user_id, due_on, open_count)
+            SELECT NEW.user_id, date(NEW.due_date), 1
+            WHERE NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL
+            ON CONFLICT (user_id, due_on) DO UPDATE SET open_count = open_count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER tasks_due_stats_delete AFTER DELETE ON tasks
+        WHEN OLD.due_date IS NOT NULL AND OLD.status <> 2 AND OLD.deleted_at IS NULL
+        BEGIN
+            UPDATE user_task_due_stats SET open_count = open_count - 1
+            WHERE user_id = OLD.user_id AND due_on = date(OLD.due_date);
+        END
+        """,
+    ],
+}
+
+# Sync change log
+#
+# Triggers on tasks, task_lists, checklists and checklist_items upsert a sync_changes row
+# with the next change_seq on every insert and update, and turn it into a tombstone on
+# delete (ON DELETE CASCADE included). Checklists and items have no user_id; they take it
+# from their task when inserted. Entity codes follow SyncEntity: task=0, task_list=1,
+# checklist=2, checklist_item=3. Migration 0012 creates the same objects on existing databases.
+#
+# Archiving copies a task and its children into the archive tables before deleting them, so
+# a delete whose row is already in SYNC_ARCHIVES' table is a move, not a deletion: it leaves
+# the log row alone and clients keep the (still listable) entity. Migration 0015 added that.
+#
+# Tombstoning a task hides its checklists and items, and restoring it brings them back, but
+# neither touches their rows. So setting or clearing tasks.deleted_at re-logs the task's
+# children with fresh change_seqs (tasks_sync_tombstone), and the reader reports children of a
+# tombstoned task as tombstones. Migration 0016 added that.
+#
+# Postgres draws change_seq from a sequence. Sequence values are handed out in call order
+# but become visible in commit order, so each statement first takes a transaction-scoped
+# advisory lock per affected user: a user's changes then commit in change_seq order and a
+# sync never moves past a change that is still in flight. SQLite serializes writers, so a
+# one-row counter table is enough.
+
+SYNC_TABLES = [
+    # (table, entity code, owner of NEW on SQLite, owner join on Postgres)
+    ("tasks", 0, "NEW.user_id", "SELECT n.id, n.user_id FROM new_rows n"),
+    ("task_lists", 1, "NEW.user_id", "SELECT n.id, n.user_id FROM new_rows n"),
+    (
+        "checklists", 2,
+        "(SELECT user_id FROM tasks WHERE id = NEW.task_id)",
+        "SELECT n.id, t.user_id FROM new_rows n JOIN tasks t ON t.id = n.task_id",
+    ),
+    (
+        "checklist_items", 3,
+        "(SELECT t.user_id FROM checklists c JOIN tasks t ON t.id = c.task_id WHERE c.id = NEW.checklist_id)",
+        "SELECT n.id, t.user_id FROM new_rows n JOIN checklists c ON c.id = n.checklist_id "
+        "JOIN tasks t ON t.id = c.task_id",
+    ),
+]
+
+# Archive table per entity table; task lists are never archived
+SYNC_ARCHIVES = {
+    "tasks": "archived_tasks",
+    "checklists": "archived_checklists",
+    "checklist_items": "archived_checklist_items",
+}
+
+def _sync_not_archived(table: str, row_id: str, keyword: str) -> str:
+    """`keyword` and a condition skipping rows moved to the archive, or nothing if the table has none."""
+    archive = SYNC_ARCHIVES.get(table)
+    return f" {keyword} NOT EXISTS (SELECT 1 FROM {archive} a WHERE a.id = {row_id})" if archive else ""
+
+SYNC_DDL = {
+    "postgresql": [
+        "CREATE SEQUENCE IF NOT EXISTS sync_change_seq",
+        """
+        CREATE OR REPLACE FUNCTION sync_lock_users(p_user_ids uuid[]) RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            v_user_id uuid;
+        BEGIN
+            -- Always in the same order, so statements touching several users cannot deadlock
+            FOR v_user_id IN SELECT DISTINCT u FROM unnest(p_user_ids) AS u ORDER BY u LOOP
+                PERFORM pg_advisory_xact_lock(hashtextextended(v_user_id::text, 0));
+            END LOOP;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION sync_changes_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM sync_lock_users(ARRAY(
+                SELECT s.user_id FROM sync_changes s JOIN new_rows n ON s.entity_id = n.id
+                WHERE s.entity_type = TG_ARGV[0]::smallint
+            ));
+            -- Rows left as they were, or where only the derived tasks.search_vector moved, are not changes
+            UPDATE sync_changes s SET change_seq = nextval('sync_change_seq')
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE s.entity_type = TG_ARGV[0]::smallint AND s.entity_id = n.id
+                AND to_jsonb(n) - 'search_vector' IS DISTINCT FROM to_jsonb(o) - 'search_vector';
+            RETURN NULL;
+        END
+        $$
+        """,
+    ] + [
+        statement
+        for table, code, _, owned in SYNC_TABLES
+        for statement in (
+            f"""
+            CREATE OR REPLACE FUNCTION {table}_sync_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+            BEGIN
+                PERFORM sync_lock_users(ARRAY(SELECT user_id FROM ({owned}) owned));
+                INSERT INTO sync_changes (entity_type, entity_id, user_id, change_seq, deleted)
+                SELECT {code}, id, user_id, nextval('sync_change_seq'), false FROM ({owned}) owned
+                ON CONFLICT (entity_type, entity_id) DO UPDATE
+                SET user_id = EXCLUDED.user_id, change_seq = EXCLUDED.change_seq, deleted = false;
+                RETURN NULL;
+            END
+            $$
+            """,
+            f"""
+            CREATE TRIGGER {table}_sync_insert AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_sync_insert()
+            """,
+            f"""
+            CREATE TRIGGER {table}_sync_update AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION sync_changes_update('{code}')
+            """,
+            f"""
+            CREATE OR REPLACE FUNCTION {table}_sync_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+            BEGIN
+                PERFORM sync_lock_users(ARRAY(
+                    SELECT s.user_id FROM sync_changes s JOIN old_rows o ON s.entity_id = o.id
+                    WHERE s.entity_type = {code}
+                ));
+                UPDATE sync_changes s SET change_seq = nextval('sync_change_seq'), deleted = true
+                FROM old_rows o
+                WHERE s.entity_type = {code} AND s.entity_id = o.id{_sync_not_archived(table, "o.id", "AND")};
+                RETURN NULL;
+            END
+            $$
+            """,
+            f"""
+            CREATE TRIGGER {table}_sync_delete AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_sync_delete()
+            """,
+        )
+    ],
+    "sqlite": [
+        "CREATE TABLE sync_sequence (id INTEGER PRIMARY KEY CHECK (id = 1), value INTEGER NOT NULL)",
+        "INSERT INTO sync_sequence (id, value) VALUES (1, 0)",
+    ] + [
+        statement
+        for table, code, owner, _ in SYNC_TABLES
+        for statement in (
+            f"""
+            CREATE TRIGGER {table}_sync_insert AFTER INSERT ON {table} BEGIN
+                UPDATE sync_sequence SET value = value + 1;
+                INSERT INTO sync_changes (entity_type, entity_id, user_id, change_seq, deleted)
+                VALUES ({code}, NEW.id, {owner}, (SELECT value FROM sync_sequence), 0)
+                ON CONFLICT (entity_type, entity_id) DO UPDATE
+                SET user_id = excluded.user_id, change_seq = excluded.change_seq, deleted = 0;
+            END
+            """,
+            f"""
+            CREATE TRIGGER {table}_sync_update AFTER UPDATE ON {table} BEGIN
+                UPDATE sync_sequence SET value = value + 1;
+                UPDATE sync_changes SET change_seq = (SELECT value FROM sync_sequence)
+                WHERE entity_type = {code} AND entity_id = NEW.id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER {table}_sync_delete AFTER DELETE ON {table}{_sync_not_archived(table, "OLD.id", "WHEN")}
+            BEGIN
+                UPDATE sync_sequence SET value = value + 1;
+                UPDATE sync_changes SET change_seq = (SELECT value FROM sync_sequence), deleted = 1
+                WHERE entity_type = {code} AND entity_id = OLD.id;
+            END
+            """,
+        )
+    ],
+}
+
+# Re-logs the checklists and items of tasks whose tombstone was set or cleared (see above)
+TASKS_SYNC_TOMBSTONE_DDL = {
+    "postgresql": [
+        """
+        CREATE OR REPLACE FUNCTION tasks_sync_tombstone() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM sync_lock_users(ARRAY(
+                SELECT n.user_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE (n.deleted_at IS NULL) <> (o.deleted_at IS NULL)
+            ));
+            WITH flipped AS (
+                SELECT n.id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE (n.deleted_at IS NULL) <> (o.deleted_at IS NULL)
+            ), children AS (
+                SELECT 2 AS entity_type, c.id AS entity_id FROM flipped f JOIN checklists c ON c.task_id = f.id
+                UNION ALL
+                SELECT 3, i.id FROM flipped f JOIN checklists c ON c.task_id = f.id
+                JOIN checklist_items i ON i.checklist_id = c.id
+            )
+            UPDATE sync_changes s SET change_seq = nextval('sync_change_seq')
+            FROM children
+            WHERE s.entity_type = children.entity_type AND s.entity_id = children.entity_id;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER tasks_sync_tombstone AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION tasks_sync_tombstone()
+        """,
+    ],
+    "sqlite": [
+        # A no-op update fires the children's own sync triggers, one change_seq per row
+        """
+        CREATE TRIGGER tasks_sync_tombstone AFTER UPDATE OF deleted_at ON tasks
+        WHEN (OLD.deleted_at IS NULL) <> (NEW.deleted_at IS NULL)
+        BEGIN
+            UPDATE checklists SET title = title WHERE task_id = NEW.id;
+            UPDATE checklist_items SET position = position
+            WHERE checklist_id IN (SELECT id FROM checklists WHERE task_id = NEW.id);
+        END
+        """,
+    ],
+}
+
+SYNC_DROP_DDL = {
+    "sqlite": ["DROP TABLE IF EXISTS sync_sequence"],
+}
+
+# Reminders
+#
+# A task has a reminders row while it has a due date, is not done (`status <> 2`) and is
+# not tombstoned; fire_at is REMINDER_LEAD_HOURS before the due date. Triggers on tasks
+# add the row when a task becomes eligible or its due date moves, and drop it when the
+# task stops being eligible; ON DELETE CASCADE covers deleted and archived tasks. Other
+# updates leave the row alone, so a reminder already sent is not queued again. The lead
+# time is part of the trigger SQL: migration 0013 creates the same objects, and changing
+# the lead needs a migration too.
+
+REMINDER_LEAD_HOURS = 24
+
+REMINDER_DDL = {
+    "postgresql": [
+        f"""
+        CREATE OR REPLACE FUNCTION reminders_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO reminders (task_id, due_date, fire_at)
+            SELECT id, due_date, due_date - interval '{REMINDER_LEAD_HOURS} hours' FROM new_rows
+            WHERE due_date IS NOT NULL AND status <> 2 AND deleted_at IS NULL;
+            RETURN NULL;
+        END
+        $$
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION reminders_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM reminders r USING new_rows n
+            WHERE r.task_id = n.id AND NOT (n.due_date IS NOT NULL AND n.status <> 2 AND n.deleted_at IS NULL);
+            INSERT INTO reminders (task_id, due_date, fire_at)
+            SELECT n.id, n.due_date, n.due_date - interval '{REMINDER_LEAD_HOURS} hours'
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE n.due_date IS NOT NULL AND n.status <> 2 AND n.deleted_at IS NULL
+                AND (o.due_date IS DISTINCT FROM n.due_date OR o.status = 2 OR o.deleted_at IS NOT NULL)
+            ON CONFLICT (task_id) DO UPDATE SET due_date = EXCLUDED.due_date, fire_at = EXCLUDED.fire_at;
+            RETURN NULL;
+        END
+        $$
+        """,
+        """
+        CREATE TRIGGER tasks_reminders_insert AFTER INSERT ON tasks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION reminders_insert()
+        """,
+        """
+        CREATE TRIGGER tasks_reminders_update AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION reminders_update()
+        """,
+    ],
+    "sqlite": [
+        f"""
+        CREATE TRIGGER tasks_reminders_insert AFTER INSERT ON tasks
+        WHEN NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL BEGIN
+            INSERT INTO reminders (task_id, due_date, fire_at)
+            VALUES (NEW.id, NEW.due_date, datetime(NEW.due_date, '-{REMINDER_LEAD_HOURS} hours'));
+        END
+        """,
+        f"""
+        CREATE TRIGGER tasks_reminders_update AFTER UPDATE OF due_date, status, deleted_at ON tasks BEGIN
+            DELETE FROM reminders
+            WHERE task_id = NEW.id AND NOT (NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL);
+            INSERT INTO reminders (task_id, due_date, fire_at)
+            SELECT NEW.id, NEW.due_date, datetime(NEW.due_date, '-{REMINDER_LEAD_HOURS} hours')
+            WHERE NEW.due_date IS NOT NULL AND NEW.status <> 2 AND NEW.deleted_at IS NULL
+                AND (OLD.due_date IS NOT NEW.due_date OR OLD.status = 2 OR OLD.deleted_at IS NOT NULL)
+            ON CONFLICT (task_id) DO UPDATE SET due_date = excluded.due_date, fire_at = excluded.fire_at;
+        END
+        """,
+    ],
+}
+
+def include_name(name, type_, parent_names) -> bool:
+    """Alembic autogenerate filter: skip the trigger-maintained SQLite search tables and sync counter."""
+    return not (type_ == "table" and (name.startswith("tasks_fts") or name == "sync_sequence"))
+
+for _ddl in (SEARCH_DDL, TAG_DDL, STATS_DDL, SYNC_DDL, TASKS_SYNC_TOMBSTONE_DDL, REMINDER_DDL):
+    for _dialect, _statements in _ddl.items():
+        for _statement in _statements:
+            event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+for _drop_ddl in (SEARCH_DROP_DDL, SYNC_DROP_DDL):
+    for _dialect, _statements in _drop_ddl.items():
+        for _statement in _statements:
+            event.listen(Base.metadata, "before_drop", DDL(_statement).execute_if(dialect=_dialect))
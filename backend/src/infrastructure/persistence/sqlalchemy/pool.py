@@ -0,0 +1,62 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time to check out a pooled connection: waiting for a free slot, opening one, and pre-ping",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out",
+    ["pool"],
+)
+POOL_SATURATION = Gauge(
+    "db_pool_saturation_ratio",
+    "Checked-out connections over pool_size + max_overflow",
+    ["pool"],
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that exports checkout latency and saturation.
+    Series are labelled with the engine's pool_logging_name, so every engine
+    (primary, replicas) reports separately.
+    """
+
+    @property
+    def _metrics_label(self) -> str:
+        return self.logging_name or "default"
+
+    def _record_usage(self) -> None:
+        in_use = self.checkedout()
+        # max_overflow of -1 means unbounded; report against the steady-state size then
+        capacity = self.size() + max(self._max_overflow, 0)
+        POOL_CONNECTIONS_IN_USE.labels(pool=self._metrics_label).set(in_use)
+        POOL_SATURATION.labels(pool=self._metrics_label).set(in_use / capacity if capacity else 0.0)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(pool=self._metrics_label).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_SECONDS.labels(pool=self._metrics_label).observe(time.perf_counter() - start)
+        self._record_usage()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._record_usage()
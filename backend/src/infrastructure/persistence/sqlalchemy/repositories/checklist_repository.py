@@ -1,6 +1,6 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, insert, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -13,27 +13,22 @@ class SQLAlchemyChecklistRepository(IChecklistRepository):
         self.session = session
 
     async def create_checklist(self, checklist: Checklist) -> Checklist:
-        model = ChecklistModel(
-            id=checklist.id,
-            task_id=checklist.task_id,
-            title=checklist.title,
-            created_at=checklist.created_at,
-            updated_at=checklist.updated_at
+        # A new checklist has no items, so the entity plus stored timestamps is the full answer
+        result = await self.session.execute(
+            insert(ChecklistModel)
+            .values(
+                id=checklist.id,
+                task_id=checklist.task_id,
+                title=checklist.title,
+                created_at=checklist.created_at,
+                updated_at=checklist.updated_at
+            )
+            .returning(ChecklistModel.created_at, ChecklistModel.updated_at)
         )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        # Eagerly load items relationship (even if empty) to avoid greenlet error
-        query = (
-            select(ChecklistModel)
-            .where(ChecklistModel.id == checklist.id)
-            .options(selectinload(ChecklistModel.items))
+        stored = result.one()
+        return checklist.model_copy(
+            update={"items": [], "created_at": stored.created_at, "updated_at": stored.updated_at}
         )
-        result = await self.session.execute(query)
-        model_with_items = result.scalar_one()
-        # Sort items by position to maintain order
-        model_with_items.items = sorted(model_with_items.items, key=lambda x: (x.position, x.created_at))
-        return Checklist.model_validate(model_with_items)
 
     async def get_checklist_by_id(self, checklist_id: UUID) -> Optional[Checklist]:
         query = (
@@ -50,29 +45,26 @@ class SQLAlchemyChecklistRepository(IChecklistRepository):
         return None
 
     async def delete_checklist(self, checklist_id: UUID) -> bool:
-        # Use ORM delete to respect cascade relationships (items will be deleted automatically)
-        query = select(ChecklistModel).where(ChecklistModel.id == checklist_id)
+        # Items go with it through ON DELETE CASCADE
+        query = delete(ChecklistModel).where(ChecklistModel.id == checklist_id).returning(ChecklistModel.id)
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none()
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
-            return True
-        return False
+        return result.scalar_one_or_none() is not None
 
     async def add_item(self, item: ChecklistItem) -> ChecklistItem:
-        model = ChecklistItemModel(
-            id=item.id,
-            checklist_id=item.checklist_id,
-            content=item.content,
-            is_completed=item.is_completed,
-            position=item.position,
-            created_at=item.created_at
+        result = await self.session.execute(
+            insert(ChecklistItemModel)
+            .values(
+                id=item.id,
+                checklist_id=item.checklist_id,
+                content=item.content,
+                is_completed=item.is_completed,
+                position=item.position,
+                created_at=item.created_at
+            )
+            .returning(ChecklistItemModel.created_at)
         )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        return ChecklistItem.model_validate(model)
+        stored = result.one()
+        return item.model_copy(update={"created_at": stored.created_at})
 
     async def update_item(self, item: ChecklistItem) -> ChecklistItem:
         query = select(ChecklistItemModel).where(ChecklistItemModel.id == item.id)
@@ -82,21 +74,15 @@ class SQLAlchemyChecklistRepository(IChecklistRepository):
             model.content = item.content
             model.is_completed = item.is_completed
             model.position = item.position
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(model)
             return ChecklistItem.model_validate(model)
         return item
 
     async def delete_item(self, item_id: UUID) -> bool:
-        # Use ORM delete
-        query = select(ChecklistItemModel).where(ChecklistItemModel.id == item_id)
+        query = delete(ChecklistItemModel).where(ChecklistItemModel.id == item_id).returning(ChecklistItemModel.id)
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none()
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
-            return True
-        return False
+        return result.scalar_one_or_none() is not None
 
     async def get_item_by_id(self, item_id: UUID) -> Optional[ChecklistItem]:
         query = select(ChecklistItemModel).where(ChecklistItemModel.id == item_id)
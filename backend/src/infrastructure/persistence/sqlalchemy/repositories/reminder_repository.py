@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy import select, delete, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.entities.models import Reminder
+from backend.src.domain.ports.repositories.base import IReminderRepository
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
+    ReminderModel, ReminderDeliveryModel, TaskModel
+)
+
+
+class SQLAlchemyReminderRepository(IReminderRepository):
+    """Takes due rows off the trigger-maintained reminders table and keeps the delivery ledger."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def pop_due(self, now: datetime, limit: int) -> List[Reminder]:
+        # A range read on ix_reminders_fire_at; SKIP LOCKED lets several workers drain the queue at once
+        due = (
+            select(ReminderModel.task_id)
+            .where(ReminderModel.fire_at <= now)
+            .order_by(ReminderModel.fire_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            delete(ReminderModel)
+            .where(ReminderModel.task_id.in_(due.scalar_subquery()))
+            .returning(ReminderModel.task_id, ReminderModel.due_date)
+        )
+        popped = {row.task_id: row.due_date for row in result.all()}
+        if not popped:
+            return []
+
+        result = await self.session.execute(
+            select(TaskModel.id, TaskModel.user_id, TaskModel.title).where(TaskModel.id.in_(popped))
+        )
+        reminders = [
+            Reminder(task_id=row.id, user_id=row.user_id, title=row.title, due_date=popped[row.id])
+            for row in result.all()
+        ]
+        return sorted(reminders, key=lambda reminder: reminder.due_date)
+
+    async def record_deliveries(self, reminders: List[Reminder], delivered_at: datetime) -> List[Reminder]:
+        if not reminders:
+            return []
+        insert = postgresql.insert if self.session.bind.dialect.name == "postgresql" else sqlite.insert
+        # The batch is checked and claimed in one statement: keys already in the ledger are not returned
+        result = await self.session.execute(
+            insert(ReminderDeliveryModel)
+            .values([
+                {
+                    "task_id": reminder.task_id,
+                    "due_date": reminder.due_date,
+                    "kind": reminder.kind,
+                    "delivered_at": delivered_at,
+                }
+                for reminder in reminders
+            ])
+            .on_conflict_do_nothing()
+            .returning(ReminderDeliveryModel.task_id, ReminderDeliveryModel.due_date, ReminderDeliveryModel.kind)
+        )
+        recorded = {tuple(row) for row in result.all()}
+        return [
+            reminder for reminder in reminders
+            if (reminder.task_id, reminder.due_date, reminder.kind) in recorded
+        ]
+
+    async def prune_deliveries(self, before: datetime, limit: int) -> int:
+        key = (ReminderDeliveryModel.task_id, ReminderDeliveryModel.due_date, ReminderDeliveryModel.kind)
+        expired = (
+            select(*key)
+            .where(ReminderDeliveryModel.due_date < before)
+            .order_by(ReminderDeliveryModel.due_date)
+            .limit(limit)
+        )
+        result = await self.session.execute(delete(ReminderDeliveryModel).where(tuple_(*key).in_(expired)))
+        return result.rowcount
@@ -0,0 +1,108 @@
+from typing import Dict, List, Set
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.entities.models import (
+    TaskList, Checklist, ChecklistItem, SyncEntity, SyncTombstone, SyncChanges
+)
+from backend.src.domain.ports.repositories.base import ISyncRepository
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
+    SyncChangeModel, TaskModel, TaskListModel, ChecklistModel, ChecklistItemModel
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import (
+    ARCHIVE, LIVE, task_from_row
+)
+
+# A row archived after its last logged change is read from the archive, so that change still arrives
+ARCHIVED = dict(zip(LIVE, ARCHIVE))
+
+class SQLAlchemySyncRepository(ISyncRepository):
+    """Reads the trigger-maintained sync_changes log, then loads the changed rows per entity type."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _rows(self, model, ids: List[UUID]):
+        """The rows with these ids, live or archived, in the order given (change order)."""
+        if not ids:
+            return []
+        result = await self.session.execute(select(*model.__table__.columns).where(model.id.in_(ids)))
+        rows = result.all()
+        missing = set(ids) - {row.id for row in rows}
+        archive = ARCHIVED.get(model)
+        if missing and archive is not None:
+            result = await self.session.execute(select(*archive.__table__.columns).where(archive.id.in_(missing)))
+            rows += result.all()
+        position = {entity_id: i for i, entity_id in enumerate(ids)}
+        return sorted(rows, key=lambda row: position[row.id])
+
+    async def _in_tombstoned_tasks(self, checklist_ids: List[UUID], item_ids: List[UUID]) -> Set[UUID]:
+        """The checklists and checklist items among these whose task is tombstoned."""
+        tombstoned = TaskModel.deleted_at.isnot(None)
+        hidden: Set[UUID] = set()
+        if checklist_ids:
+            result = await self.session.execute(
+                select(ChecklistModel.id).join(TaskModel, TaskModel.id == ChecklistModel.task_id)
+                .where(ChecklistModel.id.in_(checklist_ids), tombstoned)
+            )
+            hidden.update(result.scalars().all())
+        if item_ids:
+            result = await self.session.execute(
+                select(ChecklistItemModel.id)
+                .join(ChecklistModel, ChecklistModel.id == ChecklistItemModel.checklist_id)
+                .join(TaskModel, TaskModel.id == ChecklistModel.task_id)
+                .where(ChecklistItemModel.id.in_(item_ids), tombstoned)
+            )
+            hidden.update(result.scalars().all())
+        return hidden
+
+    async def changes_since(self, user_id: UUID, since: int, limit: int) -> SyncChanges:
+        # One range read on ix_sync_changes_user_seq; with nothing new it is the only query
+        result = await self.session.execute(
+            select(
+                SyncChangeModel.entity_type, SyncChangeModel.entity_id,
+                SyncChangeModel.change_seq, SyncChangeModel.deleted
+            )
+            .where(SyncChangeModel.user_id == user_id, SyncChangeModel.change_seq > since)
+            .order_by(SyncChangeModel.change_seq)
+            .limit(limit + 1)
+        )
+        log = result.all()
+        changes = SyncChanges(last_seq=since, has_more=len(log) > limit)
+        log = log[:limit]
+        if not log:
+            return changes
+        changes.last_seq = log[-1].change_seq
+
+        changed: Dict[SyncEntity, List[UUID]] = {entity: [] for entity in SyncEntity}
+        for entry in log:
+            if entry.deleted:
+                changes.deleted.append(SyncTombstone(entity=entry.entity_type, id=entry.entity_id))
+            else:
+                changed[entry.entity_type].append(entry.entity_id)
+
+        # A row gone since the log was read has a newer tombstone, which the next sync reports
+        for row in await self._rows(TaskModel, changed[SyncEntity.TASK]):
+            # Archived rows have no tombstone column
+            if getattr(row, "deleted_at", None) is None:
+                changes.tasks.append(task_from_row(row))
+            else:
+                changes.deleted.append(SyncTombstone(entity=SyncEntity.TASK, id=row.id))
+        changes.task_lists = [
+            TaskList.model_validate(row) for row in await self._rows(TaskListModel, changed[SyncEntity.TASK_LIST])
+        ]
+        checklists = await self._rows(ChecklistModel, changed[SyncEntity.CHECKLIST])
+        items = await self._rows(ChecklistItemModel, changed[SyncEntity.CHECKLIST_ITEM])
+        # Children of a tombstoned task go with it; its restore logs them again
+        hidden = await self._in_tombstoned_tasks([row.id for row in checklists], [row.id for row in items])
+        for entity, rows, target, entity_class in (
+            (SyncEntity.CHECKLIST, checklists, changes.checklists, Checklist),
+            (SyncEntity.CHECKLIST_ITEM, items, changes.checklist_items, ChecklistItem),
+        ):
+            for row in rows:
+                if row.id in hidden:
+                    changes.deleted.append(SyncTombstone(entity=entity, id=row.id))
+                else:
+                    target.append(entity_class.model_validate(row))
+        return changes
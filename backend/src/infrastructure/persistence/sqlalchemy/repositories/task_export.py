@@ -0,0 +1,103 @@
+from typing import AsyncIterator, Callable, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.config import settings
+from backend.src.domain.entities.models import Task, TaskSort, Checklist, ChecklistItem
+from backend.src.domain.ports.repositories.base import ITaskExport
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import (
+    TaskTables, LIVE, ARCHIVE, NOT_DELETED, apply_task_filters, apply_task_sort, task_from_row
+)
+
+
+class SQLAlchemyTaskExport(ITaskExport):
+    """
+    Streams a user's tasks from a server-side cursor. An export outlives the request's
+    session (the response is still being written after the endpoint returns), so each
+    stream opens its own read session from `session_factory`.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self.session_factory = session_factory
+
+    def _query(self, tables: TaskTables, user_id: UUID, filters: Optional[dict], with_checklist_items: bool):
+        task, _, checklist, item = tables
+        columns = list(task.__table__.columns)
+        if with_checklist_items:
+            columns += [
+                checklist.id.label("checklist_id"),
+                checklist.title.label("checklist_title"),
+                checklist.created_at.label("checklist_created_at"),
+                checklist.updated_at.label("checklist_updated_at"),
+                item.id.label("item_id"),
+                item.content.label("item_content"),
+                item.is_completed.label("item_is_completed"),
+                item.position.label("item_position"),
+                item.created_at.label("item_created_at"),
+            ]
+        query = apply_task_filters(select(*columns).where(task.user_id == user_id), filters, task)
+        if task is LIVE.task:
+            query = query.where(NOT_DELETED)
+        if with_checklist_items:
+            # One row per item; a task's rows stay together because the task order comes first
+            query = (
+                query.outerjoin(checklist, checklist.task_id == task.id)
+                .outerjoin(item, item.checklist_id == checklist.id)
+            )
+        query = apply_task_sort(query, TaskSort.NEWEST, None, task)
+        if with_checklist_items:
+            query = query.order_by(checklist.created_at, checklist.id, item.position, item.id)
+        return query.execution_options(yield_per=settings.TASK_EXPORT_BATCH_SIZE)
+
+    @staticmethod
+    def _add_item(task: Task, row) -> None:
+        if row.checklist_id is None:
+            return
+        if not task.checklists or task.checklists[-1].id != row.checklist_id:
+            task.checklists.append(Checklist(
+                id=row.checklist_id,
+                task_id=task.id,
+                title=row.checklist_title,
+                created_at=row.checklist_created_at,
+                updated_at=row.checklist_updated_at,
+            ))
+        if row.item_id is not None:
+            task.checklists[-1].items.append(ChecklistItem(
+                id=row.item_id,
+                checklist_id=row.checklist_id,
+                content=row.item_content,
+                is_completed=row.item_is_completed,
+                position=row.item_position,
+                created_at=row.item_created_at,
+            ))
+
+    async def _stream(
+        self, session: AsyncSession, tables: TaskTables, user_id: UUID, filters: Optional[dict],
+        with_checklist_items: bool
+    ) -> AsyncIterator[Task]:
+        result = await session.stream(self._query(tables, user_id, filters, with_checklist_items))
+        current: Optional[Task] = None
+        async for row in result:
+            if current is not None and current.id == row.id:
+                self._add_item(current, row)
+                continue
+            if current is not None:
+                yield current
+            current = task_from_row(row)
+            if with_checklist_items:
+                self._add_item(current, row)
+        if current is not None:
+            yield current
+
+    async def stream_by_user(
+        self,
+        user_id: UUID,
+        filters: dict = None,
+        with_checklist_items: bool = False,
+        include_archived: bool = False
+    ) -> AsyncIterator[Task]:
+        async with self.session_factory() as session:
+            for tables in (LIVE, ARCHIVE) if include_archived else (LIVE,):
+                async for task in self._stream(session, tables, user_id, filters, with_checklist_items):
+                    yield task
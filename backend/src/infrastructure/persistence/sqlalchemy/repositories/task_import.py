@@ -0,0 +1,84 @@
+from typing import List
+import asyncpg
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.entities.models import Task, Checklist, ChecklistItem
+from backend.src.domain.ports.repositories.base import ITaskImport
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
+    TaskModel, ChecklistModel, ChecklistItemModel
+)
+from backend.src.infrastructure.persistence.sqlalchemy.routing import WROTE
+
+
+class SQLAlchemyTaskImport(ITaskImport):
+    """
+    Loads imported rows with COPY on Postgres (asyncpg's binary copy_records_to_table)
+    and with an executemany INSERT elsewhere. Row triggers (search, counters, sync log)
+    fire for COPY just as for INSERT.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def load(self, tasks: List[Task], checklists: List[Checklist], items: List[ChecklistItem]) -> None:
+        # A savepoint, so a rejected batch leaves the caller's transaction usable for the next one
+        try:
+            async with self.session.begin_nested():
+                await self._load_all(tasks, checklists, items)
+        # COPY runs on the raw asyncpg connection, so its errors are not wrapped in DBAPIError
+        except (DBAPIError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            raise ValueError(f"Database error: {getattr(e, 'orig', e)}") from e
+
+    async def _load_all(self, tasks: List[Task], checklists: List[Checklist], items: List[ChecklistItem]) -> None:
+        # Parents first, for the foreign keys
+        await self._load(TaskModel, [
+            dict(
+                id=task.id, user_id=task.user_id, task_list_id=task.task_list_id, title=task.title,
+                description=task.description, status=task.status, priority=task.priority,
+                due_date=task.due_date, tags=task.tags, created_at=task.created_at, updated_at=task.updated_at,
+            )
+            for task in tasks
+        ])
+        await self._load(ChecklistModel, [
+            dict(
+                id=checklist.id, task_id=checklist.task_id, title=checklist.title,
+                created_at=checklist.created_at, updated_at=checklist.updated_at,
+            )
+            for checklist in checklists
+        ])
+        await self._load(ChecklistItemModel, [
+            dict(
+                id=item.id, checklist_id=item.checklist_id, content=item.content,
+                is_completed=item.is_completed, position=item.position, created_at=item.created_at,
+            )
+            for item in items
+        ])
+
+    async def _load(self, model, rows: List[dict]) -> None:
+        if not rows:
+            return
+        connection = await self.session.connection()
+        dialect = connection.dialect
+        if dialect.name != "postgresql":
+            # Without RETURNING a list of parameters runs as one executemany
+            await self.session.execute(insert(model), rows)
+            return
+
+        # COPY skips SQLAlchemy's type handling, so apply each column's bind processing here
+        columns = list(rows[0])
+        processors = [
+            model.__table__.c[name].type.dialect_impl(dialect).bind_processor(dialect) for name in columns
+        ]
+        records = [
+            tuple(
+                process(row[name]) if process else row[name]
+                for name, process in zip(columns, processors)
+            )
+            for row in rows
+        ]
+        # COPY bypasses the ORM events that mark the session as having written
+        self.session.info[WROTE] = True
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(model.__tablename__, records=records, columns=columns)
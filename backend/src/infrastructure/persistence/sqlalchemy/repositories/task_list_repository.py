@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 from uuid import UUID
-from sqlalchemy import select, delete
+from sqlalchemy import select, insert, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -21,17 +21,28 @@ class SQLAlchemyTaskListRepository(ITaskListRepository):
         return None
 
     async def create(self, task_list: TaskList) -> TaskList:
-        model = TaskListModel(
-            id=task_list.id,
-            user_id=task_list.user_id,
-            name=task_list.name,
-            created_at=task_list.created_at,
-            updated_at=task_list.updated_at
+        result = await self.session.execute(
+            insert(TaskListModel)
+            .values(
+                id=task_list.id,
+                user_id=task_list.user_id,
+                name=task_list.name,
+                created_at=task_list.created_at,
+                updated_at=task_list.updated_at
+            )
+            .returning(TaskListModel.created_at, TaskListModel.updated_at)
         )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        return TaskList.model_validate(model)
+        stored = result.one()
+        return task_list.model_copy(update={"created_at": stored.created_at, "updated_at": stored.updated_at})
+
+    async def get_owned_ids(self, user_id: UUID, task_list_ids: List[UUID]) -> Set[UUID]:
+        if not task_list_ids:
+            return set()
+        query = select(TaskListModel.id).where(
+            TaskListModel.user_id == user_id, TaskListModel.id.in_(task_list_ids)
+        )
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
 
     async def list_by_user(self, user_id: UUID) -> List[TaskList]:
         query = select(TaskListModel).where(TaskListModel.user_id == user_id).order_by(TaskListModel.created_at)
@@ -46,14 +57,14 @@ class SQLAlchemyTaskListRepository(ITaskListRepository):
         if model:
             model.name = task_list.name
             model.updated_at = task_list.updated_at
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(model)
             return TaskList.model_validate(model)
         return task_list
 
     async def delete(self, task_list_id: UUID) -> bool:
-        query = delete(TaskListModel).where(TaskListModel.id == task_list_id)
+        # The list's tasks go with it through ON DELETE CASCADE
+        query = delete(TaskListModel).where(TaskListModel.id == task_list_id).returning(TaskListModel.id)
         result = await self.session.execute(query)
-        await self.session.commit()
-        return result.rowcount > 0
+        return result.scalar_one_or_none() is not None
 
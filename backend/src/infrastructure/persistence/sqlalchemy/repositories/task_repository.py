@@ -1,15 +1,133 @@
-from typing import Optional, List
+from typing import NamedTuple, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, or_
+from sqlalchemy import select, insert, update, delete, or_, tuple_, func, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from backend.src.domain.entities.models import Task, Attachment, TaskStatus, TaskPriority, Checklist, ChecklistItem
+from backend.src.domain.entities.models import (
+    Task, Attachment, TaskStatus, TaskPriority, TaskSort, Checklist, ChecklistItem, TaskSummary, TagCount, TaskStats
+)
 from backend.src.domain.ports.repositories.base import ITaskRepository
 from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
-    TaskModel, AttachmentModel, ChecklistModel, ChecklistItemModel
+    TaskModel, AttachmentModel, ChecklistModel, ChecklistItemModel, UserTaskStatsModel, UserTaskDueStatsModel,
+    ArchivedTaskModel, ArchivedAttachmentModel, ArchivedChecklistModel, ArchivedChecklistItemModel, utc_now
 )
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from enum import Enum
+
+def apply_task_filters(query, filters: Optional[dict], model=TaskModel):
+    """Applies list_by_user's filter keys to a query over TaskModel (or ArchivedTaskModel)."""
+    if not filters:
+        return query
+    if "status" in filters and filters["status"]:
+        query = query.where(model.status == filters["status"])
+    if "priority" in filters and filters["priority"]:
+        query = query.where(model.priority == filters["priority"])
+    if "task_list_id" in filters and filters["task_list_id"]:
+        query = query.where(model.task_list_id == filters["task_list_id"])
+    if "task_ids" in filters and filters["task_ids"] is not None:
+        query = query.where(model.id.in_(filters["task_ids"]))
+    if "tags" in filters and filters["tags"]:
+        if filters.get("tag_match") == "all":
+            query = query.where(model.tags.contains_all(filters["tags"]))
+        else:
+            query = query.where(model.tags.contains_any(filters["tags"]))
+    if "search" in filters and filters["search"]:
+        # Unranked substring fallback; ranked search goes through ITaskSearch
+        search_term = f"%{filters['search']}%"
+        query = query.where(
+            or_(
+                model.title.ilike(search_term),
+                model.description.ilike(search_term)
+            )
+        )
+    # Add other filters here...
+    return query
+
+# Descending sort fields ahead of the id tiebreaker; each sort has a matching
+# (user_id, ..., id) index on tasks, so a page is one index range scan
+DESCENDING_SORT_KEYS = {
+    TaskSort.NEWEST: ("created_at",),
+    TaskSort.PRIORITY: ("priority", "created_at"),
+    TaskSort.RECENTLY_UPDATED: ("updated_at",),
+}
+
+def apply_task_sort(query, sort: TaskSort, after: Optional[tuple], model=TaskModel):
+    """Orders a query over TaskModel by `sort` and, given the previous page's last sort key, seeks past it."""
+    if sort == TaskSort.DUE_DATE:
+        # Tasks without a due date come last; the row comparison never matches NULL, so they are a separate range
+        if after and after[0] is None:
+            query = query.where(model.due_date.is_(None), model.id > after[1])
+        elif after:
+            query = query.where(or_(
+                tuple_(model.due_date, model.id) > tuple(after),
+                model.due_date.is_(None),
+            ))
+        return query.order_by(model.due_date.asc().nulls_last(), model.id.asc())
+
+    columns = tuple(getattr(model, name) for name in DESCENDING_SORT_KEYS[sort]) + (model.id,)
+    if after:
+        # A plain tuple binds each value with its column's type (priority ordinals, UUIDs)
+        query = query.where(tuple_(*columns) < tuple(after))
+    return query.order_by(*(column.desc() for column in columns))
+
+def merge_sorted(pages: List[list], sort: TaskSort) -> list:
+    """Merges listings that are each in `sort` order into one, ordered as apply_task_sort would order it."""
+    rows = [row for page in pages for row in page]
+    if sort == TaskSort.DUE_DATE:
+        return sorted(rows, key=lambda row: (row.due_date is None, row.due_date or datetime.min, row.id))
+    priorities = list(TaskPriority)
+
+    def key(row):
+        values = [getattr(row, name) for name in DESCENDING_SORT_KEYS[sort]]
+        return tuple(priorities.index(v) if isinstance(v, TaskPriority) else v for v in values) + (row.id,)
+    return sorted(rows, key=key, reverse=True)
+
+class TaskTables(NamedTuple):
+    """A task table and its child tables: the live set or the archive, which share column names."""
+    task: type
+    attachment: type
+    checklist: type
+    item: type
+
+LIVE = TaskTables(TaskModel, AttachmentModel, ChecklistModel, ChecklistItemModel)
+ARCHIVE = TaskTables(ArchivedTaskModel, ArchivedAttachmentModel, ArchivedChecklistModel, ArchivedChecklistItemModel)
+
+# Tombstoned tasks are invisible to every read; only restore and the purge job look at them
+NOT_DELETED = TaskModel.deleted_at.is_(None)
+
+# Filters user_task_stats can answer without touching tasks
+COUNTER_FILTERS = {"status", "priority"}
+
+async def capped_count(session: AsyncSession, matches, cap: int) -> Tuple[int, bool]:
+    """Counts the rows of `matches` without reading more than cap + 1 of them; returns (total, exact)."""
+    result = await session.execute(select(func.count()).select_from(matches.limit(cap + 1).subquery()))
+    total = result.scalar_one()
+    return (total, True) if total <= cap else (cap, False)
+
+def active_filters(filters: Optional[dict]) -> set:
+    """The filter keys apply_task_filters would act on."""
+    return {
+        key for key, value in (filters or {}).items()
+        if key != "tag_match" and value is not None and (key == "task_ids" or value)
+    }
+
+def task_from_row(row) -> Task:
+    """Builds a Task from a row of tasks (or archived_tasks) columns; child collections are left empty."""
+    return Task(
+        id=row.id,
+        user_id=row.user_id,
+        task_list_id=row.task_list_id,
+        title=row.title,
+        description=row.description,
+        status=row.status,
+        priority=row.priority,
+        due_date=row.due_date,
+        tags=row.tags or [],
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        archived_at=getattr(row, "archived_at", None),
+    )
 
 class SQLAlchemyTaskRepository(ITaskRepository):
     def __init__(self, session: AsyncSession):
@@ -24,12 +142,13 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             task_list_id=model.task_list_id,
             title=model.title,
             description=model.description,
-            status=TaskStatus(model.status),
-            priority=TaskPriority(model.priority),
+            status=model.status,
+            priority=model.priority,
             due_date=model.due_date,
             tags=model.tags or [],
             created_at=model.created_at,
             updated_at=model.updated_at,
+            archived_at=getattr(model, "archived_at", None),
             attachments=[
                 Attachment(
                     id=a.id,
@@ -62,21 +181,32 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             ]
         )
 
-    def _to_model(self, entity: Task) -> TaskModel:
-        return TaskModel(
+    def _to_row(self, entity: Task) -> dict:
+        return dict(
             id=entity.id,
             user_id=entity.user_id,
             task_list_id=entity.task_list_id,
             title=entity.title,
             description=entity.description,
-            status=entity.status.value,
-            priority=entity.priority.value,
+            status=entity.status,
+            priority=entity.priority,
             due_date=entity.due_date,
             tags=entity.tags,
             created_at=entity.created_at,
             updated_at=entity.updated_at
         )
 
+    def _attachment_row(self, attachment: Attachment) -> dict:
+        return dict(
+            id=attachment.id,
+            task_id=attachment.task_id,
+            filename=attachment.filename,
+            file_url=attachment.file_url,
+            file_size_bytes=attachment.file_size_bytes,
+            content_type=attachment.content_type,
+            created_at=attachment.created_at,
+        )
+
     async def get_by_id(self, task_id: UUID) -> Optional[Task]:
         query = (
             select(TaskModel)
@@ -84,75 +214,179 @@ class SQLAlchemyTaskRepository(ITaskRepository):
                 selectinload(TaskModel.attachments),
                 selectinload(TaskModel.checklists).selectinload(ChecklistModel.items)
             )
-            .where(TaskModel.id == task_id)
+            .where(TaskModel.id == task_id, NOT_DELETED)
+        )
+        result = await self.session.execute(query)
+        model = result.scalar_one_or_none()
+        return self._to_domain(model)
+
+    async def get_archived_by_id(self, task_id: UUID) -> Optional[Task]:
+        query = (
+            select(ArchivedTaskModel)
+            .options(
+                selectinload(ArchivedTaskModel.attachments),
+                selectinload(ArchivedTaskModel.checklists).selectinload(ArchivedChecklistModel.items)
+            )
+            .where(ArchivedTaskModel.id == task_id)
         )
         result = await self.session.execute(query)
         model = result.scalar_one_or_none()
         return self._to_domain(model)
 
+    def _apply_listing(
+        self,
+        query,
+        model,
+        user_id: UUID,
+        filters: Optional[dict],
+        limit: int,
+        offset: int,
+        sort: TaskSort,
+        after: Optional[tuple]
+    ):
+        """Applies the shared owner filter, list filters, ordering and paging to a task query."""
+        query = apply_task_filters(query.where(model.user_id == user_id), filters, model)
+        if model is TaskModel:
+            query = query.where(NOT_DELETED)
+        # Keyset seek when `after` is given: no rows are skipped
+        query = apply_task_sort(query, sort, after, model)
+        if not after:
+            query = query.offset(offset)
+        return query.limit(limit)
+
+    async def _list_merged(self, list_page, limit: int, offset: int, sort: TaskSort, after: Optional[tuple]):
+        """
+        Lists the live tasks and the archive as one listing: each side returns its first
+        offset + limit rows in `sort` order (just `limit` past a keyset), and the merge keeps the page.
+        """
+        window = limit if after else offset + limit
+        pages = [await list_page(tables, window, 0) for tables in (LIVE, ARCHIVE)]
+        start = 0 if after else offset
+        return merge_sorted(pages, sort)[start:start + limit]
+
     async def list_by_user(
         self, 
         user_id: UUID, 
         filters: dict = None, 
         limit: int = 20, 
-        offset: int = 0
+        offset: int = 0,
+        sort: TaskSort = TaskSort.NEWEST,
+        after: Optional[tuple] = None,
+        include_archived: bool = False
     ) -> List[Task]:
-        query = (
-            select(TaskModel)
-            .options(
-                selectinload(TaskModel.attachments),
-                selectinload(TaskModel.checklists).selectinload(ChecklistModel.items)
-            )
-            .where(TaskModel.user_id == user_id)
-        )
-        
-        if filters:
-            if "status" in filters and filters["status"]:
-                query = query.where(TaskModel.status == filters["status"])
-            if "priority" in filters and filters["priority"]:
-                query = query.where(TaskModel.priority == filters["priority"])
-            if "task_list_id" in filters and filters["task_list_id"]:
-                query = query.where(TaskModel.task_list_id == filters["task_list_id"])
-            if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.where(
-                    or_(
-                        TaskModel.title.ilike(search_term),
-                        TaskModel.description.ilike(search_term)
-                    )
+        async def list_page(tables: TaskTables, limit: int, offset: int) -> List[Task]:
+            query = (
+                select(tables.task)
+                .options(
+                    selectinload(tables.task.attachments),
+                    selectinload(tables.task.checklists).selectinload(tables.checklist.items)
                 )
-            # Add other filters here...
+            )
+            query = self._apply_listing(query, tables.task, user_id, filters, limit, offset, sort, after)
+            result = await self.session.execute(query)
+            return [self._to_domain(model) for model in result.scalars().all()]
 
-        query = query.limit(limit).offset(offset).order_by(TaskModel.created_at.desc())
-        result = await self.session.execute(query)
-        models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+        if include_archived:
+            return await self._list_merged(list_page, limit, offset, sort, after)
+        return await list_page(LIVE, limit, offset)
+
+    async def list_summaries_by_user(
+        self,
+        user_id: UUID,
+        filters: dict = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort: TaskSort = TaskSort.NEWEST,
+        after: Optional[tuple] = None,
+        include_archived: bool = False
+    ) -> List[TaskSummary]:
+        async def list_page(tables: TaskTables, limit: int, offset: int) -> List[TaskSummary]:
+            task, attachment, checklist, item = tables
+            # Correlated counts keep this a single statement; child rows are never loaded
+            attachment_count = (
+                select(func.count(attachment.id))
+                .where(attachment.task_id == task.id)
+                .correlate(task)
+                .scalar_subquery()
+            )
+            checklist_item_count = (
+                select(func.count(item.id))
+                .join(checklist, checklist.id == item.checklist_id)
+                .where(checklist.task_id == task.id)
+                .correlate(task)
+                .scalar_subquery()
+            )
+            completed_item_count = (
+                select(func.count(item.id))
+                .join(checklist, checklist.id == item.checklist_id)
+                .where(checklist.task_id == task.id, item.is_completed.is_(True))
+                .correlate(task)
+                .scalar_subquery()
+            )
+            columns = [
+                task.id,
+                task.user_id,
+                task.task_list_id,
+                task.title,
+                task.status,
+                task.priority,
+                task.due_date,
+                task.created_at,
+                task.updated_at,
+                attachment_count.label("attachment_count"),
+                checklist_item_count.label("checklist_item_count"),
+                completed_item_count.label("completed_item_count"),
+            ]
+            if tables is ARCHIVE:
+                columns.append(task.archived_at)
+            query = self._apply_listing(select(*columns), task, user_id, filters, limit, offset, sort, after)
+            result = await self.session.execute(query)
+            return [TaskSummary.model_validate(row) for row in result.all()]
+
+        if include_archived:
+            return await self._list_merged(list_page, limit, offset, sort, after)
+        return await list_page(LIVE, limit, offset)
 
     async def create(self, task: Task) -> Task:
-        model = self._to_model(task)
-        self.session.add(model)
+        # INSERT ... RETURNING: the response is the entity we hold plus the stored timestamps,
+        # with no re-select of a row that has no children yet
+        result = await self.session.execute(
+            insert(TaskModel)
+            .values(**self._to_row(task))
+            .returning(TaskModel.created_at, TaskModel.updated_at)
+        )
+        stored = result.one()
         # Handle attachments if any are pre-populated (rare in create, but possible)
-        for att in task.attachments:
-            att_model = AttachmentModel(
-                id=att.id,
-                task_id=model.id,
-                filename=att.filename,
-                file_url=att.file_url,
-                file_size_bytes=att.file_size_bytes,
-                content_type=att.content_type,
-                created_at=att.created_at
+        if task.attachments:
+            await self.session.execute(
+                insert(AttachmentModel),
+                [self._attachment_row(att.model_copy(update={"task_id": task.id})) for att in task.attachments]
             )
-            self.session.add(att_model)
-            
-        await self.session.commit()
-        # Refresh to get DB-assigned fields if any (like timestamps, though we set them)
-        return await self.get_by_id(task.id)
+        return task.model_copy(update={"created_at": stored.created_at, "updated_at": stored.updated_at})
+
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        if not tasks:
+            return []
+        # A parameter list makes this a bulk insert: SQLAlchemy batches it into
+        # multi-row INSERT ... VALUES statements (insertmanyvalues), and
+        # sort_by_parameter_order lines the RETURNING rows up with the input
+        result = await self.session.execute(
+            insert(TaskModel).returning(
+                TaskModel.created_at, TaskModel.updated_at, sort_by_parameter_order=True
+            ),
+            [self._to_row(task) for task in tasks]
+        )
+        stored = result.all()
+        return [
+            task.model_copy(update={"created_at": row.created_at, "updated_at": row.updated_at})
+            for task, row in zip(tasks, stored)
+        ]
 
     async def update(self, task: Task) -> Task:
         # In a full implementation, we'd fetch the existing model and update fields.
         # For simplicity, we assume the Task entity is the source of truth.
         # However, usually we merge.
-        query = select(TaskModel).where(TaskModel.id == task.id)
+        query = select(TaskModel).where(TaskModel.id == task.id, NOT_DELETED)
         result = await self.session.execute(query)
         existing_model = result.scalar_one_or_none()
         
@@ -160,42 +394,111 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             existing_model.task_list_id = task.task_list_id
             existing_model.title = task.title
             existing_model.description = task.description
-            existing_model.status = task.status.value
-            existing_model.priority = task.priority.value
+            existing_model.status = task.status
+            existing_model.priority = task.priority
             existing_model.due_date = task.due_date
             existing_model.tags = task.tags
-            existing_model.updated_at = datetime.utcnow()
+            existing_model.updated_at = utc_now()
             
-            await self.session.commit()
+            await self.session.flush()
             return await self.get_by_id(task.id)
         return None
 
-    async def delete(self, task_id: UUID) -> bool:
-        # Use ORM delete to respect cascade relationships
-        query = select(TaskModel).where(TaskModel.id == task_id)
+    async def patch(self, task_id: UUID, user_id: UUID, changes: dict) -> Optional[Task]:
+        columns = TaskModel.__table__.c
+        owned = (TaskModel.id == task_id, TaskModel.user_id == user_id, NOT_DELETED)
+        if not changes:
+            result = await self.session.execute(select(*columns).where(*owned))
+            row = result.one_or_none()
+            return task_from_row(row) if row else None
+
+        query = (
+            update(TaskModel)
+            .where(*owned)
+            .values(**self._update_values(changes))
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none()
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
-            return True
-        return False
+        row = result.one_or_none()
+        return task_from_row(row) if row else None
 
-    async def add_attachment(self, attachment: Attachment) -> Attachment:
-        att_model = AttachmentModel(
-            id=attachment.id,
-            task_id=attachment.task_id,
-            filename=attachment.filename,
-            file_url=attachment.file_url,
-            file_size_bytes=attachment.file_size_bytes,
-            content_type=attachment.content_type,
-            created_at=attachment.created_at,
+    async def bulk_update(self, user_id: UUID, filters: dict, changes: dict) -> List[UUID]:
+        query = apply_task_filters(update(TaskModel).where(TaskModel.user_id == user_id, NOT_DELETED), filters)
+        query = (
+            query
+            .values(**self._update_values(changes))
+            .returning(TaskModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def bulk_delete(self, user_id: UUID, filters: dict) -> List[UUID]:
+        query = (
+            apply_task_filters(update(TaskModel).where(TaskModel.user_id == user_id, NOT_DELETED), filters)
+            .values(deleted_at=utc_now())
+            .returning(TaskModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _update_values(changes: dict) -> dict:
+        values = {
+            field: value.value if isinstance(value, Enum) else value
+            for field, value in changes.items()
+        }
+        values["updated_at"] = utc_now()
+        return values
+
+    async def delete(self, task_id: UUID, user_id: UUID) -> bool:
+        # A tombstone only: children and stored files stay until purge_deleted_before
+        query = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.user_id == user_id, NOT_DELETED)
+            .values(deleted_at=utc_now())
+            .returning(TaskModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def restore(self, task_id: UUID, user_id: UUID) -> bool:
+        query = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.user_id == user_id, TaskModel.deleted_at.isnot(None))
+            .values(deleted_at=None)
+            .returning(TaskModel.id)
+            .execution_options(synchronize_session=False)
         )
-        self.session.add(att_model)
-        await self.session.commit()
-        await self.session.refresh(att_model)
-        # Convert back to domain model to return, though not strictly necessary
-        # as the input is already the complete domain model.
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def purge_deleted_before(self, cutoff: datetime, limit: int) -> Tuple[List[UUID], List[str]]:
+        # Read through ix_tasks_deleted_at; SKIP LOCKED leaves tasks being restored right now alone
+        result = await self.session.execute(
+            select(TaskModel.id)
+            .where(TaskModel.deleted_at < cutoff)
+            .order_by(TaskModel.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        task_ids = list(result.scalars().all())
+        if not task_ids:
+            return [], []
+        # Attachment rows disappear with the cascade, so their URLs are read first
+        urls = await self.session.execute(
+            select(AttachmentModel.file_url).where(AttachmentModel.task_id.in_(task_ids))
+        )
+        file_urls = list(urls.scalars().all())
+        await self.session.execute(delete(TaskModel).where(TaskModel.id.in_(task_ids)))
+        return task_ids, file_urls
+
+    async def add_attachment(self, attachment: Attachment) -> Attachment:
+        await self.session.execute(insert(AttachmentModel).values(**self._attachment_row(attachment)))
+        # The input is already the complete domain model; nothing is server-generated
         return attachment
         
     async def get_attachment_by_id(self, attachment_id: UUID) -> Optional[Attachment]:
@@ -215,26 +518,103 @@ class SQLAlchemyTaskRepository(ITaskRepository):
         )
 
     async def delete_attachment(self, attachment_id: UUID) -> bool:
-        # Use ORM delete for consistency
-        query = select(AttachmentModel).where(AttachmentModel.id == attachment_id)
+        query = delete(AttachmentModel).where(AttachmentModel.id == attachment_id).returning(AttachmentModel.id)
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none()
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
-            return True
-        return False
-
-    async def get_due_soon(self, hours: int = 24) -> List[Task]:
-        cutoff = datetime.utcnow() + timedelta(hours=hours)
-        now = datetime.utcnow()
-        
-        query = select(TaskModel).options(selectinload(TaskModel.attachments)).where(
-            TaskModel.due_date <= cutoff,
-            TaskModel.due_date > now,
-            TaskModel.status != "done"
+        return result.scalar_one_or_none() is not None
+
+    async def count_by_user(
+        self, user_id: UUID, filters: dict, cap: int, include_archived: bool = False
+    ) -> Tuple[int, bool]:
+        total, exact = await self._count_live(user_id, filters, cap)
+        if not include_archived:
+            return total, exact
+        # The counters only cover live tasks; the archive is counted directly, capped the same way
+        matches = apply_task_filters(
+            select(ArchivedTaskModel.id).where(ArchivedTaskModel.user_id == user_id), filters, ArchivedTaskModel
+        )
+        archived, archived_exact = await capped_count(self.session, matches, cap)
+        return total + archived, exact and archived_exact
+
+    async def _count_live(self, user_id: UUID, filters: dict, cap: int) -> Tuple[int, bool]:
+        if active_filters(filters) <= COUNTER_FILTERS:
+            query = select(func.coalesce(func.sum(UserTaskStatsModel.task_count), 0)).where(
+                UserTaskStatsModel.user_id == user_id
+            )
+            if filters and filters.get("status"):
+                query = query.where(UserTaskStatsModel.status == filters["status"])
+            if filters and filters.get("priority"):
+                query = query.where(UserTaskStatsModel.priority == filters["priority"])
+            return (await self.session.execute(query)).scalar_one(), True
+
+        matches = apply_task_filters(select(TaskModel.id).where(TaskModel.user_id == user_id, NOT_DELETED), filters)
+        return await capped_count(self.session, matches, cap)
+
+    async def get_stats(self, user_id: UUID) -> TaskStats:
+        rows = (await self.session.execute(
+            select(UserTaskStatsModel.status, UserTaskStatsModel.priority, UserTaskStatsModel.task_count)
+            .where(UserTaskStatsModel.user_id == user_id)
+        )).all()
+        by_status = {status: 0 for status in TaskStatus}
+        by_priority = {priority: 0 for priority in TaskPriority}
+        for row in rows:
+            by_status[row.status] += row.task_count
+            by_priority[row.priority] += row.task_count
+
+        # Whole days come from the due-day counters; only today's tasks are split at `now`
+        now = utc_now()
+        today = now.date()
+        # tasks.due_date is a naive UTC column, so it is compared with the naive form of now
+        due_now = now.replace(tzinfo=None)
+        open_on_days = select(func.coalesce(func.sum(UserTaskDueStatsModel.open_count), 0)).where(
+            UserTaskDueStatsModel.user_id == user_id
+        )
+        before_today = open_on_days.where(UserTaskDueStatsModel.due_on < today)
+        next_seven_days = open_on_days.where(
+            UserTaskDueStatsModel.due_on >= today,
+            UserTaskDueStatsModel.due_on < today + timedelta(days=7)
+        )
+        overdue_today = select(func.count()).select_from(TaskModel).where(
+            TaskModel.user_id == user_id,
+            TaskModel.status != TaskStatus.DONE,
+            NOT_DELETED,
+            TaskModel.due_date >= datetime.combine(today, time.min),
+            TaskModel.due_date < due_now
+        )
+        earlier, upcoming, late_today = (await self.session.execute(select(
+            before_today.scalar_subquery(), next_seven_days.scalar_subquery(), overdue_today.scalar_subquery()
+        ))).one()
+
+        return TaskStats(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_priority=by_priority,
+            overdue=earlier + late_today,
+            due_this_week=upcoming - late_today,
+        )
+
+    async def count_tags_by_user(self, user_id: UUID) -> List[TagCount]:
+        if self.session.bind.dialect.name == "postgresql":
+            tag = func.unnest(TaskModel.tags).table_valued("value").render_derived()
+        else:
+            tag = func.json_each(TaskModel.tags).table_valued("value")
+        count = func.count().label("count")
+        query = (
+            select(tag.c.value.label("name"), count)
+            .select_from(TaskModel)
+            .join(tag, true())
+            .where(TaskModel.user_id == user_id, NOT_DELETED)
+            .group_by(tag.c.value)
+            .order_by(count.desc(), tag.c.value)
         )
         result = await self.session.execute(query)
-        models = result.scalars().all()
-        return [self._to_domain(m) for m in models]
+        return [TagCount(name=row.name, count=row.count) for row in result.all()]
 
+    async def merge_tags(self, user_id: UUID, sources: List[str], target: str) -> int:
+        query = (
+            update(TaskModel)
+            .where(TaskModel.user_id == user_id, NOT_DELETED, TaskModel.tags.contains_any(sources))
+            .values(tags=TaskModel.tags.merged(sources, target))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.rowcount
@@ -0,0 +1,117 @@
+from typing import List, Tuple
+from uuid import UUID
+from sqlalchemy import select, func, literal_column, table, column, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.ports.repositories.base import ITaskSearch
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import TaskModel
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import (
+    apply_task_filters, capped_count, NOT_DELETED
+)
+
+# Search objects are created by SEARCH_DDL in schema.py and are not part of the ORM models
+_search_vector = literal_column("tasks.search_vector")
+_tasks_fts = table("tasks_fts")
+_tasks_fts_rows = table("tasks_fts_rows", column("task_id", TaskModel.id.type), column("fts_rowid", Integer))
+_fts = literal_column("tasks_fts")
+
+
+def _scalar_filters(filters: dict) -> dict:
+    # The text itself is matched by the search index, not by the ILIKE fallback
+    return {k: v for k, v in (filters or {}).items() if k != "search"}
+
+
+class PostgresTaskSearch(ITaskSearch):
+    """Ranked search over the trigger-maintained tasks.search_vector (GIN indexed)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _matches(user_id: UUID, ts_query, filters: dict):
+        query = select(TaskModel.id).where(
+            TaskModel.user_id == user_id, NOT_DELETED, _search_vector.op("@@")(ts_query)
+        )
+        return apply_task_filters(query, _scalar_filters(filters))
+
+    async def search(
+        self,
+        user_id: UUID,
+        text: str,
+        filters: dict = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[UUID]:
+        ts_query = func.websearch_to_tsquery("english", text)
+        query = (
+            self._matches(user_id, ts_query, filters)
+            .order_by(func.ts_rank_cd(_search_vector, ts_query).desc(), TaskModel.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def count(self, user_id: UUID, text: str, filters: dict = None, cap: int = 1000) -> Tuple[int, bool]:
+        ts_query = func.websearch_to_tsquery("english", text)
+        return await capped_count(self.session, self._matches(user_id, ts_query, filters), cap)
+
+
+class SQLiteTaskSearch(ITaskSearch):
+    """Ranked search over the trigger-maintained tasks_fts FTS5 table, for tests and single-node setups."""
+
+    # bm25 column weights for title, description and checklist_text
+    WEIGHTS = (10.0, 4.0, 1.0)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _match_expression(text: str) -> str:
+        # Quote every term so user input is never parsed as FTS5 query syntax
+        terms = [term.replace('"', '""') for term in text.split()]
+        return " ".join(f'"{term}"' for term in terms if term)
+
+    @staticmethod
+    def _matches(user_id: UUID, match: str, filters: dict):
+        query = (
+            select(TaskModel.id)
+            .select_from(_tasks_fts)
+            .join(_tasks_fts_rows, _tasks_fts_rows.c.fts_rowid == literal_column("tasks_fts.rowid"))
+            .join(TaskModel, TaskModel.id == _tasks_fts_rows.c.task_id)
+            .where(_fts.op("MATCH")(match), TaskModel.user_id == user_id, NOT_DELETED)
+        )
+        return apply_task_filters(query, _scalar_filters(filters))
+
+    async def search(
+        self,
+        user_id: UUID,
+        text: str,
+        filters: dict = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[UUID]:
+        match = self._match_expression(text)
+        if not match:
+            return []
+        query = (
+            self._matches(user_id, match, filters)
+            .order_by(func.bm25(_fts, *self.WEIGHTS), TaskModel.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def count(self, user_id: UUID, text: str, filters: dict = None, cap: int = 1000) -> Tuple[int, bool]:
+        match = self._match_expression(text)
+        if not match:
+            return 0, True
+        return await capped_count(self.session, self._matches(user_id, match, filters), cap)
+
+
+def create_task_search(session: AsyncSession) -> ITaskSearch:
+    """Picks the search implementation matching the session's database."""
+    if session.bind.dialect.name == "sqlite":
+        return SQLiteTaskSearch(session)
+    return PostgresTaskSearch(session)
@@ -1,9 +1,9 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, insert, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.domain.entities.models import User, UserRole
+from backend.src.domain.entities.models import User
 from backend.src.domain.ports.repositories.base import IUserRepository
 from backend.src.infrastructure.persistence.sqlalchemy.models.schema import UserModel
 
@@ -18,19 +18,19 @@ class SQLAlchemyUserRepository(IUserRepository):
             id=model.id,
             email=model.email,
             password_hash=model.password_hash,
-            role=UserRole(model.role),
+            role=model.role,
             is_verified=model.is_verified,
             verification_token=model.verification_token,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
 
-    def _to_model(self, entity: User) -> UserModel:
-        return UserModel(
+    def _to_row(self, entity: User) -> dict:
+        return dict(
             id=entity.id,
             email=entity.email,
             password_hash=entity.password_hash,
-            role=entity.role.value,
+            role=entity.role,
             is_verified=entity.is_verified,
             verification_token=entity.verification_token,
             created_at=entity.created_at,
@@ -56,10 +56,13 @@ class SQLAlchemyUserRepository(IUserRepository):
         return self._to_domain(model)
 
     async def create(self, user: User) -> User:
-        model = self._to_model(user)
-        self.session.add(model)
-        await self.session.commit()
-        return await self.get_by_id(user.id)
+        result = await self.session.execute(
+            insert(UserModel)
+            .values(**self._to_row(user))
+            .returning(UserModel.created_at, UserModel.updated_at)
+        )
+        stored = result.one()
+        return user.model_copy(update={"created_at": stored.created_at, "updated_at": stored.updated_at})
 
     async def update(self, user: User) -> User:
         query = select(UserModel).where(UserModel.id == user.id)
@@ -69,25 +72,20 @@ class SQLAlchemyUserRepository(IUserRepository):
         if existing_model:
             existing_model.email = user.email
             existing_model.password_hash = user.password_hash
-            existing_model.role = user.role.value
+            existing_model.role = user.role
             existing_model.is_verified = user.is_verified
             existing_model.verification_token = user.verification_token
             existing_model.updated_at = user.updated_at
             
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(existing_model)
             return await self.get_by_id(user.id)
         return None
     
     async def delete(self, user_id: UUID) -> bool:
         """Delete a user by ID. Returns True if deleted, False if not found."""
-        query = select(UserModel).where(UserModel.id == user_id)
+        # Task lists, tasks and their children go with it through ON DELETE CASCADE
+        query = delete(UserModel).where(UserModel.id == user_id).returning(UserModel.id)
         result = await self.session.execute(query)
-        model = result.scalar_one_or_none()
-        
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
-            return True
-        return False
+        return result.scalar_one_or_none() is not None
 
@@ -0,0 +1,136 @@
+import itertools
+import time
+from typing import Dict, Optional, Sequence
+from uuid import UUID
+
+import structlog
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+logger = structlog.get_logger()
+
+# Session.info keys shared with the unit of work
+REPLICA = "replica"
+WROTE = "wrote"
+ACTING_USER = "acting_user_id"
+
+REPLICA_FALLBACKS = Counter(
+    "db_replica_fallbacks_total",
+    "Reads retried on the primary because a replica failed to serve them",
+    ["pool"],
+)
+
+
+class LocalRecentWrites:
+    """Users who wrote within the window, remembered by this process only"""
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._until: Dict[str, float] = {}
+
+    async def mark(self, user_id: UUID) -> None:
+        now = time.monotonic()
+        self._until = {user: until for user, until in self._until.items() if until > now}
+        self._until[str(user_id)] = now + self.window_seconds
+
+    async def is_recent(self, user_id: UUID) -> bool:
+        return self._until.get(str(user_id), 0.0) > time.monotonic()
+
+
+class RedisRecentWrites:
+    """
+    Users who wrote within the window, kept in Redis with a TTL so the next
+    request sees the marker whichever worker or host serves it.
+    """
+
+    def __init__(self, redis_url: str, window_seconds: float):
+        self.redis = Redis.from_url(redis_url)
+        self.window_ms = int(window_seconds * 1000)
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"db:recent-write:{user_id}"
+
+    async def mark(self, user_id: UUID) -> None:
+        await self.redis.set(self._key(user_id), 1, px=self.window_ms)
+
+    async def is_recent(self, user_id: UUID) -> bool:
+        return bool(await self.redis.exists(self._key(user_id)))
+
+
+class SessionRouter:
+    """
+    Picks the replica for a read-only call: round-robin over replicas that have not
+    failed recently, or none (the primary) while the user is inside their
+    read-your-writes window.
+    """
+
+    def __init__(self, replicas: Sequence[AsyncEngine], recent_writes, retry_after_seconds: float):
+        self.replicas = list(replicas)
+        self.recent_writes = recent_writes
+        self.retry_after_seconds = retry_after_seconds
+        self._down_until: Dict[AsyncEngine, float] = {}
+        self._turn = itertools.count()
+
+    async def replica_for(self, user_id: Optional[UUID]) -> Optional[AsyncEngine]:
+        now = time.monotonic()
+        healthy = [replica for replica in self.replicas if self._down_until.get(replica, 0.0) <= now]
+        if not healthy:
+            return None
+        if user_id is not None:
+            try:
+                if await self.recent_writes.is_recent(user_id):
+                    return None
+            except RedisError as exc:
+                # Without the marker we cannot rule out a fresh write; the primary is always safe
+                logger.warning("Read-your-writes lookup failed, reading from primary", error=str(exc))
+                return None
+        return healthy[next(self._turn) % len(healthy)]
+
+    def mark_down(self, replica: AsyncEngine, error: Exception) -> None:
+        self._down_until[replica] = time.monotonic() + self.retry_after_seconds
+        REPLICA_FALLBACKS.labels(pool=replica.pool.logging_name or "default").inc()
+        logger.warning(
+            "Replica failed, falling back to primary",
+            pool=replica.pool.logging_name,
+            retry_after_seconds=self.retry_after_seconds,
+            error=str(error),
+        )
+
+    async def record_write(self, user_id: UUID) -> None:
+        try:
+            await self.recent_writes.mark(user_id)
+        except RedisError as exc:
+            logger.warning("Could not record write for read-your-writes", user_id=str(user_id), error=str(exc))
+
+
+class RoutingSession(Session):
+    """
+    Session that sends SELECTs to the replica chosen for the current read-only
+    call (Session.info[REPLICA]); flushes and every other statement use the primary.
+    """
+
+    def __init__(self, *args, router: Optional[SessionRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get(REPLICA)
+        if replica is not None and not self._flushing and getattr(clause, "is_select", False):
+            return replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _record_flush(session, flush_context) -> None:
+    session.info[WROTE] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _record_dml(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[WROTE] = True
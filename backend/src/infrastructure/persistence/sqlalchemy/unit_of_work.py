@@ -0,0 +1,78 @@
+from typing import Awaitable, Callable, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.ports.repositories.base import IUnitOfWork
+from backend.src.infrastructure.persistence.sqlalchemy.routing import ACTING_USER, REPLICA, WROTE
+
+T = TypeVar("T")
+
+
+def _replica_unavailable(error: Exception) -> bool:
+    # Connection-level failures only; a bad query would fail on the primary too
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated or isinstance(error, (OperationalError, InterfaceError))
+    # asyncpg raises connect failures (refused, timed out) as OSError
+    return isinstance(error, (PoolTimeoutError, OSError))
+
+
+class SQLAlchemyUnitOfWork(IUnitOfWork):
+    """
+    Unit of work over one AsyncSession. Used as an async context manager it
+    commits when the block completes and rolls back when it raises.
+
+    With `user_id`, writes committed through the session are recorded against that
+    user so their reads skip replicas for the read-your-writes window.
+    """
+
+    def __init__(self, session: AsyncSession, user_id: Optional[UUID] = None):
+        self.session = session
+        if user_id is not None:
+            session.info[ACTING_USER] = user_id
+
+    @property
+    def _router(self):
+        return getattr(self.session.sync_session, "router", None)
+
+    async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        user_id = self.session.info.get(ACTING_USER)
+        if self._router and user_id is not None and self.session.info.get(WROTE):
+            await self._router.record_write(user_id)
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    async def read(self, user_id: Optional[UUID], operation: Callable[[], Awaitable[T]]) -> T:
+        router = self._router
+        # Once this session has written, later reads must see it: stay on the primary
+        if router is None or self.session.info.get(WROTE):
+            return await operation()
+        replica = await router.replica_for(user_id)
+        if replica is None:
+            return await operation()
+
+        self.session.info[REPLICA] = replica
+        try:
+            return await operation()
+        except Exception as exc:
+            if not _replica_unavailable(exc):
+                raise
+            router.mark_down(replica, exc)
+            # Nothing was written, so dropping the broken transaction loses nothing
+            await self.session.rollback()
+        finally:
+            self.session.info.pop(REPLICA, None)
+        return await operation()
@@ -1,7 +1,12 @@
 import asyncio
+from pathlib import Path
 import structlog
-from backend.src.infrastructure.persistence.sqlalchemy.database import AsyncSessionLocal, engine, Base
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from backend.src.infrastructure.persistence.sqlalchemy.database import AsyncSessionLocal, engine
 from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
 from backend.src.infrastructure.security.hashing import get_password_hash
 from backend.src.domain.entities.models import User, UserRole
 # Import models to register them with Base
@@ -11,14 +16,31 @@ from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
 
 log = structlog.get_logger()
 
-async def init_db_data():
-    # Create tables
-    log.info("Creating database tables...")
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+# Revision matching the schema that create_all used to build before migrations existed
+BASELINE_REVISION = "0001"
+
+def _upgrade_to_head(sync_conn):
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = sync_conn
+    config.attributes["configure_logger"] = False
+
+    tables = inspect(sync_conn).get_table_names()
+    if "users" in tables and "alembic_version" not in tables:
+        log.info("Stamping pre-migration database at baseline", revision=BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+async def run_migrations():
+    log.info("Applying database migrations...")
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    log.info("Database tables created.")
+        await conn.run_sync(_upgrade_to_head)
+    log.info("Database schema is up to date.")
+
+async def init_db_data():
+    await run_migrations()
 
-    async with AsyncSessionLocal() as session:
+    async with AsyncSessionLocal() as session, SQLAlchemyUnitOfWork(session):
         repo = SQLAlchemyUserRepository(session)
         
         # Check if admin exists
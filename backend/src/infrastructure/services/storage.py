@@ -2,12 +2,16 @@ import boto3
 from botocore.client import Config
 import asyncio
 import uuid
+from typing import List
 import structlog
 from backend.src.domain.ports.repositories.base import IFileStorage
 from backend.src.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# S3 DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
 class MinIOStorage(IFileStorage):
     def __init__(self):
         self.s3 = boto3.client(
@@ -57,20 +61,52 @@ class MinIOStorage(IFileStorage):
             # Propagate the error to be handled by the use case/API layer
             raise
 
+    def _key(self, file_url: str) -> str:
+        # Extract key from URL, which should be the public URL
+        return file_url.split(f"/{self.bucket_name}/")[-1]
+
     def _delete_sync(self, key: str):
         """Synchronous delete logic."""
         self.s3.delete_object(Bucket=self.bucket_name, Key=key)
 
+    def _delete_batch_sync(self, keys: List[str]) -> int:
+        """Synchronous DeleteObjects call; returns how many keys were removed."""
+        response = self.s3.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+        )
+        # Quiet mode lists only the failures
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.error("file_delete_failed", key=error.get("Key"), error=error.get("Message"))
+        return len(keys) - len(errors)
+
     async def delete(self, file_url: str) -> bool:
         if not file_url:
             return False
             
         try:
-            # Extract key from URL, which should be the public URL
-            key = file_url.split(f"/{self.bucket_name}/")[-1]
+            key = self._key(file_url)
             await asyncio.to_thread(self._delete_sync, key)
             logger.info("file_delete_success", key=key)
             return True
         except Exception as e:
             logger.error("file_delete_failed", url=file_url, error=str(e))
             return False
+
+    async def delete_many(self, file_urls: List[str]) -> int:
+        keys = [self._key(url) for url in file_urls if url]
+        batches = [keys[i:i + DELETE_BATCH_SIZE] for i in range(0, len(keys), DELETE_BATCH_SIZE)]
+        # Batches are independent, so they are sent concurrently
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._delete_batch_sync, batch) for batch in batches),
+            return_exceptions=True
+        )
+        deleted = 0
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                logger.error("file_batch_delete_failed", count=len(batch), error=str(result))
+            else:
+                deleted += result
+        logger.info("file_batch_delete_done", requested=len(keys), deleted=deleted)
+        return deleted
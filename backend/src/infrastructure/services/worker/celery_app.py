@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.schedules import crontab
 from backend.src.config import settings
 
 celery_app = Celery(
@@ -13,6 +14,20 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    beat_schedule={
+        "check-due-tasks": {
+            "task": "backend.src.infrastructure.services.worker.tasks.check_due_tasks",
+            "schedule": crontab(),
+        },
+        "archive-done-tasks": {
+            "task": "backend.src.infrastructure.services.worker.tasks.archive_done_tasks",
+            "schedule": crontab(hour=3, minute=0),
+        },
+        "purge-deleted-tasks": {
+            "task": "backend.src.infrastructure.services.worker.tasks.purge_deleted_tasks",
+            "schedule": crontab(minute="*/15"),
+        },
+    },
 )
 
 # In a real app, we'd auto-discover tasks
@@ -1,6 +1,16 @@
+from backend.src.config import settings
 from backend.src.infrastructure.services.worker.celery_app import celery_app
 from backend.src.infrastructure.persistence.sqlalchemy.database import AsyncSessionLocal
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.reminder_repository import (
+    SQLAlchemyReminderRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_archive import SQLAlchemyTaskArchive
 from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from backend.src.infrastructure.services.storage import MinIOStorage
+from backend.src.domain.ports.repositories.base import IFileStorage
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 import asyncio
 import structlog
 
@@ -9,25 +19,105 @@ logger = structlog.get_logger()
 @celery_app.task
 def check_due_tasks():
     """
-    Periodic task to check for tasks due in the next 24 hours.
+    Periodic task sending the reminders that are due, REMINDER_LEAD_HOURS before each task's due date.
     Since Celery is sync by default, we bridge to async.
     """
     asyncio.run(_check_due_tasks_async())
 
-async def _check_due_tasks_async():
+async def _check_due_tasks_async(session_factory=AsyncSessionLocal) -> int:
     logger.info("Starting check_due_tasks job")
-    async with AsyncSessionLocal() as session:
-        repo = SQLAlchemyTaskRepository(session)
-        due_tasks = await repo.get_due_soon(hours=24)
-        
-        for task in due_tasks:
-            # Idempotency check would go here (e.g. check if notification already sent in Redis)
-            # For now we just log
-            logger.info(
-                "Reminder Sent", 
-                task_id=str(task.id), 
-                user_id=str(task.user_id), 
-                title=task.title, 
-                event="reminder_sent"
-            )
+    sent = 0
+    while True:
+        now = datetime.utcnow()
+        # Reminders are sent inside the transaction that takes them off the queue: a failure
+        # rolls the batch back for the next run, so a reminder may repeat but is never lost
+        async with session_factory() as session:
+            async with SQLAlchemyUnitOfWork(session):
+                repo = SQLAlchemyReminderRepository(session)
+                reminders = await repo.pop_due(now, settings.REMINDER_BATCH_SIZE)
+                # Reminders queued while the job was not running and already past due are too late.
+                # The ledger drops any already delivered for the same due date, e.g. before a reopen.
+                pending = [reminder for reminder in reminders if reminder.due_date > now]
+                for reminder in await repo.record_deliveries(pending, now):
+                    logger.info(
+                        "Reminder Sent",
+                        task_id=str(reminder.task_id),
+                        user_id=str(reminder.user_id),
+                        title=reminder.title,
+                        due_date=reminder.due_date.isoformat(),
+                        kind=reminder.kind.value
+                    )
+                    sent += 1
+        if len(reminders) < settings.REMINDER_BATCH_SIZE:
+            break
 
+    # Ledger entries for due dates gone by can no longer match a reminder
+    pruned = 0
+    while True:
+        async with session_factory() as session:
+            async with SQLAlchemyUnitOfWork(session):
+                removed = await SQLAlchemyReminderRepository(session).prune_deliveries(
+                    datetime.utcnow(), settings.REMINDER_BATCH_SIZE
+                )
+        pruned += removed
+        if removed < settings.REMINDER_BATCH_SIZE:
+            break
+    logger.info("Finished check_due_tasks job", sent=sent, pruned=pruned)
+    return sent
+
+
+@celery_app.task
+def archive_done_tasks():
+    """
+    Nightly task moving done tasks older than TASK_ARCHIVE_AFTER_DAYS to the archive tables.
+    """
+    asyncio.run(_archive_done_tasks_async())
+
+async def _archive_done_tasks_async(session_factory=AsyncSessionLocal) -> int:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.TASK_ARCHIVE_AFTER_DAYS)
+    logger.info("Starting archive_done_tasks job", cutoff=cutoff.isoformat())
+    archived = 0
+    while True:
+        # One short transaction per batch keeps locks and replication lag small
+        async with session_factory() as session:
+            async with SQLAlchemyUnitOfWork(session):
+                moved = await SQLAlchemyTaskArchive(session).archive_done_before(
+                    cutoff, settings.TASK_ARCHIVE_BATCH_SIZE
+                )
+        archived += moved
+        if moved < settings.TASK_ARCHIVE_BATCH_SIZE:
+            break
+        await asyncio.sleep(settings.TASK_ARCHIVE_BATCH_PAUSE_SECONDS)
+    logger.info("Finished archive_done_tasks job", archived=archived)
+    return archived
+
+
+@celery_app.task
+def purge_deleted_tasks():
+    """
+    Periodic task removing tasks deleted more than TASK_PURGE_AFTER_HOURS ago, with their files.
+    """
+    asyncio.run(_purge_deleted_tasks_async())
+
+async def _purge_deleted_tasks_async(
+    session_factory=AsyncSessionLocal, file_storage: Optional[IFileStorage] = None
+) -> int:
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.TASK_PURGE_AFTER_HOURS)
+    logger.info("Starting purge_deleted_tasks job", cutoff=cutoff.isoformat())
+    file_storage = file_storage or MinIOStorage()
+    purged = 0
+    while True:
+        async with session_factory() as session:
+            async with SQLAlchemyUnitOfWork(session):
+                task_ids, file_urls = await SQLAlchemyTaskRepository(session).purge_deleted_before(
+                    cutoff, settings.TASK_PURGE_BATCH_SIZE
+                )
+        # Files go only once the row deletion is durable
+        if file_urls:
+            await file_storage.delete_many(file_urls)
+        purged += len(task_ids)
+        if len(task_ids) < settings.TASK_PURGE_BATCH_SIZE:
+            break
+        await asyncio.sleep(settings.TASK_PURGE_BATCH_PAUSE_SECONDS)
+    logger.info("Finished purge_deleted_tasks job", purged=purged)
+    return purged
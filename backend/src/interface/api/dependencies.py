@@ -1,9 +1,10 @@
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from backend.src.infrastructure.persistence.sqlalchemy.database import get_db as get_db_session
+from backend.src.infrastructure.persistence.sqlalchemy.database import AsyncSessionLocal, get_db as get_db_session
 from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -16,22 +17,49 @@ from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_list_re
 from backend.src.infrastructure.persistence.sqlalchemy.repositories.checklist_repository import (
     SQLAlchemyChecklistRepository
 )
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_search import create_task_search
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.sync_repository import SQLAlchemySyncRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_export import SQLAlchemyTaskExport
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_import import SQLAlchemyTaskImport
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
 from backend.src.domain.ports.repositories.base import (
     IUserRepository,
     ITaskRepository,
     IFileStorage,
     ITaskListRepository,
-    IChecklistRepository
+    IChecklistRepository,
+    ITaskSearch,
+    ISyncRepository,
+    ITaskExport,
+    ITaskImport,
+    IUnitOfWork
 )
 from backend.src.application.use_cases.auth_use_case import AuthUseCase
 from backend.src.application.use_cases.task_use_case import TaskUseCase
 from backend.src.application.use_cases.task_list_use_case import TaskListUseCase
 from backend.src.application.use_cases.checklist_use_case import ChecklistUseCase
+from backend.src.application.use_cases.sync_use_case import SyncUseCase
+from backend.src.application.use_cases.task_export_use_case import TaskExportUseCase
+from backend.src.application.use_cases.task_import_use_case import TaskImportUseCase
 from backend.src.infrastructure.security.jwt_token import decode_access_token
 from backend.src.infrastructure.services.storage import MinIOStorage
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> str:
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise credentials_exception
+    return user_id
+
 async def get_user_repo(
     session: AsyncSession = Depends(get_db_session),
 ) -> IUserRepository:
@@ -52,6 +80,38 @@ async def get_checklist_repo(
 ) -> IChecklistRepository:
     return SQLAlchemyChecklistRepository(session)
 
+async def get_task_search(
+    session: AsyncSession = Depends(get_db_session),
+) -> ITaskSearch:
+    return create_task_search(session)
+
+async def get_sync_repo(
+    session: AsyncSession = Depends(get_db_session),
+) -> ISyncRepository:
+    return SQLAlchemySyncRepository(session)
+
+def get_session_factory() -> async_sessionmaker:
+    # For work that outlives the request's session, such as a streamed response
+    return AsyncSessionLocal
+
+async def get_task_export(
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+) -> ITaskExport:
+    return SQLAlchemyTaskExport(session_factory)
+
+async def get_task_import(
+    session: AsyncSession = Depends(get_db_session),
+) -> ITaskImport:
+    return SQLAlchemyTaskImport(session)
+
+async def get_unit_of_work(
+    session: AsyncSession = Depends(get_db_session),
+    user_id: str = Depends(get_current_user_id),
+) -> IUnitOfWork:
+    # Same session as the repositories; get_db commits it when the request ends.
+    # The user's writes keep their reads off replicas for the read-your-writes window.
+    return SQLAlchemyUnitOfWork(session, user_id=UUID(user_id))
+
 def get_file_storage() -> IFileStorage:
     return MinIOStorage()
 
@@ -63,33 +123,39 @@ async def get_auth_use_case(
 async def get_task_use_case(
     task_repo: ITaskRepository = Depends(get_task_repo),
     file_storage: IFileStorage = Depends(get_file_storage),
-    task_list_repo: ITaskListRepository = Depends(get_task_list_repo)
+    task_list_repo: ITaskListRepository = Depends(get_task_list_repo),
+    task_search: ITaskSearch = Depends(get_task_search),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
 ) -> TaskUseCase:
-    return TaskUseCase(task_repo, file_storage, task_list_repo)
+    return TaskUseCase(task_repo, file_storage, task_list_repo, task_search, uow)
 
 async def get_task_list_use_case(
-    task_list_repo: ITaskListRepository = Depends(get_task_list_repo)
+    task_list_repo: ITaskListRepository = Depends(get_task_list_repo),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
 ) -> TaskListUseCase:
-    return TaskListUseCase(task_list_repo)
+    return TaskListUseCase(task_list_repo, uow)
 
 async def get_checklist_use_case(
     checklist_repo: IChecklistRepository = Depends(get_checklist_repo),
-    task_repo: ITaskRepository = Depends(get_task_repo)
+    task_repo: ITaskRepository = Depends(get_task_repo),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
 ) -> ChecklistUseCase:
-    return ChecklistUseCase(checklist_repo, task_repo)
+    return ChecklistUseCase(checklist_repo, task_repo, uow)
 
+async def get_sync_use_case(
+    sync_repo: ISyncRepository = Depends(get_sync_repo),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
+) -> SyncUseCase:
+    return SyncUseCase(sync_repo, uow)
 
-async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> str:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-    return user_id
+async def get_task_export_use_case(
+    task_export: ITaskExport = Depends(get_task_export),
+) -> TaskExportUseCase:
+    return TaskExportUseCase(task_export)
 
+async def get_task_import_use_case(
+    task_import: ITaskImport = Depends(get_task_import),
+    task_list_repo: ITaskListRepository = Depends(get_task_list_repo),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
+) -> TaskImportUseCase:
+    return TaskImportUseCase(task_import, task_list_repo, uow)
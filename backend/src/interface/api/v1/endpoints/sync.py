@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from uuid import UUID
+
+from backend.src.application.use_cases.sync_use_case import SyncUseCase
+from backend.src.application.dtos.sync_dtos import SyncResponseDTO
+from backend.src.interface.api.dependencies import get_sync_use_case, get_current_user_id
+
+router = APIRouter()
+
+@router.get("", response_model=SyncResponseDTO)
+async def sync(
+    since: Optional[str] = Query(None, description="next_token from the previous sync; omit for a full sync"),
+    limit: int = Query(500, ge=1, le=1000),
+    user_id: str = Depends(get_current_user_id),
+    uc: SyncUseCase = Depends(get_sync_use_case),
+):
+    try:
+        changes, next_token = await uc.get_changes(UUID(user_id), since, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return SyncResponseDTO(
+        tasks=changes.tasks,
+        task_lists=changes.task_lists,
+        checklists=changes.checklists,
+        checklist_items=changes.checklist_items,
+        deleted=changes.deleted,
+        next_token=next_token,
+        has_more=changes.has_more,
+    )
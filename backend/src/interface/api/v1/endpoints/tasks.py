@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Query, Request, Response
-from typing import Any, List, Optional
+from fastapi import (
+    APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Query, Request, Response
+)
+from fastapi.responses import StreamingResponse
+from typing import Any, List, Literal, Optional, Union
 from uuid import UUID
 from sqlalchemy.exc import IntegrityError
 
 from backend.src.application.use_cases.task_use_case import TaskUseCase
-from backend.src.application.dtos.task_dtos import TaskCreateDTO, TaskUpdateDTO, TaskResponseDTO
-from backend.src.interface.api.dependencies import get_task_use_case, get_current_user_id
-from backend.src.domain.entities.models import TaskPriority, TaskStatus
+from backend.src.application.use_cases.task_export_use_case import TaskExportUseCase, ExportFormat
+from backend.src.application.use_cases.task_import_use_case import TaskImportUseCase, ImportFormat
+from backend.src.application.dtos.task_dtos import (
+    TaskCreateDTO, TaskUpdateDTO, TaskPatchDTO, TaskCoreDTO, TaskResponseDTO, TaskSummaryDTO, TaskStatsDTO,
+    TagCountDTO, TagRenameDTO, TagMergeDTO, TagOperationResultDTO, TaskBatchCreateDTO, TaskBatchResultDTO,
+    TaskBulkUpdateDTO, TaskBulkResultDTO, TaskSelectionDTO, TaskImportResultDTO
+)
+from backend.src.interface.api.dependencies import (
+    get_task_use_case, get_task_export_use_case, get_task_import_use_case, get_current_user_id
+)
+from backend.src.domain.entities.models import TaskPriority, TaskSort, TaskStatus
 from backend.src.infrastructure.middleware.rate_limiter import conditional_limit
+from backend.src.config import settings
 
 router = APIRouter()
 
@@ -35,26 +47,181 @@ async def create_task(
             )
         raise HTTPException(status_code=400, detail=f"Database error: {error_msg}")
 
-@router.get("/", response_model=List[TaskResponseDTO])
+# Mounted under the /api/v1/tasks prefix, so the full path is /api/v1/tasks:batch
+@router.post(":batch", response_model=TaskBatchResultDTO)
+@conditional_limit("10/minute")
+async def create_tasks_batch(
+    request: Request,
+    batch: TaskBatchCreateDTO,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    return await task_uc.create_tasks_batch(UUID(user_id), batch.tasks)
+
+@router.post(":batchUpdate", response_model=TaskBulkResultDTO)
+@conditional_limit("10/minute")
+async def bulk_update_tasks(
+    request: Request,
+    dto: TaskBulkUpdateDTO,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    try:
+        ids = await task_uc.bulk_update_tasks(UUID(user_id), dto)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TaskBulkResultDTO(count=len(ids), ids=ids)
+
+@router.post(":batchDelete", response_model=TaskBulkResultDTO)
+@conditional_limit("10/minute")
+async def bulk_delete_tasks(
+    request: Request,
+    dto: TaskSelectionDTO,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    ids = await task_uc.bulk_delete_tasks(UUID(user_id), dto)
+    return TaskBulkResultDTO(count=len(ids), ids=ids)
+
+@router.get("/", response_model=Union[List[TaskResponseDTO], List[TaskSummaryDTO]])
 async def list_tasks(
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     task_uc: TaskUseCase = Depends(get_task_use_case),
-    status: Optional[str] = Query(None),
-    priority: Optional[str] = Query(None),
+    status: Optional[TaskStatus] = Query(None),
+    priority: Optional[TaskPriority] = Query(None),
     search: Optional[str] = Query(None),
     task_list_id: Optional[UUID] = Query(None),
+    tags: Optional[List[str]] = Query(None),
+    tag_match: Literal["any", "all"] = Query("any"),
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; replaces offset"),
+    view: Literal["full", "summary"] = Query("full"),
+    sort: Optional[TaskSort] = Query(
+        None, description="-created_at (default), due_date (undated last), -priority or -updated_at"
+    ),
+    include_archived: bool = Query(False, description="Also list archived (old, done) tasks; not with search"),
+    include: Optional[Literal["count"]] = Query(
+        None, description="count: report the total in X-Total-Count (\"<cap>+\" when capped)"
+    ),
 ):
     filters = {
         "status": status, 
         "priority": priority, 
         "task_list_id": task_list_id,
-        "search": search
+        "search": search,
+        "tags": tags,
+        "tag_match": tag_match
     }
-    tasks = await task_uc.get_user_tasks(UUID(user_id), filters, limit, offset)
+    try:
+        tasks, next_cursor = await task_uc.get_user_tasks_page(
+            UUID(user_id), filters, limit, offset, cursor, summary=(view == "summary"), sort=sort,
+            include_archived=include_archived
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if include == "count":
+        total, exact = await task_uc.count_user_tasks(
+            UUID(user_id), filters, settings.TASK_COUNT_CAP, include_archived=include_archived
+        )
+        response.headers["X-Total-Count"] = str(total) if exact else f"{total}+"
+    if view == "summary":
+        return [TaskSummaryDTO.model_validate(task) for task in tasks]
     return [TaskResponseDTO.model_validate(task) for task in tasks]
 
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+@router.get(":export", response_class=StreamingResponse)
+@conditional_limit("10/minute")
+async def export_tasks(
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    export_uc: TaskExportUseCase = Depends(get_task_export_use_case),
+    format: ExportFormat = Query("ndjson"),
+    include: Optional[Literal["checklist_items"]] = Query(
+        None, description="checklist_items: add each task's checklist items (one CSV row per item)"
+    ),
+    status: Optional[TaskStatus] = Query(None),
+    priority: Optional[TaskPriority] = Query(None),
+    task_list_id: Optional[UUID] = Query(None),
+    tags: Optional[List[str]] = Query(None),
+    tag_match: Literal["any", "all"] = Query("any"),
+    include_archived: bool = Query(False),
+):
+    filters = {
+        "status": status,
+        "priority": priority,
+        "task_list_id": task_list_id,
+        "tags": tags,
+        "tag_match": tag_match,
+    }
+    chunks = export_uc.export_tasks(
+        UUID(user_id), format, filters, with_checklist_items=(include == "checklist_items"),
+        include_archived=include_archived
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
+
+@router.post(":import", response_model=TaskImportResultDTO)
+@conditional_limit("5/minute")
+async def import_tasks(
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    import_uc: TaskImportUseCase = Depends(get_task_import_use_case),
+    format: ImportFormat = Query("ndjson", description="Request body format: ndjson or csv (with a header row)"),
+):
+    # The body is parsed as it arrives rather than read into memory first
+    try:
+        return await import_uc.import_tasks(UUID(user_id), format, request.stream())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/stats", response_model=TaskStatsDTO)
+async def get_task_stats(
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    stats = await task_uc.get_task_stats(UUID(user_id))
+    return TaskStatsDTO.model_validate(stats)
+
+@router.get("/tags", response_model=List[TagCountDTO])
+async def list_tag_counts(
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    tag_counts = await task_uc.get_tag_counts(UUID(user_id))
+    return [TagCountDTO.model_validate(tag_count) for tag_count in tag_counts]
+
+@router.post("/tags/rename", response_model=TagOperationResultDTO)
+async def rename_tag(
+    dto: TagRenameDTO,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    updated = await task_uc.rename_tag(UUID(user_id), dto.old_name, dto.new_name)
+    return TagOperationResultDTO(updated=updated)
+
+@router.post("/tags/merge", response_model=TagOperationResultDTO)
+async def merge_tags(
+    dto: TagMergeDTO,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+):
+    updated = await task_uc.merge_tags(UUID(user_id), dto.sources, dto.target)
+    return TagOperationResultDTO(updated=updated)
+
+async def _task_not_found(task_uc: TaskUseCase, task_id: UUID, user_id: UUID) -> HTTPException:
+    # Archived tasks are served by GET but not written; say so instead of 404
+    if await task_uc.is_archived(task_id, user_id):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Archived tasks are read-only")
+    return HTTPException(status_code=404, detail="Task not found")
+
 @router.get("/{task_id}", response_model=TaskResponseDTO)
 async def get_task(
     task_id: UUID,
@@ -76,11 +243,29 @@ async def update_task(
     try:
         task = await task_uc.update_task(task_id, UUID(user_id), task_in)
         if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
+            raise await _task_not_found(task_uc, task_id, UUID(user_id))
         return TaskResponseDTO.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.patch("/{task_id}", response_model=Union[TaskResponseDTO, TaskCoreDTO])
+async def patch_task(
+    task_id: UUID,
+    task_in: TaskPatchDTO,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case),
+    include: Optional[Literal["children"]] = Query(None, description="Reload attachments and checklists"),
+) -> Any:
+    try:
+        task = await task_uc.patch_task(task_id, UUID(user_id), task_in, include_children=(include == "children"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not task:
+        raise await _task_not_found(task_uc, task_id, UUID(user_id))
+    if include == "children":
+        return TaskResponseDTO.model_validate(task)
+    return TaskCoreDTO.model_validate(task)
+
 @router.delete("/{task_id}")
 async def delete_task(
     task_id: UUID,
@@ -89,9 +274,20 @@ async def delete_task(
 ) -> Any:
     success = await task_uc.delete_task(task_id, UUID(user_id))
     if not success:
-        raise HTTPException(status_code=404, detail="Task not found")
+        raise await _task_not_found(task_uc, task_id, UUID(user_id))
     return {"ok": True}
 
+@router.post("/{task_id}:restore", response_model=TaskResponseDTO)
+async def restore_task(
+    task_id: UUID,
+    user_id: str = Depends(get_current_user_id),
+    task_uc: TaskUseCase = Depends(get_task_use_case)
+) -> Any:
+    task = await task_uc.restore_task(task_id, UUID(user_id))
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return TaskResponseDTO.model_validate(task)
+
 @router.post("/{task_id}/attachments", response_model=TaskResponseDTO)
 async def upload_attachment(
     task_id: UUID,
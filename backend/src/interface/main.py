@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 import structlog
 from starlette.responses import Response
 
-from backend.src.interface.api.v1.endpoints import auth, tasks, task_lists, checklists
+from backend.src.interface.api.v1.endpoints import auth, tasks, task_lists, checklists, sync
 from backend.src.infrastructure.logging.configure import configure_logging
 from backend.src.config import settings
 from backend.src.infrastructure.scripts.init_db import init_db_data
@@ -87,4 +87,5 @@ app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["Tasks"])
 app.include_router(task_lists.router, prefix="/api/v1/task-lists", tags=["Task Lists"])
 app.include_router(checklists.router, prefix="/api/v1", tags=["Checklists"])
+app.include_router(sync.router, prefix="/api/v1/sync", tags=["Sync"])
 
@@ -124,5 +124,6 @@ def mock_file_storage() -> IFileStorage:
     storage = AsyncMock(spec=IFileStorage)
     storage.upload = AsyncMock(return_value="https://example.com/file.pdf")
     storage.delete = AsyncMock(return_value=True)
+    storage.delete_many = AsyncMock(side_effect=lambda file_urls: len(file_urls))
     return storage
 
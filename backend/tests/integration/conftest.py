@@ -2,8 +2,11 @@
 Integration test fixtures
 
 Note: Integration tests use SQLite for simplicity, but PostgreSQL-specific features
-like ARRAY types are handled via JSON conversion for tags.
+like ARRAY types are handled via JSON conversion for tags. Tests marked postgres run
+against POSTGRES_DATABASE_URL instead, to cover what only Postgres does (statement-level
+triggers, COPY), and are skipped when it is not set.
 """
+import os
 import pytest
 import warnings
 from httpx import AsyncClient
@@ -13,7 +16,8 @@ from sqlalchemy import event
 import json
 
 from backend.src.infrastructure.persistence.sqlalchemy.database import Base, get_db
-from backend.src.interface.api.dependencies import get_db_session, get_file_storage
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from backend.src.interface.api.dependencies import get_db_session, get_file_storage, get_session_factory
 from backend.src.interface.main import app
 from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
     UserModel, TaskModel, ChecklistModel, ChecklistItemModel, AttachmentModel, TaskListModel
@@ -30,24 +34,34 @@ warnings.filterwarnings("ignore", category=DeprecationWarning, module="argon2")
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# CI points DATABASE_URL at its Postgres service; TEST_POSTGRES_URL overrides it locally
+POSTGRES_DATABASE_URL = os.getenv("TEST_POSTGRES_URL") or (
+    os.getenv("DATABASE_URL") if os.getenv("DATABASE_URL", "").startswith("postgresql") else None
+)
+
 
 @pytest.fixture(scope="function")
-async def test_db_session():
+async def test_db_session(request):
     """Create a test database session"""
-    engine = create_async_engine(
-        TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    # Enable foreign keys for SQLite
-    @event.listens_for(engine.sync_engine, "connect")
-    def set_sqlite_pragma(dbapi_conn, connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        # Convert ARRAY columns to TEXT for SQLite compatibility
-        cursor.execute("PRAGMA table_info(tasks)")
-        cursor.close()
+    if request.node.get_closest_marker("postgres"):
+        if not POSTGRES_DATABASE_URL:
+            pytest.skip("needs TEST_POSTGRES_URL or a postgresql DATABASE_URL")
+        engine = create_async_engine(POSTGRES_DATABASE_URL)
+    else:
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        # Enable foreign keys for SQLite
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragma(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            # Convert ARRAY columns to TEXT for SQLite compatibility
+            cursor.execute("PRAGMA table_info(tasks)")
+            cursor.close()
     
     # For SQLite, we'll handle tags as JSON strings
     # Create tables without the ARRAY constraint
@@ -84,6 +98,7 @@ def mock_file_storage():
     mock_storage = AsyncMock(spec=IFileStorage)
     mock_storage.upload = AsyncMock(return_value="https://example.com/test-file.pdf")
     mock_storage.delete = AsyncMock(return_value=True)
+    mock_storage.delete_many = AsyncMock(side_effect=lambda file_urls: len(file_urls))
     return mock_storage
 
 
@@ -108,9 +123,15 @@ def override_file_storage(mock_file_storage):
 async def override_get_db(test_db_session):
     """Override the get_db dependency"""
     async def _get_db():
-        yield test_db_session
+        # Same transaction boundary as get_db
+        async with SQLAlchemyUnitOfWork(test_db_session):
+            yield test_db_session
     
     app.dependency_overrides[get_db_session] = _get_db
+    # Sessions opened outside the request share the test database
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        test_db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
     yield
     app.dependency_overrides.clear()
 
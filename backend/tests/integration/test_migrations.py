@@ -0,0 +1,206 @@
+"""
+Integration tests for the Alembic migration chain
+"""
+import pytest
+from pathlib import Path
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from backend.src.infrastructure.persistence.sqlalchemy.database import Base
+from backend.src.infrastructure.persistence.sqlalchemy.models import schema
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+@pytest.fixture
+def migration_connection():
+    """A sync SQLite connection with an Alembic config bound to it"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        config = Config(str(ALEMBIC_INI))
+        config.attributes["connection"] = conn
+        config.attributes["configure_logger"] = False
+        yield conn, config
+    engine.dispose()
+
+
+def _schema_diffs(conn):
+    """Differences between the migrated database and the ORM models.
+    SQLite cannot reflect UUID columns, so column type diffs are ignored."""
+    context = MigrationContext.configure(conn, opts={"include_name": schema.include_name})
+    diffs = compare_metadata(context, Base.metadata)
+    return [d for d in diffs if not (isinstance(d, list) and d[0][0] == "modify_type")]
+
+
+@pytest.mark.integration
+class TestMigrations:
+    """Integration tests for migrations"""
+
+    def test_upgrade_head_matches_models(self, migration_connection):
+        """Test migrating to head yields exactly the tables and indexes the models declare"""
+        # Arrange
+        conn, config = migration_connection
+
+        # Act
+        command.upgrade(config, "head")
+
+        # Assert
+        assert _schema_diffs(conn) == []
+
+    def test_downgrade_to_base_removes_schema(self, migration_connection):
+        """Test every migration can be reverted"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "head")
+
+        # Act
+        command.downgrade(config, "base")
+
+        # Assert
+        assert inspect(conn).get_table_names() == ["alembic_version"]
+
+    def test_priority_ordinal_upgrade_converts_rows(self, migration_connection):
+        """Test 0008 rewrites stored priorities as ordinals and keeps the tasks triggers working"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "0007")
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES ('u1', 'a@example.com', 'x')"))
+        conn.execute(text(
+            "INSERT INTO tasks (id, user_id, title, status, priority) VALUES ('t1', 'u1', 'Ship', 'todo', 'urgent')"
+        ))
+
+        # Act
+        command.upgrade(config, "head")
+        conn.execute(text(
+            "INSERT INTO tasks (id, user_id, title, status, priority) VALUES ('t2', 'u1', 'Plan', 0, 0)"
+        ))
+
+        # Assert
+        assert conn.execute(text("SELECT priority, typeof(priority) FROM tasks WHERE id = 't1'")).one() == (
+            3, "integer"
+        )
+        assert sorted(conn.execute(text("SELECT priority, task_count FROM user_task_stats")).all()) == [
+            (0, 1), (3, 1)
+        ]
+        assert conn.execute(text("SELECT count(*) FROM tasks_fts_rows")).scalar() == 2
+
+    def test_enum_code_upgrade_converts_rows(self, migration_connection):
+        """Test 0009 stores status and role as codes and the "not done" triggers follow the new codes"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "0008")
+        conn.execute(text("INSERT INTO users (id, email, password_hash, role) VALUES ('u1', 'a@example.com', 'x', 'admin')"))
+        conn.execute(text(
+            "INSERT INTO tasks (id, user_id, title, status, priority, due_date) "
+            "VALUES ('t1', 'u1', 'Done', 'done', 1, '2030-01-01 09:00:00')"
+        ))
+
+        # Act
+        command.upgrade(config, "head")
+        conn.execute(text(
+            "INSERT INTO tasks (id, user_id, title, status, priority, due_date) "
+            "VALUES ('t2', 'u1', 'Open', 1, 1, '2030-01-01 10:00:00')"
+        ))
+
+        # Assert
+        assert conn.execute(text("SELECT role FROM users")).scalar() == 1
+        assert sorted(conn.execute(text("SELECT status, task_count FROM user_task_stats")).all()) == [(1, 1), (2, 1)]
+        assert conn.execute(text("SELECT open_count FROM user_task_due_stats")).scalar() == 1
+
+    def test_sync_changes_upgrade_backfills_rows(self, migration_connection):
+        """Test 0012 gives existing rows a change sequence and later writes continue after it"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "0011")
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES ('u1', 'a@example.com', 'x')"))
+        conn.execute(text("INSERT INTO tasks (id, user_id, title, status, priority) VALUES ('t1', 'u1', 'Old', 0, 1)"))
+        conn.execute(text("INSERT INTO checklists (id, task_id, title) VALUES ('c1', 't1', 'Steps')"))
+
+        # Act
+        command.upgrade(config, "head")
+        conn.execute(text("INSERT INTO tasks (id, user_id, title, status, priority) VALUES ('t2', 'u1', 'New', 0, 1)"))
+        conn.execute(text("DELETE FROM checklists WHERE id = 'c1'"))
+
+        # Assert
+        assert conn.execute(text(
+            "SELECT entity_type, entity_id, user_id, change_seq, deleted FROM sync_changes ORDER BY change_seq"
+        )).all() == [(0, "t1", "u1", 1, 0), (0, "t2", "u1", 3, 0), (2, "c1", "u1", 4, 1)]
+
+    def test_reminders_upgrade_backfills_open_tasks(self, migration_connection):
+        """Test 0013 queues reminders for open tasks still due and later edits keep the queue current"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "0012")
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES ('u1', 'a@example.com', 'x')"))
+        for task_id, status, due in (("t1", 0, "+2 days"), ("t2", 2, "+2 days"), ("t3", 0, "-2 days")):
+            conn.execute(text(
+                "INSERT INTO tasks (id, user_id, title, status, priority, due_date) "
+                "VALUES (:id, 'u1', 'Task', :status, 1, datetime('now', :due))"
+            ), {"id": task_id, "status": status, "due": due})
+
+        # Act
+        command.upgrade(config, "head")
+        backfilled = conn.execute(text("SELECT task_id FROM reminders")).scalars().all()
+        conn.execute(text("UPDATE tasks SET status = 0 WHERE id = 't2'"))
+        conn.execute(text("UPDATE tasks SET status = 2 WHERE id = 't1'"))
+
+        # Assert
+        assert backfilled == ["t1"]
+        assert conn.execute(text(
+            "SELECT task_id, fire_at = datetime(due_date, '-24 hours') FROM reminders"
+        )).all() == [("t2", 1)]
+
+    def test_sync_archive_moves_upgrade_skips_tombstones(self, migration_connection):
+        """Test after 0015 rows deleted once copied to the archive keep their log entry, other deletes do not"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "head")
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES ('u1', 'a@example.com', 'x')"))
+        for task_id in ("t1", "t2"):
+            conn.execute(text(
+                "INSERT INTO tasks (id, user_id, title, status, priority) VALUES (:id, 'u1', 'Task', 2, 1)"
+            ), {"id": task_id})
+        conn.execute(text(
+            "INSERT INTO archived_tasks (id, user_id, title, status, priority) VALUES ('t1', 'u1', 'Task', 2, 1)"
+        ))
+
+        # Act
+        conn.execute(text("DELETE FROM tasks"))
+
+        # Assert
+        assert conn.execute(text(
+            "SELECT entity_id, deleted FROM sync_changes ORDER BY entity_id"
+        )).all() == [("t1", 0), ("t2", 1)]
+
+    def test_sync_task_tombstone_upgrade_relogs_children(self, migration_connection):
+        """Test 0016 re-logs the children of tombstoned tasks, and later tombstone changes re-log them again"""
+        # Arrange
+        conn, config = migration_connection
+        command.upgrade(config, "0015")
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES ('u1', 'a@example.com', 'x')"))
+        for task_id, deleted_at in (("t1", "2026-01-01 00:00:00"), ("t2", None)):
+            conn.execute(text(
+                "INSERT INTO tasks (id, user_id, title, status, priority, deleted_at) "
+                "VALUES (:id, 'u1', 'Task', 0, 1, :deleted_at)"
+            ), {"id": task_id, "deleted_at": deleted_at})
+            conn.execute(text(
+                "INSERT INTO checklists (id, task_id, title) VALUES (:id, :task_id, 'Steps')"
+            ), {"id": f"c{task_id}", "task_id": task_id})
+            conn.execute(text(
+                "INSERT INTO checklist_items (id, checklist_id, content) VALUES (:id, :checklist_id, 'Do')"
+            ), {"id": f"i{task_id}", "checklist_id": f"c{task_id}"})
+        seqs = lambda: dict(conn.execute(text("SELECT entity_id, change_seq FROM sync_changes")).all())
+        before = seqs()
+
+        # Act
+        command.upgrade(config, "head")
+        upgraded = seqs()
+        conn.execute(text("UPDATE tasks SET deleted_at = NULL WHERE id = 't1'"))
+        restored = seqs()
+
+        # Assert
+        assert sorted(key for key in before if upgraded[key] != before[key]) == ["ct1", "it1"]
+        assert sorted(key for key in upgraded if restored[key] != upgraded[key]) == ["ct1", "it1", "t1"]
@@ -0,0 +1,45 @@
+"""
+Integration tests for the connection pool metrics
+"""
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.src.infrastructure.persistence.sqlalchemy.pool import InstrumentedAsyncQueuePool
+
+
+def _sample(name: str, pool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": pool}) or 0.0
+
+
+@pytest.mark.integration
+class TestPoolMetrics:
+    """Integration tests for InstrumentedAsyncQueuePool"""
+
+    @pytest.mark.asyncio
+    async def test_checkout_latency_and_saturation(self, tmp_path):
+        """Test checkouts are timed and in-use connections are reported against capacity"""
+        # Arrange
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_logging_name="metrics-test",
+        )
+        checkouts_before = _sample("db_pool_checkout_seconds_count", "metrics-test")
+
+        try:
+            # Act
+            async with engine.connect() as first, engine.connect() as second:
+                await first.execute(text("SELECT 1"))
+                await second.execute(text("SELECT 1"))
+                saturation_while_held = _sample("db_pool_saturation_ratio", "metrics-test")
+
+            # Assert
+            assert _sample("db_pool_checkout_seconds_count", "metrics-test") == checkouts_before + 2
+            assert saturation_while_held == 1.0
+            assert _sample("db_pool_connections_in_use", "metrics-test") == 0
+        finally:
+            await engine.dispose()
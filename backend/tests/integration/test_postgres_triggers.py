@@ -0,0 +1,158 @@
+"""
+Integration tests for the Postgres-only write paths: statement-level triggers and COPY
+"""
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.config import settings
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import SyncChangeModel, UserModel
+
+
+def _ndjson(*rows) -> str:
+    return "".join(json.dumps(row) + "\n" for row in rows)
+
+
+@pytest.mark.integration
+@pytest.mark.postgres
+class TestPostgresTriggers:
+    """Integration tests run against PostgreSQL; skipped without a Postgres URL"""
+
+    @pytest.mark.asyncio
+    async def test_stats_follow_bulk_statements(self, authenticated_client: AsyncClient):
+        """Test the counters stay exact when one statement inserts, updates or tombstones several tasks"""
+        # Arrange
+        # due_date is a naive UTC column
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        specs = [
+            ("Overdue", "high", now - timedelta(days=1), ["sprint"]),
+            ("Soon", "high", now + timedelta(days=2), []),
+            ("Later", "low", now + timedelta(days=20), []),
+            ("Undated", "low", None, ["sprint"]),
+            ("Dropped", "urgent", now + timedelta(days=1), []),
+            ("Late", "medium", now - timedelta(days=2), []),
+        ]
+        batch = await authenticated_client.post("/api/v1/tasks:batch", json={"tasks": [
+            {"title": title, "priority": priority, "due_date": due_date.isoformat() if due_date else None, "tags": tags}
+            for title, priority, due_date, tags in specs
+        ]})
+        ids = [result["task"]["id"] for result in batch.json()["results"]]
+
+        # Act
+        await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate", json={"filter": {"tags": ["sprint"]}, "changes": {"status": "done"}}
+        )
+        await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate", json={"ids": [ids[2]], "changes": {"priority": "medium"}}
+        )
+        await authenticated_client.post("/api/v1/tasks:batchDelete", json={"ids": [ids[4]]})
+        response = await authenticated_client.get("/api/v1/tasks/stats")
+
+        # Assert
+        assert batch.json()["created"] == 6
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 5,
+            "by_status": {"todo": 3, "in_progress": 0, "done": 2},
+            "by_priority": {"low": 1, "medium": 2, "high": 2, "urgent": 0},
+            "overdue": 1,
+            "due_this_week": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_log_follows_bulk_statements(
+        self, authenticated_client: AsyncClient, test_db_session: AsyncSession, test_user: UserModel
+    ):
+        """Test each row a bulk statement writes gets its own change row and deletes become tombstones"""
+        # Arrange
+        batch = await authenticated_client.post(
+            "/api/v1/tasks:batch", json={"tasks": [{"title": "A"}, {"title": "B"}, {"title": "C"}]}
+        )
+        ids = [result["task"]["id"] for result in batch.json()["results"]]
+        task_list = (await authenticated_client.post("/api/v1/task-lists/", json={"name": "Gone"})).json()
+        token = (await authenticated_client.get("/api/v1/sync")).json()["next_token"]
+
+        # Act
+        await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate", json={"ids": ids[:2], "changes": {"priority": "urgent"}}
+        )
+        await authenticated_client.post("/api/v1/tasks:batchDelete", json={"ids": [ids[2]]})
+        await authenticated_client.delete(f"/api/v1/task-lists/{task_list['id']}")
+        changes = (await authenticated_client.get("/api/v1/sync", params={"since": token})).json()
+        log = (await test_db_session.execute(
+            select(SyncChangeModel.entity_id, SyncChangeModel.change_seq, SyncChangeModel.deleted)
+            .where(SyncChangeModel.user_id == test_user.id)
+        )).all()
+
+        # Assert
+        assert sorted(t["title"] for t in changes["tasks"]) == ["A", "B"]
+        assert all(t["priority"] == "urgent" for t in changes["tasks"])
+        assert sorted((d["entity"], d["id"]) for d in changes["deleted"]) == sorted([
+            ("task", ids[2]), ("task_list", task_list["id"]),
+        ])
+        assert len(log) == 4
+        assert len({entry.change_seq for entry in log}) == 4
+        assert {str(entry.entity_id) for entry in log if entry.deleted} == {task_list["id"]}
+
+    @pytest.mark.asyncio
+    async def test_copy_import_reports_bad_row(self, authenticated_client: AsyncClient, monkeypatch):
+        """Test COPY loads the valid rows with their lists and items, fires the triggers, and reports the bad row"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_IMPORT_CHUNK_SIZE", 2)
+        body = _ndjson(
+            {"title": "Write report", "priority": "high", "tags": ["work", "q3"], "status": "in_progress"},
+            {"title": "Buy milk", "task_list": "Errands", "checklist_items": [
+                {"content": "Whole"}, {"content": "Oat", "is_completed": True},
+            ]},
+            {"title": ""},
+            {"title": "Post letter", "task_list": "Errands"},
+        )
+
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:import", content=body)
+
+        # Assert
+        assert response.status_code == 200
+        result = response.json()
+        assert (result["imported"], result["failed"]) == (3, 1)
+        assert [(e["row"], e["error"].split(":")[0]) for e in result["errors"]] == [(3, "title")]
+        tasks = (await authenticated_client.get("/api/v1/tasks/")).json()
+        assert sorted((t["title"], t["status"], t["tags"]) for t in tasks) == [
+            ("Buy milk", "todo", []), ("Post letter", "todo", []), ("Write report", "in_progress", ["work", "q3"]),
+        ]
+        milk = next(t for t in tasks if t["title"] == "Buy milk")
+        assert [(i["content"], i["is_completed"]) for i in milk["checklists"][0]["items"]] == [
+            ("Whole", False), ("Oat", True),
+        ]
+        found = (await authenticated_client.get("/api/v1/tasks/", params={"search": "report"})).json()
+        assert [t["title"] for t in found] == ["Write report"]
+        stats = (await authenticated_client.get("/api/v1/tasks/stats")).json()
+        assert (stats["total"], stats["by_status"]["in_progress"]) == (3, 1)
+        synced = (await authenticated_client.get("/api/v1/sync")).json()
+        assert (len(synced["tasks"]), len(synced["task_lists"]), len(synced["checklist_items"])) == (3, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_copy_import_reports_rejected_chunk(self, authenticated_client: AsyncClient, monkeypatch):
+        """Test a chunk COPY rejects fails row by row while the chunks around it are imported"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_IMPORT_CHUNK_SIZE", 2)
+        # Postgres text cannot hold a NUL character, so the server rejects the first chunk
+        body = _ndjson({"title": "Fine"}, {"title": "Nul\u0000"}, {"title": "Later"})
+
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:import", content=body)
+
+        # Assert
+        assert response.status_code == 200
+        result = response.json()
+        assert (result["imported"], result["failed"]) == (1, 2)
+        assert [(e["row"], e["error"].startswith("Database error")) for e in result["errors"]] == [
+            (1, True), (2, True),
+        ]
+        tasks = (await authenticated_client.get("/api/v1/tasks/")).json()
+        assert [t["title"] for t in tasks] == ["Later"]
+        stats = (await authenticated_client.get("/api/v1/tasks/stats")).json()
+        assert stats["total"] == 1
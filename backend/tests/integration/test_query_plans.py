@@ -0,0 +1,319 @@
+"""
+Query plan tests for the repository hot paths.
+
+Each test captures the SQL a repository method actually issues, runs
+EXPLAIN QUERY PLAN on it against seeded data and fails if any application
+table is read with a full scan instead of an index search.
+"""
+import re
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.src.application.dtos.task_dtos import TaskCursorDTO
+from backend.src.domain.entities.models import TaskSort, TaskStatus
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
+    UserModel, TaskModel, TaskListModel, ChecklistModel, ChecklistItemModel, AttachmentModel
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_list_repository import (
+    SQLAlchemyTaskListRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.checklist_repository import (
+    SQLAlchemyChecklistRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_search import SQLiteTaskSearch
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_archive import SQLAlchemyTaskArchive
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.sync_repository import SQLAlchemySyncRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_export import SQLAlchemyTaskExport
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.reminder_repository import (
+    SQLAlchemyReminderRepository
+)
+
+APP_TABLES = ("users", "task_lists", "tasks", "checklists", "checklist_items", "attachments", "user_task_stats",
+              "user_task_due_stats", "archived_tasks", "archived_checklists", "archived_checklist_items",
+              "archived_attachments", "sync_changes", "reminders", "reminder_deliveries")
+FULL_SCAN = re.compile(r"\bSCAN (%s)\b" % "|".join(APP_TABLES))
+
+
+@pytest.fixture
+async def seeded(test_db_session: AsyncSession):
+    """Two users with tasks, lists, checklists, items and attachments"""
+    users = [UserModel(id=uuid4(), email=f"plan{i}@example.com", password_hash="x") for i in range(2)]
+    test_db_session.add_all(users)
+    await test_db_session.flush()
+    now = datetime.utcnow()
+    for user in users:
+        task_list = TaskListModel(id=uuid4(), user_id=user.id, name="List")
+        test_db_session.add(task_list)
+        await test_db_session.flush()
+        for i in range(30):
+            task = TaskModel(
+                id=uuid4(),
+                user_id=user.id,
+                task_list_id=task_list.id if i % 2 else None,
+                title=f"Task {i}",
+                status=[s.value for s in TaskStatus][i % 3],
+                priority="medium",
+                due_date=now + timedelta(hours=i),
+                tags=[],
+                created_at=now - timedelta(minutes=i),
+            )
+            test_db_session.add(task)
+            await test_db_session.flush()
+            checklist = ChecklistModel(id=uuid4(), task_id=task.id, title="Steps")
+            test_db_session.add(checklist)
+            await test_db_session.flush()
+            test_db_session.add(ChecklistItemModel(id=uuid4(), checklist_id=checklist.id, content="Do it"))
+            test_db_session.add(AttachmentModel(
+                id=uuid4(), task_id=task.id, filename="a.txt", file_url="u", file_size_bytes=1, content_type="text/plain"
+            ))
+    # No ANALYZE: on a table this small real statistics make a scan cheapest,
+    # while the default estimates model the large tables these indexes are for
+    await test_db_session.commit()
+    return users[0], task_list
+
+
+@pytest.fixture
+def captured_sql(test_db_session: AsyncSession):
+    """Records every SELECT sent to the database while the test runs"""
+    statements = []
+    sync_engine = test_db_session.bind.sync_engine
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(sync_engine, "before_cursor_execute", _capture)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", _capture)
+
+
+@pytest.fixture
+def captured_deletes(test_db_session: AsyncSession):
+    """Records every DELETE sent to the database while the test runs"""
+    statements = []
+    sync_engine = test_db_session.bind.sync_engine
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("DELETE"):
+            statements.append((statement, parameters))
+
+    event.listen(sync_engine, "before_cursor_execute", _capture)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", _capture)
+
+
+async def _assert_no_full_scans(session: AsyncSession, statements, forbidden=FULL_SCAN):
+    assert statements, "no queries were captured"
+    raw = await session.connection()
+    dbapi_conn = (await raw.get_raw_connection()).driver_connection
+    for statement, parameters in statements:
+        cursor = await dbapi_conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plan = [row[3] for row in await cursor.fetchall()]
+        scans = [line for line in plan if forbidden.search(line)]
+        assert not scans, f"full scan in plan {plan} for:\n{statement}"
+
+
+@pytest.mark.integration
+class TestQueryPlans:
+    """Query plan tests for repository hot paths"""
+
+    @pytest.mark.asyncio
+    async def test_list_by_user_uses_indexes(self, test_db_session, seeded, captured_sql):
+        """Test the full listing and its child loads are index searches"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        tasks = await repo.list_by_user(user.id, {}, limit=10)
+        await repo.list_by_user(user.id, {}, limit=10, after=(tasks[-1].created_at, tasks[-1].id))
+        await repo.list_by_user(user.id, {"status": "todo"}, limit=10)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_sorted_listings_read_in_index_order(self, test_db_session, seeded, captured_sql):
+        """Test every sort, first page and keyset seek, is an index search with no sort step"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        for sort in TaskSort:
+            tasks = await repo.list_summaries_by_user(user.id, {}, limit=10, sort=sort)
+            after = TaskCursorDTO.after(tasks[-1], sort).keyset()
+            await repo.list_summaries_by_user(user.id, {}, limit=10, sort=sort, after=after)
+
+        await _assert_no_full_scans(
+            test_db_session, captured_sql, re.compile(FULL_SCAN.pattern + r"|USE TEMP B-TREE FOR ORDER BY")
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_by_task_list_uses_indexes(self, test_db_session, seeded, captured_sql):
+        """Test filtering by task list is an index search"""
+        user, task_list = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        await repo.list_by_user(user.id, {"task_list_id": task_list.id}, limit=10)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_list_summaries_uses_indexes(self, test_db_session, seeded, captured_sql):
+        """Test the summary projection's count subqueries are index searches"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        await repo.list_summaries_by_user(user.id, {}, limit=10)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_uses_indexes(self, test_db_session, seeded, captured_sql):
+        """Test loading a single aggregate is index searches only"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        task = (await repo.list_by_user(user.id, {}, limit=1))[0]
+        captured_sql.clear()
+
+        await repo.get_by_id(task.id)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_reminder_pop_uses_fire_at_index(self, test_db_session, seeded, captured_sql, captured_deletes):
+        """Test taking due reminders reads only the fire_at index and the tasks by primary key"""
+        reminders = await SQLAlchemyReminderRepository(test_db_session).pop_due(
+            datetime.utcnow() + timedelta(hours=30), 5
+        )
+
+        assert len(reminders) == 5
+        assert captured_deletes
+        await _assert_no_full_scans(test_db_session, captured_sql + captured_deletes)
+
+    @pytest.mark.asyncio
+    async def test_delivery_ledger_prune_uses_indexes(self, test_db_session, seeded, captured_deletes):
+        """Test pruning the delivery ledger reads only its due date index and primary key"""
+        repo = SQLAlchemyReminderRepository(test_db_session)
+        reminders = await repo.pop_due(datetime.utcnow() + timedelta(hours=30), 5)
+        await repo.record_deliveries(reminders, datetime.utcnow())
+        captured_deletes.clear()
+
+        pruned = await repo.prune_deliveries(datetime.utcnow() + timedelta(hours=3), 2)
+
+        assert pruned == 2
+        await _assert_no_full_scans(test_db_session, captured_deletes)
+
+    @pytest.mark.asyncio
+    async def test_archive_reads_use_indexes(self, test_db_session, seeded, captured_sql):
+        """Test picking a batch reads only the done-task index and merged listings search both sides"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        await SQLAlchemyTaskArchive(test_db_session).archive_done_before(
+            datetime.now(timezone.utc) + timedelta(days=1), 5
+        )
+        tasks = await repo.list_by_user(user.id, {}, limit=10, include_archived=True)
+        await repo.list_by_user(
+            user.id, {}, limit=10, after=(tasks[-1].created_at, tasks[-1].id), include_archived=True
+        )
+        await repo.list_summaries_by_user(user.id, {}, limit=10, include_archived=True)
+        await repo.count_by_user(user.id, {}, cap=100, include_archived=True)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_purge_reads_use_indexes(self, test_db_session, seeded, captured_sql):
+        """Test picking a purge batch reads only the tombstone index"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        tasks = await repo.list_by_user(user.id, {}, limit=3)
+        await repo.bulk_delete(user.id, {"task_ids": [task.id for task in tasks]})
+        captured_sql.clear()
+
+        await repo.purge_deleted_before(datetime.utcnow() + timedelta(minutes=1), 5)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_sync_uses_change_index(self, test_db_session, seeded, captured_sql):
+        """Test a sync with nothing new is one index probe, and a batch of changes stays on indexes"""
+        user, _ = seeded
+        repo = SQLAlchemySyncRepository(test_db_session)
+        latest = (await repo.changes_since(user.id, 0, 1000)).last_seq
+        captured_sql.clear()
+
+        unchanged = await repo.changes_since(user.id, latest, 100)
+
+        assert unchanged.last_seq == latest
+        assert len(captured_sql) == 1
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+        captured_sql.clear()
+        changes = await repo.changes_since(user.id, 0, 50)
+
+        assert changes.has_more is True
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_export_streams_in_index_order(self, test_db_session, seeded, captured_sql):
+        """Test the export cursors, with and without checklist items, read tasks through indexes"""
+        user, _ = seeded
+        export = SQLAlchemyTaskExport(async_sessionmaker(test_db_session.bind, expire_on_commit=False))
+
+        plain = [task async for task in export.stream_by_user(user.id, {"status": "todo"}, include_archived=True)]
+        full = [task async for task in export.stream_by_user(user.id, {}, with_checklist_items=True)]
+
+        assert len(plain) == 10
+        assert len(full) == 30 and all(len(task.checklists[0].items) == 1 for task in full)
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_task_list_and_checklist_lookups_use_indexes(self, test_db_session, seeded, captured_sql):
+        """Test task list listing and checklist loads are index searches"""
+        user, _ = seeded
+        task_repo = SQLAlchemyTaskRepository(test_db_session)
+        task = (await task_repo.list_by_user(user.id, {}, limit=1))[0]
+        captured_sql.clear()
+
+        await SQLAlchemyTaskListRepository(test_db_session).list_by_user(user.id)
+        await SQLAlchemyChecklistRepository(test_db_session).get_checklist_by_id(task.checklists[0].id)
+
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_search_uses_fts_index(self, test_db_session, seeded, captured_sql):
+        """Test ranked search is answered by the FTS index, not by scanning tasks"""
+        user, _ = seeded
+
+        ids = await SQLiteTaskSearch(test_db_session).search(user.id, "task", {"status": "todo"}, limit=5)
+
+        assert len(ids) == 5
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_counts_use_counters_and_indexes(self, test_db_session, seeded, captured_sql):
+        """Test listing totals read the counter rows, and capped counts stay on indexes"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        total = await repo.count_by_user(user.id, {}, cap=1000)
+        todo = await repo.count_by_user(user.id, {"status": "todo"}, cap=1000)
+        matching = await repo.count_by_user(user.id, {"search": "Task"}, cap=10)
+
+        assert (total, todo, matching) == ((30, True), (10, True), (10, False))
+        assert all("user_task_stats" in statement for statement, _ in captured_sql[:2])
+        await _assert_no_full_scans(test_db_session, captured_sql)
+
+    @pytest.mark.asyncio
+    async def test_stats_use_counters_and_indexes(self, test_db_session, seeded, captured_sql):
+        """Test dashboard stats read counter rows and today's slice of the open due date index"""
+        user, _ = seeded
+        repo = SQLAlchemyTaskRepository(test_db_session)
+
+        stats = await repo.get_stats(user.id)
+
+        # Every seeded task is due within 30 hours; a third of them are done
+        assert stats.total == 30
+        assert stats.overdue + stats.due_this_week == 20
+        await _assert_no_full_scans(test_db_session, captured_sql)
@@ -0,0 +1,122 @@
+"""
+Integration tests for routing read-only use-case calls to read replicas
+"""
+import pytest
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.src.application.dtos.task_list_dtos import TaskListCreateDTO
+from backend.src.application.use_cases.task_list_use_case import TaskListUseCase
+from backend.src.infrastructure.persistence.sqlalchemy.database import Base
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import TaskListModel
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_list_repository import (
+    SQLAlchemyTaskListRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.routing import (
+    REPLICA_FALLBACKS, LocalRecentWrites, RoutingSession, SessionRouter
+)
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+
+
+async def _memory_engine(name: str):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool, pool_logging_name=name
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+@pytest.fixture
+async def engines():
+    primary = await _memory_engine("primary")
+    replica = await _memory_engine("replica-1")
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+def _session_factory(primary, replicas):
+    router = SessionRouter(replicas, LocalRecentWrites(60), retry_after_seconds=60)
+    return async_sessionmaker(
+        primary, class_=AsyncSession, sync_session_class=RoutingSession, router=router, expire_on_commit=False
+    ), router
+
+
+async def _add_list(engine, user_id, name):
+    async with AsyncSession(engine) as session:
+        session.add(TaskListModel(user_id=user_id, name=name))
+        await session.commit()
+
+
+async def _list_names(session_factory, user_id):
+    async with session_factory() as session:
+        use_case = TaskListUseCase(SQLAlchemyTaskListRepository(session), SQLAlchemyUnitOfWork(session, user_id))
+        return [task_list.name for task_list in await use_case.get_user_task_lists(user_id)]
+
+
+@pytest.mark.integration
+class TestReadRouting:
+    """Integration tests for the replica session router"""
+
+    @pytest.mark.asyncio
+    async def test_read_only_call_is_served_by_replica(self, engines):
+        """Test a read-only use-case method reads from the replica"""
+        # Arrange
+        primary, replica = engines
+        user_id = uuid4()
+        await _add_list(primary, user_id, "on primary")
+        await _add_list(replica, user_id, "on replica")
+        session_factory, _ = _session_factory(primary, [replica])
+
+        # Act
+        names = await _list_names(session_factory, user_id)
+
+        # Assert
+        assert names == ["on replica"]
+
+    @pytest.mark.asyncio
+    async def test_user_reads_own_writes_from_primary(self, engines):
+        """Test a user's reads stay on the primary after their write commits; other users still use the replica"""
+        # Arrange
+        primary, replica = engines
+        writer, other = uuid4(), uuid4()
+        await _add_list(replica, other, "replicated")
+        session_factory, _ = _session_factory(primary, [replica])
+
+        # Act
+        async with session_factory() as session:
+            uow = SQLAlchemyUnitOfWork(session, writer)
+            use_case = TaskListUseCase(SQLAlchemyTaskListRepository(session), uow)
+            await use_case.create_task_list(writer, TaskListCreateDTO(name="just written"))
+            in_request = [task_list.name for task_list in await use_case.get_user_task_lists(writer)]
+            await uow.commit()
+
+        # Assert
+        assert in_request == ["just written"]
+        assert await _list_names(session_factory, writer) == ["just written"]
+        assert await _list_names(session_factory, other) == ["replicated"]
+
+    @pytest.mark.asyncio
+    async def test_unavailable_replica_falls_back_to_primary(self, engines):
+        """Test a replica that cannot connect is retried on the primary and then skipped"""
+        # Arrange
+        primary, _ = engines
+        broken = create_async_engine(
+            "sqlite+aiosqlite:////nonexistent-directory/replica.db", pool_logging_name="replica-broken"
+        )
+        user_id = uuid4()
+        await _add_list(primary, user_id, "on primary")
+        session_factory, router = _session_factory(primary, [broken])
+        fallbacks = REPLICA_FALLBACKS.labels(pool="replica-broken")
+        before = fallbacks._value.get()
+
+        # Act
+        names = await _list_names(session_factory, user_id)
+
+        # Assert
+        assert names == ["on primary"]
+        assert fallbacks._value.get() == before + 1
+        assert await router.replica_for(user_id) is None
+        await broken.dispose()
@@ -0,0 +1,155 @@
+"""
+Integration tests for the reminders queue
+"""
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from backend.src.config import settings
+from backend.src.domain.entities.models import User, Task, TaskStatus
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import (
+    ReminderModel, ReminderDeliveryModel, REMINDER_LEAD_HOURS
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.reminder_repository import (
+    SQLAlchemyReminderRepository
+)
+from backend.src.infrastructure.services.worker.tasks import _check_due_tasks_async
+
+
+async def _queued(session) -> dict:
+    result = await session.execute(select(ReminderModel.task_id, ReminderModel.due_date, ReminderModel.fire_at))
+    return {row.task_id: (row.due_date, row.fire_at) for row in result.all()}
+
+
+@pytest.mark.integration
+class TestReminders:
+    """Integration tests for the trigger-maintained reminders table and the job draining it"""
+
+    @pytest.mark.asyncio
+    async def test_triggers_follow_due_date_status_and_tombstones(self, test_db_session):
+        """Test open tasks with a due date are queued, re-queued when it moves and dropped when closed"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="remind@example.com", password_hash="x"))
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        due = datetime.utcnow().replace(microsecond=0) + timedelta(days=2)
+        dated = await repo.create(Task(user_id=user.id, title="Dated", due_date=due))
+        undated = await repo.create(Task(user_id=user.id, title="Undated"))
+        done = await repo.create(Task(user_id=user.id, title="Done", status=TaskStatus.DONE, due_date=due))
+
+        # Act
+        created = await _queued(test_db_session)
+        dated.due_date = due + timedelta(days=1)
+        await repo.update(dated)
+        done.status = TaskStatus.TODO
+        await repo.update(done)
+        moved = await _queued(test_db_session)
+        await repo.delete(dated.id, user.id)
+        deleted = await _queued(test_db_session)
+        await repo.restore(dated.id, user.id)
+        restored = await _queued(test_db_session)
+
+        # Assert
+        assert created == {dated.id: (due, due - timedelta(hours=REMINDER_LEAD_HOURS))}
+        assert undated.id not in moved
+        assert moved[dated.id][0] == due + timedelta(days=1)
+        assert moved[done.id][0] == due
+        assert set(deleted) == {done.id}
+        assert set(restored) == {dated.id, done.id}
+
+    @pytest.mark.asyncio
+    async def test_popped_reminder_is_not_requeued_by_other_edits(self, test_db_session):
+        """Test a sent reminder stays sent when the task is edited without moving its due date"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="edit@example.com", password_hash="x"))
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        task = await repo.create(Task(user_id=user.id, title="Soon", due_date=datetime.utcnow() + timedelta(hours=2)))
+        popped = await SQLAlchemyReminderRepository(test_db_session).pop_due(datetime.utcnow(), 10)
+
+        # Act
+        task.title = "Renamed"
+        task.status = TaskStatus.IN_PROGRESS
+        await repo.update(task)
+
+        # Assert
+        assert [reminder.task_id for reminder in popped] == [task.id]
+        assert popped[0].title == "Soon"
+        assert await _queued(test_db_session) == {}
+
+    @pytest.mark.asyncio
+    async def test_worker_job_sends_due_reminders_in_batches(self, test_db_session, monkeypatch):
+        """Test the job drains every due reminder, skips ones already past due and leaves later ones queued"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="job@example.com", password_hash="x"))
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        now = datetime.utcnow()
+        for hours in (1, 2, 3):
+            await repo.create(Task(user_id=user.id, title=f"Due in {hours}h", due_date=now + timedelta(hours=hours)))
+        await repo.create(Task(user_id=user.id, title="Overdue", due_date=now - timedelta(hours=1)))
+        later = await repo.create(Task(user_id=user.id, title="Later", due_date=now + timedelta(days=3)))
+        await test_db_session.commit()
+        monkeypatch.setattr(settings, "REMINDER_BATCH_SIZE", 2)
+        session_factory = async_sessionmaker(test_db_session.bind, expire_on_commit=False)
+
+        # Act
+        sent = await _check_due_tasks_async(session_factory)
+
+        # Assert
+        assert sent == 3
+        assert set(await _queued(test_db_session)) == {later.id}
+
+    @pytest.mark.asyncio
+    async def test_worker_job_does_not_resend_after_reopen(self, test_db_session, monkeypatch):
+        """Test a task reopened with the same due date is requeued but its reminder is not sent twice"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="again@example.com", password_hash="x"))
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        task = await repo.create(Task(user_id=user.id, title="Soon", due_date=datetime.utcnow() + timedelta(hours=2)))
+        moved = await repo.create(Task(user_id=user.id, title="Moved", due_date=datetime.utcnow() + timedelta(hours=2)))
+        await test_db_session.commit()
+        session_factory = async_sessionmaker(test_db_session.bind, expire_on_commit=False)
+        first = await _check_due_tasks_async(session_factory)
+        task.status = TaskStatus.DONE
+        await repo.update(task)
+        task.status = TaskStatus.TODO
+        await repo.update(task)
+        moved.due_date = moved.due_date + timedelta(hours=1)
+        await repo.update(moved)
+        await test_db_session.commit()
+        requeued = set(await _queued(test_db_session))
+
+        # Act
+        second = await _check_due_tasks_async(session_factory)
+
+        # Assert
+        assert first == 2
+        assert requeued == {task.id, moved.id}
+        assert second == 1
+        assert await _queued(test_db_session) == {}
+        assert await test_db_session.scalar(select(func.count()).select_from(ReminderDeliveryModel)) == 3
+
+    @pytest.mark.asyncio
+    async def test_ledger_records_each_delivery_once_and_prunes_past_due_dates(self, test_db_session):
+        """Test overlapping claims of one batch record it once and entries go after their due date"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="ledger@example.com", password_hash="x"))
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        now = datetime.utcnow()
+        for hours in (1, 2, 3):
+            await repo.create(Task(user_id=user.id, title=f"Due in {hours}h", due_date=now + timedelta(hours=hours)))
+        reminders_repo = SQLAlchemyReminderRepository(test_db_session)
+        reminders = await reminders_repo.pop_due(now, 10)
+
+        # Act
+        first = await reminders_repo.record_deliveries(reminders[:2], now)
+        second = await reminders_repo.record_deliveries(reminders, now)
+        pruned = await reminders_repo.prune_deliveries(now + timedelta(hours=2, minutes=30), 10)
+
+        # Assert
+        assert first == reminders[:2]
+        assert second == reminders[2:]
+        assert pruned == 2
+        remaining = await test_db_session.scalars(select(ReminderDeliveryModel.task_id))
+        assert list(remaining) == [reminders[2].task_id]
@@ -0,0 +1,150 @@
+"""
+Integration tests for the SQL issued by repository write paths
+"""
+import pytest
+from datetime import timedelta
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.entities.models import User, Task, TaskList, Checklist, ChecklistItem, Attachment
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_list_repository import (
+    SQLAlchemyTaskListRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.checklist_repository import (
+    SQLAlchemyChecklistRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_import import SQLAlchemyTaskImport
+from backend.src.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+
+
+@pytest.fixture
+def executed_sql(test_db_session: AsyncSession):
+    """Records every statement sent to the database while the test runs"""
+    statements = []
+    sync_engine = test_db_session.bind.sync_engine
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().upper())
+
+    event.listen(sync_engine, "before_cursor_execute", _capture)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", _capture)
+
+
+@pytest.mark.integration
+class TestRepositoryWrites:
+    """Integration tests for repository write paths"""
+
+    @pytest.mark.asyncio
+    async def test_creates_do_not_read_back(self, test_db_session, executed_sql):
+        """Test every create returns the stored row without a follow-up SELECT"""
+        # Arrange
+        user = User(email="writes@example.com", password_hash="x")
+        task = Task(user_id=user.id, title="Write path")
+        task.attachments.append(Attachment(
+            task_id=task.id, filename="a.txt", file_url="u", file_size_bytes=1, content_type="text/plain"
+        ))
+
+        # Act
+        created_user = await SQLAlchemyUserRepository(test_db_session).create(user)
+        task_list = await SQLAlchemyTaskListRepository(test_db_session).create(TaskList(user_id=user.id, name="L"))
+        created_task = await SQLAlchemyTaskRepository(test_db_session).create(task)
+        checklist_repo = SQLAlchemyChecklistRepository(test_db_session)
+        checklist = await checklist_repo.create_checklist(Checklist(task_id=task.id, title="Steps"))
+        item = await checklist_repo.add_item(ChecklistItem(checklist_id=checklist.id, content="Do it"))
+
+        # Assert
+        assert not [s for s in executed_sql if s.startswith("SELECT")]
+        assert created_user.id == user.id and created_user.created_at is not None
+        assert task_list.name == "L"
+        assert created_task.attachments[0].task_id == task.id
+        assert checklist.items == []
+        assert item.checklist_id == checklist.id
+
+        stored = await SQLAlchemyTaskRepository(test_db_session).get_by_id(task.id)
+        assert stored.title == "Write path"
+        assert len(stored.attachments) == 1
+
+    @pytest.mark.asyncio
+    async def test_update_stamps_aware_updated_at(self, test_db_session):
+        """Test a full update stamps updated_at with an aware UTC time, like every other write path"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="stamp@example.com", password_hash="x"))
+        task_repo = SQLAlchemyTaskRepository(test_db_session)
+        task = await task_repo.create(Task(user_id=user.id, title="Before"))
+        task.title = "After"
+
+        # Act
+        updated = await task_repo.update(task)
+
+        # Assert
+        assert updated.title == "After"
+        assert updated.updated_at.utcoffset() == timedelta(0)
+
+    @pytest.mark.asyncio
+    async def test_deletes_cascade_in_one_statement(self, test_db_session, executed_sql):
+        """Test deleting a user is one DELETE and the database removes everything it owned"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="gone@example.com", password_hash="x"))
+        task_list = await SQLAlchemyTaskListRepository(test_db_session).create(TaskList(user_id=user.id, name="L"))
+        task_repo = SQLAlchemyTaskRepository(test_db_session)
+        checklist_repo = SQLAlchemyChecklistRepository(test_db_session)
+        for task_list_id in (task_list.id, None):
+            task = await task_repo.create(Task(user_id=user.id, task_list_id=task_list_id, title="Owned"))
+            checklist = await checklist_repo.create_checklist(Checklist(task_id=task.id, title="Steps"))
+            await checklist_repo.add_item(ChecklistItem(checklist_id=checklist.id, content="Do it"))
+            await task_repo.add_attachment(Attachment(
+                task_id=task.id, filename="a.txt", file_url="u", file_size_bytes=1, content_type="text/plain"
+            ))
+        executed_sql.clear()
+
+        # Act
+        deleted = await SQLAlchemyUserRepository(test_db_session).delete(user.id)
+        deleted_again = await SQLAlchemyUserRepository(test_db_session).delete(user.id)
+
+        # Assert
+        assert deleted is True
+        assert deleted_again is False
+        assert [s.split()[0] for s in executed_sql if s.split()[0] in ("SELECT", "DELETE")] == ["DELETE", "DELETE"]
+        for table in ("task_lists", "tasks", "checklists", "checklist_items", "attachments", "user_task_stats", "user_task_due_stats"):
+            count = (await test_db_session.execute(text(f"SELECT count(*) FROM {table}"))).scalar()
+            assert count == 0, table
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_rolls_back_every_repository(self, test_db_session):
+        """Test writes through several repositories are undone together when the unit of work fails"""
+        # Arrange
+        user = User(email="atomic@example.com", password_hash="x")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            async with SQLAlchemyUnitOfWork(test_db_session):
+                await SQLAlchemyUserRepository(test_db_session).create(user)
+                await SQLAlchemyTaskRepository(test_db_session).create(Task(user_id=user.id, title="Half done"))
+                raise RuntimeError("request failed")
+
+        # Assert
+        assert await SQLAlchemyUserRepository(test_db_session).get_by_id(user.id) is None
+        assert (await test_db_session.execute(text("SELECT count(*) FROM tasks"))).scalar() == 0
+
+
+    @pytest.mark.asyncio
+    async def test_rejected_import_batch_keeps_transaction(self, test_db_session):
+        """Test a batch the database rejects writes none of its rows and the next batch still loads"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="batch@example.com", password_hash="x"))
+        task_import = SQLAlchemyTaskImport(test_db_session)
+        kept = Task(user_id=user.id, title="Kept")
+        await task_import.load([kept], [], [])
+        clash = Task(user_id=user.id, title="Clash")
+
+        # Act
+        with pytest.raises(ValueError, match="Database error"):
+            await task_import.load([Task(user_id=user.id, title="Rolled back"), clash, clash], [], [])
+        await task_import.load([Task(user_id=user.id, title="Next")], [], [])
+
+        # Assert
+        titles = (await test_db_session.execute(text("SELECT title FROM tasks ORDER BY title"))).scalars().all()
+        assert titles == ["Kept", "Next"]
@@ -0,0 +1,239 @@
+"""
+Integration tests for the delta sync API
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.domain.entities.models import User, Task
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_archive import SQLAlchemyTaskArchive
+
+
+async def _sync(client: AsyncClient, token=None, **params) -> dict:
+    if token:
+        params["since"] = token
+    response = await client.get("/api/v1/sync", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.integration
+class TestSyncAPI:
+    """Integration tests for GET /api/v1/sync"""
+
+    @pytest.mark.asyncio
+    async def test_full_sync_then_no_changes(self, authenticated_client: AsyncClient):
+        """Test a first sync returns everything and a repeat sync returns nothing with the same token"""
+        # Arrange
+        task_list = (await authenticated_client.post("/api/v1/task-lists/", json={"name": "Home"})).json()
+        task = (await authenticated_client.post(
+            "/api/v1/tasks/", json={"title": "Synced", "task_list_id": task_list["id"]}
+        )).json()
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{task['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        item = (await authenticated_client.post(
+            f"/api/v1/checklists/{checklist['id']}/items", json={"content": "First"}
+        )).json()
+
+        # Act
+        first = await _sync(authenticated_client)
+        second = await _sync(authenticated_client, first["next_token"])
+
+        # Assert
+        assert [t["id"] for t in first["tasks"]] == [task["id"]]
+        assert [l["id"] for l in first["task_lists"]] == [task_list["id"]]
+        assert [c["id"] for c in first["checklists"]] == [checklist["id"]]
+        assert "items" not in first["checklists"][0]
+        assert [i["id"] for i in first["checklist_items"]] == [item["id"]]
+        assert first["deleted"] == []
+        assert first["has_more"] is False
+        assert second == {
+            "tasks": [], "task_lists": [], "checklists": [], "checklist_items": [], "deleted": [],
+            "next_token": first["next_token"], "has_more": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_reports_updates_and_tombstones(self, authenticated_client: AsyncClient):
+        """Test only entities changed after the token come back, with deletions as tombstones"""
+        # Arrange
+        kept = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Kept"})).json()
+        edited = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Edited"})).json()
+        removed = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Removed"})).json()
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{kept['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        item = (await authenticated_client.post(
+            f"/api/v1/checklists/{checklist['id']}/items", json={"content": "First"}
+        )).json()
+        task_list = (await authenticated_client.post("/api/v1/task-lists/", json={"name": "Gone"})).json()
+        token = (await _sync(authenticated_client))["next_token"]
+
+        # Act
+        await authenticated_client.patch(f"/api/v1/tasks/{edited['id']}", json={"title": "Edited again"})
+        await authenticated_client.put(f"/api/v1/checklist-items/{item['id']}", json={"is_completed": True})
+        await authenticated_client.delete(f"/api/v1/tasks/{removed['id']}")
+        await authenticated_client.delete(f"/api/v1/task-lists/{task_list['id']}")
+        changes = await _sync(authenticated_client, token)
+
+        # Assert
+        assert [t["title"] for t in changes["tasks"]] == ["Edited again"]
+        assert [(i["id"], i["is_completed"]) for i in changes["checklist_items"]] == [(item["id"], True)]
+        assert changes["checklists"] == []
+        assert sorted((d["entity"], d["id"]) for d in changes["deleted"]) == sorted([
+            ("task", removed["id"]), ("task_list", task_list["id"]),
+        ])
+        assert changes["next_token"] != token
+
+    @pytest.mark.asyncio
+    async def test_restored_task_comes_back(self, authenticated_client: AsyncClient):
+        """Test a task restored after a sync saw its tombstone is reported again"""
+        # Arrange
+        task = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Undo me"})).json()
+        await authenticated_client.delete(f"/api/v1/tasks/{task['id']}")
+        token = (await _sync(authenticated_client))["next_token"]
+
+        # Act
+        await authenticated_client.post(f"/api/v1/tasks/{task['id']}:restore")
+        changes = await _sync(authenticated_client, token)
+
+        # Assert
+        assert [t["id"] for t in changes["tasks"]] == [task["id"]]
+        assert changes["deleted"] == []
+
+    @pytest.mark.asyncio
+    async def test_task_tombstone_covers_its_checklists(self, authenticated_client: AsyncClient):
+        """Test deleting a task tombstones its checklists and items in sync, and a restore brings them back"""
+        # Arrange
+        task = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Parent"})).json()
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{task['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        item = (await authenticated_client.post(
+            f"/api/v1/checklists/{checklist['id']}/items", json={"content": "First"}
+        )).json()
+        token = (await _sync(authenticated_client))["next_token"]
+
+        # Act
+        await authenticated_client.delete(f"/api/v1/tasks/{task['id']}")
+        deleted = await _sync(authenticated_client, token)
+        await authenticated_client.post(f"/api/v1/tasks/{task['id']}:restore")
+        restored = await _sync(authenticated_client, deleted["next_token"])
+
+        # Assert
+        assert sorted((d["entity"], d["id"]) for d in deleted["deleted"]) == sorted([
+            ("task", task["id"]), ("checklist", checklist["id"]), ("checklist_item", item["id"]),
+        ])
+        assert deleted["checklists"] == [] and deleted["checklist_items"] == []
+        assert [t["id"] for t in restored["tasks"]] == [task["id"]]
+        assert [c["id"] for c in restored["checklists"]] == [checklist["id"]]
+        assert [i["id"] for i in restored["checklist_items"]] == [item["id"]]
+        assert restored["deleted"] == []
+
+    @pytest.mark.asyncio
+    async def test_archived_task_is_not_a_deletion(
+        self, authenticated_client: AsyncClient, test_db_session: AsyncSession
+    ):
+        """Test archiving a task with its checklist sends no tombstones, while a delete still does"""
+        # Arrange
+        archived = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Old"})).json()
+        await authenticated_client.patch(f"/api/v1/tasks/{archived['id']}", json={"status": "done"})
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{archived['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        await authenticated_client.post(f"/api/v1/checklists/{checklist['id']}/items", json={"content": "First"})
+        removed = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Removed"})).json()
+        token = (await _sync(authenticated_client))["next_token"]
+
+        # Act
+        moved = await SQLAlchemyTaskArchive(test_db_session).archive_done_before(
+            datetime.now(timezone.utc) + timedelta(days=1), 10
+        )
+        await test_db_session.commit()
+        await authenticated_client.delete(f"/api/v1/tasks/{removed['id']}")
+        changes = await _sync(authenticated_client, token)
+        listed = await authenticated_client.get("/api/v1/tasks/", params={"include_archived": "true"})
+
+        # Assert
+        assert moved == 1
+        assert [(d["entity"], d["id"]) for d in changes["deleted"]] == [("task", removed["id"])]
+        assert changes["tasks"] == [] and changes["checklists"] == [] and changes["checklist_items"] == []
+        assert [t["id"] for t in listed.json()] == [archived["id"]]
+
+    @pytest.mark.asyncio
+    async def test_change_before_archive_still_arrives(
+        self, authenticated_client: AsyncClient, test_db_session: AsyncSession
+    ):
+        """Test a task changed after the token and archived before the next sync arrives in its final state"""
+        # Arrange
+        task = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Draft"})).json()
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{task['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        item = (await authenticated_client.post(
+            f"/api/v1/checklists/{checklist['id']}/items", json={"content": "First"}
+        )).json()
+        token = (await _sync(authenticated_client))["next_token"]
+        await authenticated_client.patch(f"/api/v1/tasks/{task['id']}", json={"title": "Final", "status": "done"})
+        await authenticated_client.put(f"/api/v1/checklist-items/{item['id']}", json={"is_completed": True})
+
+        # Act
+        moved = await SQLAlchemyTaskArchive(test_db_session).archive_done_before(
+            datetime.now(timezone.utc) + timedelta(days=1), 10
+        )
+        await test_db_session.commit()
+        changes = await _sync(authenticated_client, token)
+
+        # Assert
+        assert moved == 1
+        assert [(t["id"], t["title"], t["status"]) for t in changes["tasks"]] == [(task["id"], "Final", "done")]
+        assert changes["tasks"][0]["archived_at"] is not None
+        assert [(i["id"], i["is_completed"]) for i in changes["checklist_items"]] == [(item["id"], True)]
+        assert changes["deleted"] == []
+        assert changes["next_token"] != token
+
+    @pytest.mark.asyncio
+    async def test_pages_with_limit(self, authenticated_client: AsyncClient):
+        """Test a limited sync sets has_more until the client has caught up"""
+        # Arrange
+        for i in range(3):
+            await authenticated_client.post("/api/v1/tasks/", json={"title": f"Task {i}"})
+
+        # Act
+        first = await _sync(authenticated_client, limit=2)
+        second = await _sync(authenticated_client, first["next_token"], limit=2)
+
+        # Assert
+        assert [t["title"] for t in first["tasks"]] == ["Task 0", "Task 1"]
+        assert first["has_more"] is True
+        assert [t["title"] for t in second["tasks"]] == ["Task 2"]
+        assert second["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_excludes_other_users(self, authenticated_client: AsyncClient, test_db_session: AsyncSession):
+        """Test one user's changes never reach another user's sync"""
+        # Arrange
+        other = await SQLAlchemyUserRepository(test_db_session).create(
+            User(email="other-sync@example.com", password_hash="x")
+        )
+        await SQLAlchemyTaskRepository(test_db_session).create(Task(user_id=other.id, title="Not yours"))
+        await test_db_session.commit()
+
+        # Act
+        changes = await _sync(authenticated_client)
+
+        # Assert
+        assert changes["tasks"] == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_token(self, authenticated_client: AsyncClient):
+        """Test a malformed token is rejected"""
+        # Act
+        response = await authenticated_client.get("/api/v1/sync", params={"since": "not-a-token"})
+
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid sync token"
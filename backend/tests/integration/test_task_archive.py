@@ -0,0 +1,92 @@
+"""
+Integration tests for archiving done tasks
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.src.config import settings
+from backend.src.domain.entities.models import (
+    User, Task, TaskStatus, TaskSort, Checklist, ChecklistItem, Attachment
+)
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import ArchivedTaskModel
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.checklist_repository import (
+    SQLAlchemyChecklistRepository
+)
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_archive import SQLAlchemyTaskArchive
+from backend.src.infrastructure.services.worker.tasks import _archive_done_tasks_async
+
+NOW = datetime.now(timezone.utc)
+LONG_AGO = NOW - timedelta(days=200)
+
+
+async def _create_user(session: AsyncSession, email: str) -> User:
+    return await SQLAlchemyUserRepository(session).create(User(email=email, password_hash="x"))
+
+
+async def _create_task(session: AsyncSession, user: User, title: str, status: TaskStatus, updated_at: datetime):
+    return await SQLAlchemyTaskRepository(session).create(
+        Task(user_id=user.id, title=title, status=status, created_at=updated_at, updated_at=updated_at)
+    )
+
+
+@pytest.mark.integration
+class TestTaskArchive:
+    """Integration tests for the task archive"""
+
+    @pytest.mark.asyncio
+    async def test_moves_old_done_tasks_with_children(self, test_db_session):
+        """Test only old done tasks are moved, children included, and listings can still reach them"""
+        # Arrange
+        user = await _create_user(test_db_session, "archive@example.com")
+        old_done = await _create_task(test_db_session, user, "Old done", TaskStatus.DONE, LONG_AGO)
+        await _create_task(test_db_session, user, "Recent done", TaskStatus.DONE, NOW)
+        await _create_task(test_db_session, user, "Old open", TaskStatus.TODO, LONG_AGO - timedelta(days=1))
+        checklist_repo = SQLAlchemyChecklistRepository(test_db_session)
+        checklist = await checklist_repo.create_checklist(Checklist(task_id=old_done.id, title="Steps"))
+        await checklist_repo.add_item(ChecklistItem(checklist_id=checklist.id, content="Do it"))
+        task_repo = SQLAlchemyTaskRepository(test_db_session)
+        await task_repo.add_attachment(Attachment(
+            task_id=old_done.id, filename="a.txt", file_url="u", file_size_bytes=1, content_type="text/plain"
+        ))
+
+        # Act
+        moved = await SQLAlchemyTaskArchive(test_db_session).archive_done_before(NOW - timedelta(days=90), 10)
+
+        # Assert
+        assert moved == 1
+        assert await task_repo.get_by_id(old_done.id) is None
+        assert (await task_repo.get_stats(user.id)).total == 2
+        live = await task_repo.list_by_user(user.id, {})
+        assert sorted(task.title for task in live) == ["Old open", "Recent done"]
+        listed = await task_repo.list_by_user(user.id, {}, sort=TaskSort.NEWEST, include_archived=True)
+        assert [task.title for task in listed] == ["Recent done", "Old done", "Old open"]
+        archived = listed[1]
+        assert archived.archived_at is not None
+        assert archived.checklists[0].items[0].content == "Do it"
+        assert archived.attachments[0].filename == "a.txt"
+        summaries = await task_repo.list_summaries_by_user(user.id, {"status": "done"}, include_archived=True)
+        assert [(s.title, s.checklist_item_count) for s in summaries] == [("Recent done", 0), ("Old done", 1)]
+        assert await task_repo.count_by_user(user.id, {}, cap=10, include_archived=True) == (3, True)
+
+    @pytest.mark.asyncio
+    async def test_worker_job_archives_in_batches(self, test_db_session, monkeypatch):
+        """Test the worker job keeps taking batches until fewer than a full batch remain"""
+        # Arrange
+        user = await _create_user(test_db_session, "batches@example.com")
+        for i in range(3):
+            await _create_task(test_db_session, user, f"Done {i}", TaskStatus.DONE, LONG_AGO)
+        await test_db_session.commit()
+        monkeypatch.setattr(settings, "TASK_ARCHIVE_BATCH_SIZE", 2)
+        monkeypatch.setattr(settings, "TASK_ARCHIVE_BATCH_PAUSE_SECONDS", 0)
+        session_factory = async_sessionmaker(test_db_session.bind, expire_on_commit=False)
+
+        # Act
+        archived = await _archive_done_tasks_async(session_factory)
+
+        # Assert
+        assert archived == 3
+        assert await test_db_session.scalar(select(func.count()).select_from(ArchivedTaskModel)) == 3
@@ -0,0 +1,121 @@
+"""
+Integration tests for the streaming task export
+"""
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+
+from backend.src.config import settings
+from backend.src.domain.entities.models import Task, TaskStatus
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_archive import SQLAlchemyTaskArchive
+
+
+async def _create_tasks(client: AsyncClient, count: int) -> list:
+    return [
+        (await client.post("/api/v1/tasks/", json={"title": f"Task {i}", "tags": ["a", "b"]})).json()
+        for i in range(count)
+    ]
+
+
+@pytest.mark.integration
+class TestTaskExportAPI:
+    """Integration tests for GET /api/v1/tasks:export"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export_streams_every_task(self, authenticated_client: AsyncClient, monkeypatch):
+        """Test NDJSON has one task per line, newest first, across several cursor batches"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_EXPORT_BATCH_SIZE", 2)
+        created = await _create_tasks(authenticated_client, 5)
+        await authenticated_client.delete(f"/api/v1/tasks/{created[0]['id']}")
+
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks:export")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-disposition"] == 'attachment; filename="tasks.ndjson"'
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == ["Task 4", "Task 3", "Task 2", "Task 1"]
+        assert rows[0]["tags"] == ["a", "b"]
+        assert rows[0]["due_date"] is None
+        assert "checklist_items" not in rows[0]
+
+    @pytest.mark.asyncio
+    async def test_csv_export_with_checklist_items(self, authenticated_client: AsyncClient):
+        """Test CSV with checklist items has one row per item and one bare row for tasks without items"""
+        # Arrange
+        bare, with_items = await _create_tasks(authenticated_client, 2)
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{with_items['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        for position, content in enumerate(["First", "Second"]):
+            await authenticated_client.post(
+                f"/api/v1/checklists/{checklist['id']}/items", json={"content": content, "position": position}
+            )
+
+        # Act
+        response = await authenticated_client.get(
+            "/api/v1/tasks:export", params={"format": "csv", "include": "checklist_items"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [(row["title"], row["checklist_title"], row["item_content"], row["item_is_completed"]) for row in rows] == [
+            ("Task 1", "Steps", "First", "false"),
+            ("Task 1", "Steps", "Second", "false"),
+            ("Task 0", "", "", ""),
+        ]
+        assert rows[0]["tags"] == "a,b"
+        assert rows[2]["id"] == bare["id"]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export_filters_and_archive(self, authenticated_client: AsyncClient, test_db_session, test_user):
+        """Test filters apply and archived tasks follow the live ones when asked for"""
+        # Arrange
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        long_ago = datetime.now(timezone.utc) - timedelta(days=200)
+        await repo.create(Task(user_id=test_user.id, title="Archived", status=TaskStatus.DONE, updated_at=long_ago))
+        await repo.create(Task(user_id=test_user.id, title="Done", status=TaskStatus.DONE))
+        await repo.create(Task(user_id=test_user.id, title="Open"))
+        await SQLAlchemyTaskArchive(test_db_session).archive_done_before(long_ago + timedelta(days=1), 10)
+        await test_db_session.commit()
+
+        # Act
+        response = await authenticated_client.get(
+            "/api/v1/tasks:export", params={"status": "done", "include_archived": "true"}
+        )
+
+        # Assert
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(row["title"], row["archived_at"] is not None) for row in rows] == [
+            ("Done", False), ("Archived", True)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_csv_export_has_header(self, authenticated_client: AsyncClient):
+        """Test a user without tasks still gets a CSV header"""
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks:export", params={"format": "csv"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.text.splitlines() == [
+            "id,user_id,task_list_id,title,description,status,priority,due_date,tags,created_at,updated_at,archived_at"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_format(self, authenticated_client: AsyncClient):
+        """Test only ndjson and csv are accepted"""
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks:export", params={"format": "xml"})
+
+        # Assert
+        assert response.status_code == 422
@@ -0,0 +1,117 @@
+"""
+Integration tests for the task import pipeline
+"""
+import json
+import pytest
+from httpx import AsyncClient
+
+from backend.src.config import settings
+
+
+def _ndjson(*rows) -> str:
+    return "".join((row if isinstance(row, str) else json.dumps(row)) + "\n" for row in rows)
+
+
+@pytest.mark.integration
+class TestTaskImportAPI:
+    """Integration tests for POST /api/v1/tasks:import"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_import_reports_bad_rows(self, authenticated_client: AsyncClient, monkeypatch):
+        """Test valid rows are loaded across chunks while each bad row is reported by line number"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_IMPORT_CHUNK_SIZE", 2)
+        body = _ndjson(
+            {"title": "Write report", "priority": "high", "tags": ["work"], "status": "in_progress"},
+            {"title": ""},
+            "{not json",
+            "",
+            {"title": "Buy milk", "task_list": "Errands", "checklist_items": [
+                {"content": "Whole"}, {"content": "Oat", "is_completed": True},
+            ]},
+            {"title": "Post letter", "task_list": "Errands"},
+            {"title": "Elsewhere", "task_list_id": "00000000-0000-0000-0000-000000000000"},
+        )
+
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:import", content=body)
+
+        # Assert
+        assert response.status_code == 200
+        result = response.json()
+        assert (result["imported"], result["failed"]) == (3, 3)
+        assert [(e["row"], e["error"].split(":")[0]) for e in result["errors"]] == [
+            (2, "title"), (3, "Invalid JSON"), (7, "Invalid task list ID"),
+        ]
+        task_lists = (await authenticated_client.get("/api/v1/task-lists/")).json()
+        assert [task_list["name"] for task_list in task_lists] == ["Errands"]
+        tasks = (await authenticated_client.get("/api/v1/tasks/", params={"sort": "-priority"})).json()
+        assert sorted((t["title"], t["status"], t["task_list_id"] is not None) for t in tasks) == [
+            ("Buy milk", "todo", True), ("Post letter", "todo", True), ("Write report", "in_progress", False),
+        ]
+        milk = next(t for t in tasks if t["title"] == "Buy milk")
+        assert [(i["content"], i["is_completed"], i["position"]) for i in milk["checklists"][0]["items"]] == [
+            ("Whole", False, 0), ("Oat", True, 1),
+        ]
+        stats = (await authenticated_client.get("/api/v1/tasks/stats")).json()
+        assert stats["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_csv_export_round_trips(self, authenticated_client: AsyncClient):
+        """Test a CSV export with checklist items imports back as the same tasks and items"""
+        # Arrange
+        task = (await authenticated_client.post(
+            "/api/v1/tasks/", json={"title": "Pack, then \"go\"", "description": "Line one\nLine two", "tags": ["a", "b"]}
+        )).json()
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{task['id']}/checklists", json={"title": "Bag"}
+        )).json()
+        for position, content in enumerate(["Socks", "Hat"]):
+            await authenticated_client.post(
+                f"/api/v1/checklists/{checklist['id']}/items", json={"content": content, "position": position}
+            )
+        await authenticated_client.post("/api/v1/tasks/", json={"title": "Plain"})
+        exported = (await authenticated_client.get(
+            "/api/v1/tasks:export", params={"format": "csv", "include": "checklist_items"}
+        )).content
+
+        # Act
+        response = await authenticated_client.post(
+            "/api/v1/tasks:import", params={"format": "csv"}, content=exported
+        )
+
+        # Assert
+        assert response.json() == {"imported": 2, "failed": 0, "errors": []}
+        tasks = (await authenticated_client.get("/api/v1/tasks/", params={"limit": 10})).json()
+        copies = [t for t in tasks if t["title"] == task["title"]]
+        assert len(copies) == 2
+        copy = next(t for t in copies if t["id"] != task["id"])
+        assert copy["description"] == "Line one\nLine two"
+        assert copy["tags"] == ["a", "b"]
+        assert [item["content"] for item in copy["checklists"][0]["items"]] == ["Socks", "Hat"]
+
+    @pytest.mark.asyncio
+    async def test_csv_reports_malformed_records(self, authenticated_client: AsyncClient):
+        """Test CSV records with the wrong number of fields are reported by record number"""
+        # Arrange
+        body = "title,priority\nFirst,low\nSecond,low,extra\nThird,urgent\n"
+
+        # Act
+        response = await authenticated_client.post(
+            "/api/v1/tasks:import", params={"format": "csv"}, content=body
+        )
+
+        # Assert
+        assert response.json() == {
+            "imported": 2, "failed": 1, "errors": [{"row": 2, "error": "Expected 2 fields, got 3"}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_utf8_body(self, authenticated_client: AsyncClient):
+        """Test a body that is not UTF-8 text fails the whole import"""
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:import", content=b'{"title": "\xff"}\n')
+
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Import must be UTF-8 text"
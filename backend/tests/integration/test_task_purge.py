@@ -0,0 +1,58 @@
+"""
+Integration tests for purging deleted tasks
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from backend.src.config import settings
+from backend.src.domain.entities.models import User, Task, Attachment
+from backend.src.infrastructure.persistence.sqlalchemy.models.schema import TaskModel, AttachmentModel
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.user_repository import SQLAlchemyUserRepository
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_repository import SQLAlchemyTaskRepository
+from backend.src.infrastructure.services.worker.tasks import _purge_deleted_tasks_async
+
+
+@pytest.mark.integration
+class TestTaskPurge:
+    """Integration tests for the purge of tombstoned tasks"""
+
+    @pytest.mark.asyncio
+    async def test_worker_job_purges_expired_tombstones(self, test_db_session, monkeypatch):
+        """Test the job removes tasks deleted before the undo window, in batches, then their files"""
+        # Arrange
+        user = await SQLAlchemyUserRepository(test_db_session).create(User(email="purge@example.com", password_hash="x"))
+        repo = SQLAlchemyTaskRepository(test_db_session)
+        tasks = [await repo.create(Task(user_id=user.id, title=f"Task {i}")) for i in range(4)]
+        for i, task in enumerate(tasks):
+            await repo.add_attachment(Attachment(
+                task_id=task.id, filename="a.txt", file_url=f"u{i}", file_size_bytes=1, content_type="text/plain"
+            ))
+        for task in tasks[:3]:
+            await repo.delete(task.id, user.id)
+        expired = [task.id for task in tasks[:2]]
+        await test_db_session.execute(
+            update(TaskModel)
+            .where(TaskModel.id.in_(expired))
+            .values(deleted_at=datetime.now(timezone.utc) - timedelta(hours=settings.TASK_PURGE_AFTER_HOURS + 1))
+        )
+        await test_db_session.commit()
+        monkeypatch.setattr(settings, "TASK_PURGE_BATCH_SIZE", 1)
+        monkeypatch.setattr(settings, "TASK_PURGE_BATCH_PAUSE_SECONDS", 0)
+        file_storage = AsyncMock()
+        session_factory = async_sessionmaker(test_db_session.bind, expire_on_commit=False)
+
+        # Act
+        purged = await _purge_deleted_tasks_async(session_factory, file_storage)
+
+        # Assert
+        assert purged == 2
+        assert sorted(call.args[0][0] for call in file_storage.delete_many.await_args_list) == ["u0", "u1"]
+        remaining = await test_db_session.scalars(select(TaskModel.id))
+        assert set(remaining) == {tasks[2].id, tasks[3].id}
+        assert await test_db_session.scalar(select(func.count()).select_from(AttachmentModel)) == 2
+        assert (await repo.get_stats(user.id)).total == 1
+        assert await repo.restore(tasks[2].id, user.id) is True
+        assert (await repo.get_stats(user.id)).total == 2
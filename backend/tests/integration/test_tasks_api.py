@@ -3,8 +3,11 @@ Integration tests for Tasks API endpoints
 """
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from uuid import uuid4
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+from backend.src.infrastructure.persistence.sqlalchemy.repositories.task_archive import SQLAlchemyTaskArchive
 
 
 @pytest.mark.integration
@@ -77,6 +80,152 @@ class TestTasksAPI:
         # Assert
         assert response.status_code == 401
     
+    @pytest.mark.asyncio
+    async def test_create_tasks_batch(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test batch creation inserts the valid items and reports the rest"""
+        # Arrange
+        list_response = await authenticated_client.post("/api/v1/task-lists/", json={"name": "Imported"})
+        task_list_id = list_response.json()["id"]
+        batch = {"tasks": [
+            {"title": "First", "task_list_id": task_list_id, "tags": ["import"]},
+            {"title": "Second", "priority": "not-a-priority"},
+            {"title": "Third", "task_list_id": str(uuid4())},
+            {"title": "Fourth", "priority": "high"},
+        ]}
+        
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:batch", json=batch)
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["failed"]) == (2, 2)
+        assert [r["status"] for r in data["results"]] == [201, 422, 400, 201]
+        assert data["results"][0]["task"]["task_list_id"] == task_list_id
+        listed = (await authenticated_client.get("/api/v1/tasks/")).json()
+        assert sorted(t["title"] for t in listed) == ["First", "Fourth"]
+    
+    @pytest.mark.asyncio
+    async def test_create_tasks_batch_rejects_empty(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test an empty batch is rejected"""
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:batch", json={"tasks": []})
+        
+        # Assert
+        assert response.status_code == 422
+    
+    @pytest.mark.asyncio
+    async def test_bulk_update_tasks(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test bulk updates by ids and by filter touch only the selected tasks"""
+        # Arrange
+        ids = []
+        for title, tags in (("One", ["sprint"]), ("Two", ["sprint"]), ("Three", [])):
+            response = await authenticated_client.post("/api/v1/tasks/", json={"title": title, "tags": tags})
+            ids.append(response.json()["id"])
+        
+        # Act
+        by_ids = await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate",
+            json={"ids": [ids[0], str(uuid4())], "changes": {"priority": "urgent"}}
+        )
+        by_filter = await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate",
+            json={"filter": {"tags": ["sprint"]}, "changes": {"status": "done"}}
+        )
+        
+        # Assert
+        assert by_ids.status_code == 200
+        assert by_ids.json() == {"count": 1, "ids": [ids[0]]}
+        assert by_filter.json()["count"] == 2
+        assert set(by_filter.json()["ids"]) == {ids[0], ids[1]}
+        tasks = {t["id"]: t for t in (await authenticated_client.get("/api/v1/tasks/")).json()}
+        assert tasks[ids[0]]["priority"] == "urgent"
+        assert [tasks[i]["status"] for i in ids] == ["done", "done", "todo"]
+    
+    @pytest.mark.asyncio
+    async def test_bulk_update_rejects_foreign_task_list(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test bulk moving tasks into a list the caller does not own is rejected"""
+        # Arrange
+        created = await authenticated_client.post("/api/v1/tasks/", json={"title": "Stay"})
+        
+        # Act
+        response = await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate",
+            json={"ids": [created.json()["id"]], "changes": {"task_list_id": str(uuid4())}}
+        )
+        
+        # Assert
+        assert response.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_bulk_delete_tasks(
+        self,
+        authenticated_client: AsyncClient,
+        mock_file_storage
+    ):
+        """Test bulk delete hides the selected tasks at once and leaves their files to the purge job"""
+        # Arrange
+        ids = []
+        for title in ("Old", "Older", "Keep"):
+            response = await authenticated_client.post("/api/v1/tasks/", json={"title": title})
+            ids.append(response.json()["id"])
+        for task_id in ids[:2]:
+            await authenticated_client.post(
+                f"/api/v1/tasks/{task_id}/attachments",
+                files={"file": ("notes.txt", b"hello", "text/plain")}
+            )
+        
+        # Act
+        response = await authenticated_client.post("/api/v1/tasks:batchDelete", json={"ids": ids[:2]})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+        assert set(response.json()["ids"]) == set(ids[:2])
+        mock_file_storage.delete_many.assert_not_called()
+        mock_file_storage.delete.assert_not_called()
+        remaining = (await authenticated_client.get("/api/v1/tasks/")).json()
+        assert [t["id"] for t in remaining] == [ids[2]]
+    
+    @pytest.mark.asyncio
+    async def test_request_commits_once(
+        self,
+        authenticated_client: AsyncClient,
+        test_db_session
+    ):
+        """Test a request writing through several repositories commits a single time"""
+        # Arrange
+        created = await authenticated_client.post("/api/v1/tasks/", json={"title": "With file"})
+        commits = []
+        sync_engine = test_db_session.bind.sync_engine
+        listener = lambda conn: commits.append(conn)
+        event.listen(sync_engine, "commit", listener)
+        
+        # Act
+        try:
+            response = await authenticated_client.post(
+                f"/api/v1/tasks/{created.json()['id']}/attachments",
+                files={"file": ("notes.txt", b"hello", "text/plain")}
+            )
+        finally:
+            event.remove(sync_engine, "commit", listener)
+        
+        # Assert
+        assert response.status_code == 200
+        assert len(commits) == 1
+    
     @pytest.mark.asyncio
     async def test_get_tasks_success(
         self,
@@ -175,6 +324,49 @@ class TestTasksAPI:
         get_response = await authenticated_client.get(f"/api/v1/tasks/{task_id}")
         assert get_response.status_code == 404
     
+    @pytest.mark.asyncio
+    async def test_delete_then_restore_task(
+        self,
+        authenticated_client: AsyncClient,
+        mock_file_storage
+    ):
+        """Test a deleted task disappears from every read and comes back whole when restored"""
+        # Arrange
+        create_response = await authenticated_client.post("/api/v1/tasks/", json={"title": "Undo me", "tags": ["x"]})
+        task_id = create_response.json()["id"]
+        await authenticated_client.post(
+            f"/api/v1/tasks/{task_id}/attachments",
+            files={"file": ("notes.txt", b"hello", "text/plain")}
+        )
+        
+        # Act
+        deleted = await authenticated_client.delete(f"/api/v1/tasks/{task_id}")
+        deleted_again = await authenticated_client.delete(f"/api/v1/tasks/{task_id}")
+        hidden = [
+            await authenticated_client.get(f"/api/v1/tasks/{task_id}"),
+            await authenticated_client.patch(f"/api/v1/tasks/{task_id}", json={"title": "Edited"}),
+        ]
+        listed = await authenticated_client.get("/api/v1/tasks/?include=count")
+        stats = await authenticated_client.get("/api/v1/tasks/stats")
+        tags = await authenticated_client.get("/api/v1/tasks/tags")
+        restored = await authenticated_client.post(f"/api/v1/tasks/{task_id}:restore")
+        restored_again = await authenticated_client.post(f"/api/v1/tasks/{task_id}:restore")
+        
+        # Assert
+        assert deleted.status_code == 200
+        assert deleted_again.status_code == 404
+        assert [response.status_code for response in hidden] == [404, 404]
+        assert listed.json() == []
+        assert listed.headers["X-Total-Count"] == "0"
+        assert stats.json()["total"] == 0
+        assert tags.json() == []
+        mock_file_storage.delete.assert_not_called()
+        assert restored.status_code == 200
+        assert restored.json()["title"] == "Undo me"
+        assert len(restored.json()["attachments"]) == 1
+        assert restored_again.status_code == 404
+        assert (await authenticated_client.get("/api/v1/tasks/stats")).json()["total"] == 1
+    
     @pytest.mark.asyncio
     async def test_filter_tasks_by_status(
         self,
@@ -202,6 +394,23 @@ class TestTasksAPI:
         data = response.json()
         assert all(task["status"] == "in_progress" for task in data)
     
+    @pytest.mark.asyncio
+    async def test_filter_tasks_by_invalid_status_rejected(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test an unknown status filter returns 422, with or without a total count"""
+        # Arrange
+        await authenticated_client.post("/api/v1/tasks/", json={"title": "Task"})
+        
+        # Act
+        listed = await authenticated_client.get("/api/v1/tasks/?status=bogus")
+        counted = await authenticated_client.get("/api/v1/tasks/?status=bogus&include=count")
+        
+        # Assert
+        assert listed.status_code == 422
+        assert counted.status_code == 422
+    
     @pytest.mark.asyncio
     async def test_filter_tasks_by_priority(
         self,
@@ -219,4 +428,474 @@ class TestTasksAPI:
         assert response.status_code == 200
         data = response.json()
         assert all(task["priority"] == "high" for task in data)
+    
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_all_tasks(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test following X-Next-Cursor visits every task exactly once, newest first"""
+        # Arrange
+        created_ids = []
+        for i in range(5):
+            response = await authenticated_client.post("/api/v1/tasks/", json={"title": f"Task {i}"})
+            created_ids.append(response.json()["id"])
+        
+        # Act
+        seen_ids = []
+        response = await authenticated_client.get("/api/v1/tasks/?limit=2")
+        while True:
+            assert response.status_code == 200
+            seen_ids.extend(task["id"] for task in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            response = await authenticated_client.get(f"/api/v1/tasks/?limit=2&cursor={next_cursor}")
+        
+        # Assert
+        assert sorted(seen_ids) == sorted(created_ids)
+        assert len(seen_ids) == len(set(seen_ids))
+    
+    @pytest.mark.asyncio
+    async def test_sorted_cursor_pagination(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test sorting by priority and by due date, paged by cursor, in the expected order"""
+        # Arrange
+        specs = [
+            ("low", "2030-01-03T00:00:00"), ("urgent", None), ("medium", "2030-01-01T00:00:00"),
+            ("high", None), ("urgent", "2030-01-02T00:00:00"),
+        ]
+        for i, (priority, due_date) in enumerate(specs):
+            await authenticated_client.post(
+                "/api/v1/tasks/", json={"title": f"Task {i}", "priority": priority, "due_date": due_date}
+            )
 
+        async def walk(sort):
+            seen = []
+            response = await authenticated_client.get(f"/api/v1/tasks/?limit=2&sort={sort}")
+            while True:
+                assert response.status_code == 200
+                seen.extend(response.json())
+                next_cursor = response.headers.get("X-Next-Cursor")
+                if not next_cursor:
+                    return seen
+                response = await authenticated_client.get(f"/api/v1/tasks/?limit=2&sort={sort}&cursor={next_cursor}")
+        
+        # Act
+        by_priority = await walk("-priority")
+        by_due_date = await walk("due_date")
+        
+        # Assert
+        assert [task["priority"] for task in by_priority] == ["urgent", "urgent", "high", "medium", "low"]
+        assert [task["title"] for task in by_due_date][:3] == ["Task 2", "Task 4", "Task 0"]
+        assert sorted(task["title"] for task in by_due_date[3:]) == ["Task 1", "Task 3"]
+    
+    @pytest.mark.asyncio
+    async def test_cursor_rejected_for_other_sort(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test a cursor issued under one sort returns 400 under another, as does an unknown sort key"""
+        # Arrange
+        for i in range(2):
+            await authenticated_client.post("/api/v1/tasks/", json={"title": f"Task {i}"})
+        response = await authenticated_client.get("/api/v1/tasks/?limit=1&sort=-updated_at")
+        next_cursor = response.headers["X-Next-Cursor"]
+        
+        # Act
+        mismatched = await authenticated_client.get(f"/api/v1/tasks/?limit=1&cursor={next_cursor}")
+        unknown = await authenticated_client.get("/api/v1/tasks/?sort=title")
+        
+        # Assert
+        assert mismatched.status_code == 400
+        assert unknown.status_code == 422
+    
+    @pytest.mark.asyncio
+    async def test_include_archived_lists_both_tables(
+        self,
+        authenticated_client: AsyncClient,
+        test_db_session
+    ):
+        """Test archived tasks are listed, paged and counted only when include_archived is set"""
+        # Arrange
+        ids = []
+        for i in range(3):
+            response = await authenticated_client.post("/api/v1/tasks/", json={"title": f"Task {i}"})
+            ids.append(response.json()["id"])
+        await authenticated_client.patch(f"/api/v1/tasks/{ids[1]}", json={"status": "done"})
+        await SQLAlchemyTaskArchive(test_db_session).archive_done_before(
+            datetime.now(timezone.utc) + timedelta(minutes=1), 10
+        )
+        
+        # Act
+        live = await authenticated_client.get("/api/v1/tasks/?include=count")
+        first = await authenticated_client.get("/api/v1/tasks/?include_archived=true&include=count&limit=2")
+        second = await authenticated_client.get(
+            f"/api/v1/tasks/?include_archived=true&limit=2&cursor={first.headers['X-Next-Cursor']}"
+        )
+        search = await authenticated_client.get("/api/v1/tasks/?include_archived=true&search=Task")
+        
+        # Assert
+        assert [task["id"] for task in live.json()] == [ids[2], ids[0]]
+        assert live.headers["X-Total-Count"] == "2"
+        listed = first.json() + second.json()
+        assert [task["id"] for task in listed] == [ids[2], ids[1], ids[0]]
+        assert [task["archived_at"] is not None for task in listed] == [False, True, False]
+        assert first.headers["X-Total-Count"] == "3"
+        assert "X-Next-Cursor" not in second.headers
+        assert search.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_archived_task_read_only_by_id(
+        self,
+        authenticated_client: AsyncClient,
+        test_db_session
+    ):
+        """Test an archived task is served by ID with its checklists, and writes to it are refused"""
+        # Arrange
+        task = (await authenticated_client.post("/api/v1/tasks/", json={"title": "Filed"})).json()
+        checklist = (await authenticated_client.post(
+            f"/api/v1/tasks/{task['id']}/checklists", json={"title": "Steps"}
+        )).json()
+        await authenticated_client.post(f"/api/v1/checklists/{checklist['id']}/items", json={"content": "First"})
+        await authenticated_client.patch(f"/api/v1/tasks/{task['id']}", json={"status": "done"})
+        await SQLAlchemyTaskArchive(test_db_session).archive_done_before(
+            datetime.now(timezone.utc) + timedelta(minutes=1), 10
+        )
+
+        # Act
+        fetched = await authenticated_client.get(f"/api/v1/tasks/{task['id']}")
+        patched = await authenticated_client.patch(f"/api/v1/tasks/{task['id']}", json={"title": "Changed"})
+        replaced = await authenticated_client.put(f"/api/v1/tasks/{task['id']}", json={"title": "Changed"})
+        deleted = await authenticated_client.delete(f"/api/v1/tasks/{task['id']}")
+        unknown = await authenticated_client.delete(f"/api/v1/tasks/{uuid4()}")
+
+        # Assert
+        assert fetched.status_code == 200
+        assert fetched.json()["title"] == "Filed"
+        assert fetched.json()["archived_at"] is not None
+        assert [i["content"] for i in fetched.json()["checklists"][0]["items"]] == ["First"]
+        assert [r.status_code for r in (patched, replaced, deleted)] == [409, 409, 409]
+        assert deleted.json()["detail"] == "Archived tasks are read-only"
+        assert unknown.status_code == 404
+        again = await authenticated_client.get(f"/api/v1/tasks/{task['id']}")
+        assert again.json()["title"] == "Filed"
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test a malformed cursor returns 400"""
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks/?cursor=garbage")
+        
+        # Assert
+        assert response.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_list_tasks_summary_view(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test the summary view returns scalar fields and child counts only"""
+        # Arrange
+        create_response = await authenticated_client.post("/api/v1/tasks/", json={"title": "Summarized"})
+        task_id = create_response.json()["id"]
+        checklist_response = await authenticated_client.post(
+            f"/api/v1/tasks/{task_id}/checklists", json={"title": "Steps"}
+        )
+        checklist_id = checklist_response.json()["id"]
+        item_response = await authenticated_client.post(
+            f"/api/v1/checklists/{checklist_id}/items", json={"content": "First"}
+        )
+        await authenticated_client.post(f"/api/v1/checklists/{checklist_id}/items", json={"content": "Second"})
+        await authenticated_client.put(
+            f"/api/v1/checklist-items/{item_response.json()['id']}", json={"is_completed": True}
+        )
+        await authenticated_client.post(
+            f"/api/v1/tasks/{task_id}/attachments",
+            files={"file": ("notes.txt", b"hello", "text/plain")}
+        )
+        
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks/?view=summary")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        summary = data[0]
+        assert summary["id"] == task_id
+        assert summary["title"] == "Summarized"
+        assert summary["status"] == "todo"
+        assert summary["attachment_count"] == 1
+        assert summary["checklist_item_count"] == 2
+        assert summary["completed_item_count"] == 1
+        assert "checklists" not in summary
+        assert "attachments" not in summary
+    
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_covers_checklist_items(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test search orders title matches first and also finds checklist item content"""
+        # Arrange
+        await authenticated_client.post("/api/v1/tasks/", json={"title": "Unrelated", "description": "nothing"})
+        in_description = await authenticated_client.post(
+            "/api/v1/tasks/", json={"title": "Finance", "description": "draft the budget report"}
+        )
+        in_title = await authenticated_client.post("/api/v1/tasks/", json={"title": "Quarterly report"})
+        in_checklist = await authenticated_client.post("/api/v1/tasks/", json={"title": "Errands"})
+        checklist = await authenticated_client.post(
+            f"/api/v1/tasks/{in_checklist.json()['id']}/checklists", json={"title": "Steps"}
+        )
+        await authenticated_client.post(
+            f"/api/v1/checklists/{checklist.json()['id']}/items", json={"content": "email reports to Sam"}
+        )
+        
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks/?search=report")
+        
+        # Assert
+        assert response.status_code == 200
+        ids = [task["id"] for task in response.json()]
+        assert ids[0] == in_title.json()["id"]
+        assert set(ids) == {in_title.json()["id"], in_description.json()["id"], in_checklist.json()["id"]}
+    
+    @pytest.mark.asyncio
+    async def test_total_count_follows_writes(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test X-Total-Count comes from counters that every write path keeps exact"""
+        # Arrange
+        batch = await authenticated_client.post(
+            "/api/v1/tasks:batch", json={"tasks": [{"title": "A"}, {"title": "B"}, {"title": "C"}]}
+        )
+        ids = [result["task"]["id"] for result in batch.json()["results"]]
+        task_list = await authenticated_client.post("/api/v1/task-lists/", json={"name": "Errands"})
+        await authenticated_client.post(
+            "/api/v1/tasks/", json={"title": "In list", "task_list_id": task_list.json()["id"]}
+        )
+        await authenticated_client.patch(f"/api/v1/tasks/{ids[0]}", json={"status": "done"})
+        await authenticated_client.post(
+            "/api/v1/tasks:batchUpdate", json={"ids": ids[:2], "changes": {"priority": "urgent"}}
+        )
+        await authenticated_client.delete(f"/api/v1/tasks/{ids[2]}")
+        await authenticated_client.delete(f"/api/v1/task-lists/{task_list.json()['id']}")
+        
+        # Act
+        plain = await authenticated_client.get("/api/v1/tasks/")
+        total = await authenticated_client.get("/api/v1/tasks/?include=count")
+        done = await authenticated_client.get("/api/v1/tasks/?include=count&status=done")
+        urgent_todo = await authenticated_client.get("/api/v1/tasks/?include=count&status=todo&priority=urgent")
+        
+        # Assert
+        assert "X-Total-Count" not in plain.headers
+        assert total.headers["X-Total-Count"] == "2"
+        assert done.headers["X-Total-Count"] == "1"
+        assert urgent_todo.headers["X-Total-Count"] == "1"
+    
+    @pytest.mark.asyncio
+    async def test_task_stats(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test the dashboard stats match Task.is_overdue and follow status and due date changes"""
+        # Arrange
+        now = datetime.utcnow()
+        specs = [
+            ("Long overdue", now - timedelta(days=3), "high"),
+            ("Just overdue", now - timedelta(minutes=1), "high"),
+            ("Soon", now + timedelta(hours=1), "low"),
+            ("This week", now + timedelta(days=3), "low"),
+            ("Later", now + timedelta(days=10), "low"),
+            ("Finished late", now - timedelta(days=1), "urgent"),
+            ("Undated", None, "medium"),
+        ]
+        ids = []
+        for title, due_date, priority in specs:
+            body = {"title": title, "priority": priority, "due_date": due_date.isoformat() if due_date else None}
+            ids.append((await authenticated_client.post("/api/v1/tasks/", json=body)).json()["id"])
+        await authenticated_client.patch(f"/api/v1/tasks/{ids[5]}", json={"status": "done"})
+        await authenticated_client.patch(
+            f"/api/v1/tasks/{ids[4]}", json={"due_date": (now + timedelta(days=2)).isoformat()}
+        )
+        await authenticated_client.delete(f"/api/v1/tasks/{ids[0]}")
+        
+        # Act
+        response = await authenticated_client.get("/api/v1/tasks/stats")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 6,
+            "by_status": {"todo": 5, "in_progress": 0, "done": 1},
+            "by_priority": {"low": 3, "medium": 1, "high": 1, "urgent": 1},
+            "overdue": 1,
+            "due_this_week": 3,
+        }
+    
+    @pytest.mark.asyncio
+    async def test_total_count_capped_for_search(
+        self,
+        authenticated_client: AsyncClient,
+        monkeypatch
+    ):
+        """Test filters the counters cannot answer are counted only up to the cap"""
+        # Arrange
+        from backend.src.config import settings
+        monkeypatch.setattr(settings, "TASK_COUNT_CAP", 2)
+        for title in ("Quarterly report", "Annual report", "Report draft", "Groceries"):
+            await authenticated_client.post("/api/v1/tasks/", json={"title": title, "tags": ["work"]})
+        
+        # Act
+        many = await authenticated_client.get("/api/v1/tasks/?include=count&search=report&limit=1")
+        few = await authenticated_client.get("/api/v1/tasks/?include=count&search=annual")
+        tagged = await authenticated_client.get("/api/v1/tasks/?include=count&tags=work")
+        plain = await authenticated_client.get("/api/v1/tasks/?include=count")
+        
+        # Assert
+        assert many.headers["X-Total-Count"] == "2+"
+        assert few.headers["X-Total-Count"] == "1"
+        assert tagged.headers["X-Total-Count"] == "2+"
+        assert plain.headers["X-Total-Count"] == "4"
+    
+    @pytest.mark.asyncio
+    async def test_search_follows_updates(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test the search index tracks title changes"""
+        # Arrange
+        create_response = await authenticated_client.post("/api/v1/tasks/", json={"title": "Walk the dog"})
+        task_id = create_response.json()["id"]
+        await authenticated_client.put(f"/api/v1/tasks/{task_id}", json={"title": "Feed the cat"})
+        
+        # Act
+        old_response = await authenticated_client.get("/api/v1/tasks/?search=dog")
+        new_response = await authenticated_client.get("/api/v1/tasks/?search=cat&view=summary")
+        
+        # Assert
+        assert old_response.json() == []
+        assert [task["id"] for task in new_response.json()] == [task_id]
+    
+    @pytest.mark.asyncio
+    async def test_filter_tasks_by_tags(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test any-of and all-of tag filtering"""
+        # Arrange
+        both = await authenticated_client.post("/api/v1/tasks/", json={"title": "Both", "tags": ["work", "urgent"]})
+        work = await authenticated_client.post("/api/v1/tasks/", json={"title": "Work", "tags": ["work"]})
+        await authenticated_client.post("/api/v1/tasks/", json={"title": "Home", "tags": ["home"]})
+        
+        # Act
+        any_response = await authenticated_client.get("/api/v1/tasks/?tags=work&tags=urgent")
+        all_response = await authenticated_client.get("/api/v1/tasks/?tags=work&tags=urgent&tag_match=all")
+        
+        # Assert
+        assert {task["id"] for task in any_response.json()} == {both.json()["id"], work.json()["id"]}
+        assert [task["id"] for task in all_response.json()] == [both.json()["id"]]
+    
+    @pytest.mark.asyncio
+    async def test_tag_counts_and_merge(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test per-user tag counts, renaming and merging tags"""
+        # Arrange
+        first = await authenticated_client.post("/api/v1/tasks/", json={"title": "A", "tags": ["wrk", "work", "x"]})
+        await authenticated_client.post("/api/v1/tasks/", json={"title": "B", "tags": ["job"]})
+        await authenticated_client.post("/api/v1/tasks/", json={"title": "C", "tags": ["work"]})
+        
+        # Act
+        counts_before = await authenticated_client.get("/api/v1/tasks/tags")
+        rename = await authenticated_client.post(
+            "/api/v1/tasks/tags/rename", json={"old_name": "x", "new_name": "misc"}
+        )
+        merge = await authenticated_client.post(
+            "/api/v1/tasks/tags/merge", json={"sources": ["wrk", "job"], "target": "work"}
+        )
+        counts_after = await authenticated_client.get("/api/v1/tasks/tags")
+        merged_task = await authenticated_client.get(f"/api/v1/tasks/{first.json()['id']}")
+        
+        # Assert
+        assert counts_before.json()[0] == {"name": "work", "count": 2}
+        assert rename.json() == {"updated": 1}
+        assert merge.json() == {"updated": 2}
+        assert counts_after.json() == [{"name": "work", "count": 3}, {"name": "misc", "count": 1}]
+        assert merged_task.json()["tags"] == ["work", "misc"]
+    
+    @pytest.mark.asyncio
+    async def test_patch_task_merge_semantics(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test PATCH changes only sent fields, null clears and children are not returned by default"""
+        # Arrange
+        create_response = await authenticated_client.post(
+            "/api/v1/tasks/",
+            json={"title": "Patch me", "description": "keep?", "priority": "high", "tags": ["a"]}
+        )
+        task_id = create_response.json()["id"]
+        
+        # Act
+        response = await authenticated_client.patch(
+            f"/api/v1/tasks/{task_id}", json={"status": "done", "description": None}
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "done"
+        assert data["description"] is None
+        assert data["title"] == "Patch me"
+        assert data["priority"] == "high"
+        assert data["tags"] == ["a"]
+        assert "checklists" not in data
+    
+    @pytest.mark.asyncio
+    async def test_patch_task_include_children(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test PATCH reloads child collections when asked"""
+        # Arrange
+        create_response = await authenticated_client.post("/api/v1/tasks/", json={"title": "Parent"})
+        task_id = create_response.json()["id"]
+        await authenticated_client.post(f"/api/v1/tasks/{task_id}/checklists", json={"title": "Steps"})
+        
+        # Act
+        response = await authenticated_client.patch(
+            f"/api/v1/tasks/{task_id}?include=children", json={"title": "Renamed"}
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == "Renamed"
+        assert [c["title"] for c in data["checklists"]] == ["Steps"]
+    
+    @pytest.mark.asyncio
+    async def test_patch_task_rejects_null_title_and_unknown_task(
+        self,
+        authenticated_client: AsyncClient
+    ):
+        """Test PATCH validation and owner scoping"""
+        # Arrange
+        create_response = await authenticated_client.post("/api/v1/tasks/", json={"title": "Keep"})
+        task_id = create_response.json()["id"]
+        
+        # Act
+        null_title = await authenticated_client.patch(f"/api/v1/tasks/{task_id}", json={"title": None})
+        missing = await authenticated_client.patch(f"/api/v1/tasks/{uuid4()}", json={"status": "done"})
+        
+        # Assert
+        assert null_title.status_code == 422
+        assert missing.status_code == 404
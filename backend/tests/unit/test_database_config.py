@@ -0,0 +1,59 @@
+"""
+Unit tests for the connection pool settings
+"""
+import pytest
+
+from backend.src.config import Settings
+from backend.src.infrastructure.persistence.sqlalchemy.database import engine_options
+from backend.src.infrastructure.persistence.sqlalchemy.pool import InstrumentedAsyncQueuePool
+
+POSTGRES_URL = "postgresql+asyncpg://u:p@db:5432/app"
+
+
+@pytest.mark.unit
+class TestDatabaseConfig:
+    """Test cases for pool sizing and engine options"""
+
+    def test_pool_sizes_split_budget_over_workers(self):
+        """Test unset pool sizes come from the connection budget divided by the worker count"""
+        # Act
+        config = Settings(SECRET_KEY="test", WEB_CONCURRENCY=4, DB_CONNECTION_BUDGET=40)
+
+        # Assert
+        assert (config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW) == (5, 5)
+
+    def test_explicit_pool_sizes_win(self):
+        """Test explicitly configured pool sizes are kept"""
+        # Act
+        config = Settings(SECRET_KEY="test", WEB_CONCURRENCY=8, DB_POOL_SIZE=12, DB_MAX_OVERFLOW=0)
+
+        # Assert
+        assert (config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW) == (12, 0)
+
+    def test_postgres_engine_options(self):
+        """Test Postgres engines get the instrumented pool and asyncpg tuning"""
+        # Arrange
+        config = Settings(
+            SECRET_KEY="test", DB_POOL_SIZE=7, DB_MAX_OVERFLOW=3,
+            DB_STATEMENT_CACHE_SIZE=0, DB_STATEMENT_TIMEOUT_MS=5000
+        )
+
+        # Act
+        options = engine_options(POSTGRES_URL, "primary", config)
+
+        # Assert
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert (options["pool_size"], options["max_overflow"]) == (7, 3)
+        assert options["pool_logging_name"] == "primary"
+        assert options["connect_args"]["statement_cache_size"] == 0
+        assert options["connect_args"]["prepared_statement_cache_size"] == 0
+        assert options["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+
+    def test_sqlite_engine_options_keep_default_pool(self):
+        """Test non-Postgres engines get no pool or asyncpg arguments"""
+        # Act
+        options = engine_options("sqlite+aiosqlite:///:memory:", "primary", Settings(SECRET_KEY="test"))
+
+        # Assert
+        assert "poolclass" not in options
+        assert "connect_args" not in options
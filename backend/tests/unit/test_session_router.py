@@ -0,0 +1,80 @@
+"""
+Unit tests for SessionRouter replica selection
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.src.infrastructure.persistence.sqlalchemy.routing import LocalRecentWrites, SessionRouter
+
+
+def _replica(name):
+    replica = MagicMock()
+    replica.pool.logging_name = name
+    return replica
+
+
+@pytest.mark.unit
+class TestSessionRouter:
+    """Test cases for SessionRouter"""
+
+    @pytest.mark.asyncio
+    async def test_round_robin_skips_failed_replicas(self):
+        """Test reads rotate over replicas and leave out one marked down"""
+        # Arrange
+        first, second = _replica("replica-1"), _replica("replica-2")
+        router = SessionRouter([first, second], LocalRecentWrites(5), retry_after_seconds=60)
+
+        # Act
+        rotation = [await router.replica_for(None) for _ in range(2)]
+        router.mark_down(first, OSError("refused"))
+        after_failure = [await router.replica_for(None) for _ in range(2)]
+
+        # Assert
+        assert rotation == [first, second]
+        assert after_failure == [second, second]
+
+    @pytest.mark.asyncio
+    async def test_recent_writer_reads_primary(self):
+        """Test a user inside the read-your-writes window gets no replica"""
+        # Arrange
+        replica = _replica("replica-1")
+        router = SessionRouter([replica], LocalRecentWrites(5), retry_after_seconds=60)
+        writer = uuid4()
+
+        # Act
+        await router.record_write(writer)
+
+        # Assert
+        assert await router.replica_for(writer) is None
+        assert await router.replica_for(uuid4()) is replica
+
+    @pytest.mark.asyncio
+    async def test_window_expires(self):
+        """Test the read-your-writes marker lapses after the window"""
+        # Arrange
+        recent_writes = LocalRecentWrites(0)
+        writer = uuid4()
+
+        # Act
+        await recent_writes.mark(writer)
+
+        # Assert
+        assert await recent_writes.is_recent(writer) is False
+
+    @pytest.mark.asyncio
+    async def test_marker_store_failure_reads_primary(self):
+        """Test an unreachable marker store sends reads to the primary and does not fail writes"""
+        # Arrange
+        recent_writes = AsyncMock()
+        recent_writes.is_recent.side_effect = RedisConnectionError("down")
+        recent_writes.mark.side_effect = RedisConnectionError("down")
+        router = SessionRouter([_replica("replica-1")], recent_writes, retry_after_seconds=60)
+
+        # Act
+        await router.record_write(uuid4())
+        replica = await router.replica_for(uuid4())
+
+        # Assert
+        assert replica is None
@@ -0,0 +1,49 @@
+"""
+Unit tests for MinIOStorage
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from backend.src.infrastructure.services.storage import MinIOStorage, DELETE_BATCH_SIZE
+
+
+@pytest.mark.unit
+class TestMinIOStorage:
+    """Test cases for MinIOStorage"""
+
+    @pytest.fixture
+    def storage(self) -> MinIOStorage:
+        """A storage instance with a mocked S3 client, skipping the bucket check"""
+        storage = MinIOStorage.__new__(MinIOStorage)
+        storage.s3 = MagicMock()
+        storage.s3.delete_objects.return_value = {}
+        storage.bucket_name = "bucket"
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_delete_many_batches_delete_objects(self, storage: MinIOStorage):
+        """Test keys are removed with DeleteObjects in batches of at most 1000"""
+        # Arrange
+        file_urls = [f"http://s3/bucket/key-{i}" for i in range(DELETE_BATCH_SIZE + 5)]
+
+        # Act
+        deleted = await storage.delete_many(file_urls)
+
+        # Assert
+        assert deleted == DELETE_BATCH_SIZE + 5
+        batches = [call.kwargs["Delete"]["Objects"] for call in storage.s3.delete_objects.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [5, DELETE_BATCH_SIZE]
+        assert {"Key": "key-0"} in batches[0] + batches[1]
+        storage.s3.delete_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_counts_failures(self, storage: MinIOStorage):
+        """Test keys DeleteObjects reports as failed are not counted as deleted"""
+        # Arrange
+        storage.s3.delete_objects.return_value = {"Errors": [{"Key": "a", "Message": "denied"}]}
+
+        # Act
+        deleted = await storage.delete_many(["http://s3/bucket/a", "http://s3/bucket/b"])
+
+        # Assert
+        assert deleted == 1
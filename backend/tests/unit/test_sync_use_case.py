@@ -0,0 +1,61 @@
+"""
+Unit tests for SyncUseCase
+"""
+import pytest
+from uuid import UUID
+from unittest.mock import AsyncMock
+
+from backend.src.application.use_cases.sync_use_case import SyncUseCase
+from backend.src.application.dtos.sync_dtos import SyncTokenDTO
+from backend.src.domain.entities.models import SyncChanges
+
+
+@pytest.mark.unit
+class TestSyncUseCase:
+    """Test cases for SyncUseCase"""
+
+    @pytest.fixture
+    def sync_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def sync_use_case(self, sync_repo: AsyncMock) -> SyncUseCase:
+        """Create a SyncUseCase instance with a mocked repository"""
+        return SyncUseCase(sync_repo)
+
+    @pytest.mark.asyncio
+    async def test_first_sync_starts_from_zero(self, sync_use_case, sync_repo, mock_user_id: UUID):
+        """Test a sync without a token reads every change and returns a token for the last one"""
+        # Arrange
+        sync_repo.changes_since = AsyncMock(return_value=SyncChanges(last_seq=42))
+
+        # Act
+        changes, token = await sync_use_case.get_changes(mock_user_id, None, 100)
+
+        # Assert
+        sync_repo.changes_since.assert_called_once_with(mock_user_id, 0, 100)
+        assert changes.last_seq == 42
+        assert SyncTokenDTO.decode(token).change_seq == 42
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_token(self, sync_use_case, sync_repo, mock_user_id: UUID):
+        """Test a sync continues after the sequence number in the client's token"""
+        # Arrange
+        sync_repo.changes_since = AsyncMock(return_value=SyncChanges(last_seq=7))
+        token = SyncTokenDTO(change_seq=7).encode()
+
+        # Act
+        _, next_token = await sync_use_case.get_changes(mock_user_id, token, 100)
+
+        # Assert
+        sync_repo.changes_since.assert_called_once_with(mock_user_id, 7, 100)
+        assert next_token == token
+
+    @pytest.mark.asyncio
+    async def test_invalid_token(self, sync_use_case, sync_repo, mock_user_id: UUID):
+        """Test a malformed token raises ValueError without touching the repository"""
+        # Act / Assert
+        with pytest.raises(ValueError, match="Invalid sync token") as exc_info:
+            await sync_use_case.get_changes(mock_user_id, "%%%", 100)
+        assert exc_info.value.__cause__ is not None
+        sync_repo.changes_since.assert_not_called()
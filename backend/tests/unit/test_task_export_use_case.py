@@ -0,0 +1,91 @@
+"""
+Unit tests for TaskExportUseCase
+"""
+import csv
+import io
+import json
+import pytest
+from uuid import UUID
+from unittest.mock import MagicMock
+
+from backend.src.application.use_cases import task_export_use_case
+from backend.src.application.use_cases.task_export_use_case import TaskExportUseCase
+from backend.src.domain.entities.models import Task, Checklist, ChecklistItem
+
+
+def _stream(tasks):
+    async def stream(*args, **kwargs):
+        for task in tasks:
+            yield task
+    return MagicMock(side_effect=stream)
+
+
+async def _collect(chunks) -> list:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.unit
+class TestTaskExportUseCase:
+    """Test cases for TaskExportUseCase"""
+
+    @pytest.fixture
+    def task_export(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def export_use_case(self, task_export: MagicMock) -> TaskExportUseCase:
+        """Create a TaskExportUseCase instance with a mocked export port"""
+        return TaskExportUseCase(task_export)
+
+    @pytest.mark.asyncio
+    async def test_ndjson_writes_one_line_per_task(self, export_use_case, task_export, mock_user_id: UUID):
+        """Test NDJSON output is one JSON object per task, passing filters to the stream"""
+        # Arrange
+        tasks = [Task(user_id=mock_user_id, title="One", tags=["x"]), Task(user_id=mock_user_id, title="Two")]
+        task_export.stream_by_user = _stream(tasks)
+
+        # Act
+        chunks = await _collect(export_use_case.export_tasks(mock_user_id, "ndjson", {"status": "todo"}))
+
+        # Assert
+        task_export.stream_by_user.assert_called_once_with(mock_user_id, {"status": "todo"}, False, False)
+        lines = "".join(chunks).splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["One", "Two"]
+        assert json.loads(lines[0])["status"] == "todo"
+
+    @pytest.mark.asyncio
+    async def test_csv_flattens_checklist_items(self, export_use_case, task_export, mock_user_id: UUID):
+        """Test CSV with checklist items repeats the task columns on each item row"""
+        # Arrange
+        task = Task(user_id=mock_user_id, title="Pack", tags=["trip", "home"])
+        checklist = Checklist(task_id=task.id, title="Bag")
+        checklist.items = [
+            ChecklistItem(checklist_id=checklist.id, content="Socks", is_completed=True, position=0),
+            ChecklistItem(checklist_id=checklist.id, content="Hat", position=1),
+        ]
+        task.checklists = [checklist]
+        task_export.stream_by_user = _stream([task])
+
+        # Act
+        chunks = await _collect(export_use_case.export_tasks(mock_user_id, "csv", with_checklist_items=True))
+
+        # Assert
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert [(r["title"], r["tags"], r["item_content"], r["item_is_completed"], r["item_position"]) for r in rows] == [
+            ("Pack", "trip,home", "Socks", "true", "0"),
+            ("Pack", "trip,home", "Hat", "false", "1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_output_is_chunked(self, export_use_case, task_export, mock_user_id: UUID, monkeypatch):
+        """Test output is yielded whenever the buffer passes the chunk size, not only at the end"""
+        # Arrange
+        monkeypatch.setattr(task_export_use_case, "EXPORT_CHUNK_BYTES", 1)
+        task_export.stream_by_user = _stream([Task(user_id=mock_user_id, title=f"T{i}") for i in range(3)])
+
+        # Act
+        chunks = await _collect(export_use_case.export_tasks(mock_user_id, "ndjson"))
+
+        # Assert
+        assert len(chunks) == 3
+        assert all(chunk.count("\n") == 1 for chunk in chunks)
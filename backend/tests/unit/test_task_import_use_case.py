@@ -0,0 +1,123 @@
+"""
+Unit tests for TaskImportUseCase and its parsers
+"""
+import pytest
+from uuid import UUID
+from unittest.mock import AsyncMock
+
+from backend.src.application.use_cases.task_import_use_case import TaskImportUseCase, ImportRow, parse_csv
+from backend.src.config import settings
+from backend.src.domain.entities.models import TaskList, TaskStatus
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.unit
+class TestTaskImportUseCase:
+    """Test cases for TaskImportUseCase"""
+
+    @pytest.fixture
+    def task_import(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def task_list_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def import_use_case(self, task_import, task_list_repo) -> TaskImportUseCase:
+        """Create a TaskImportUseCase instance with mocked ports"""
+        return TaskImportUseCase(task_import, task_list_repo)
+
+    @pytest.mark.asyncio
+    async def test_parse_csv_groups_items_and_spans_chunks(self):
+        """Test quoted newlines split across chunks and per-item records sharing an id are one task"""
+        # Arrange
+        body = (
+            'id,title,description,tags,checklist_title,item_content\n'
+            '1,Pack,"two\nlines","a,b",Bag,Socks\n'
+            '1,Pack,"two\nlines","a,b",Bag,Hat\n'
+            ',Plain,,,,\n'
+        ).encode()
+
+        # Act
+        rows = [row async for row in parse_csv(_chunks(body[:40], body[40:70], body[70:]))]
+
+        # Assert
+        assert rows == [
+            ImportRow(1, {
+                "title": "Pack", "description": "two\nlines", "tags": ["a", "b"],
+                "checklist_items": [
+                    {"checklist_title": "Bag", "content": "Socks"}, {"checklist_title": "Bag", "content": "Hat"},
+                ],
+            }),
+            ImportRow(3, {"title": "Plain", "checklist_items": []}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_loads_in_chunks_and_reuses_task_lists(
+        self, import_use_case, task_import, task_list_repo, mock_user_id: UUID, monkeypatch
+    ):
+        """Test each chunk is loaded on its own and task lists are looked up once and created once"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_IMPORT_CHUNK_SIZE", 2)
+        home = TaskList(user_id=mock_user_id, name="Home")
+        task_list_repo.list_by_user = AsyncMock(return_value=[home])
+        task_list_repo.create = AsyncMock(side_effect=lambda task_list: task_list)
+        body = (
+            b'{"title": "A", "task_list": "Home"}\n'
+            b'{"title": "B", "task_list": "Work", "status": "done"}\n'
+            b'{"title": "C", "task_list": "Work"}\n'
+        )
+
+        # Act
+        result = await import_use_case.import_tasks(mock_user_id, "ndjson", _chunks(body))
+
+        # Assert
+        assert (result.imported, result.failed) == (3, 0)
+        assert task_import.load.await_count == 2
+        first, second = (call.args[0] for call in task_import.load.await_args_list)
+        assert [task.title for task in first] == ["A", "B"]
+        assert first[0].task_list_id == home.id
+        assert first[1].status == TaskStatus.DONE
+        assert second[0].task_list_id == first[1].task_list_id
+        task_list_repo.list_by_user.assert_awaited_once_with(mock_user_id)
+        task_list_repo.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_caps_reported_errors(self, import_use_case, task_import, mock_user_id: UUID, monkeypatch):
+        """Test only the first TASK_IMPORT_MAX_ERRORS errors are listed while all are counted"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_IMPORT_MAX_ERRORS", 2)
+        body = b"[]\n" * 5
+
+        # Act
+        result = await import_use_case.import_tasks(mock_user_id, "ndjson", _chunks(body))
+
+        # Assert
+        assert (result.imported, result.failed) == (0, 5)
+        assert [error.row for error in result.errors] == [1, 2]
+        task_import.load.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejected_chunk_reported_per_row(self, task_import, task_list_repo, mock_user_id: UUID, monkeypatch):
+        """Test a chunk the database rejects fails row by row while the other chunks are imported and committed"""
+        # Arrange
+        monkeypatch.setattr(settings, "TASK_IMPORT_CHUNK_SIZE", 2)
+        uow = AsyncMock()
+        task_import.load = AsyncMock(side_effect=[None, ValueError("Database error: rejected"), None])
+        import_use_case = TaskImportUseCase(task_import, task_list_repo, uow)
+        body = b"".join(b'{"title": "%d"}\n' % i for i in range(5))
+
+        # Act
+        result = await import_use_case.import_tasks(mock_user_id, "ndjson", _chunks(body))
+
+        # Assert
+        assert (result.imported, result.failed) == (3, 2)
+        assert [(error.row, error.error) for error in result.errors] == [
+            (3, "Database error: rejected"), (4, "Database error: rejected"),
+        ]
+        assert uow.commit.await_count == 3
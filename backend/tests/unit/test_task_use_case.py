@@ -6,9 +6,11 @@ from uuid import UUID, uuid4
 from unittest.mock import AsyncMock
 
 from backend.src.application.use_cases.task_use_case import TaskUseCase
-from backend.src.application.dtos.task_dtos import TaskCreateDTO, TaskUpdateDTO
-from backend.src.domain.entities.models import Task, TaskStatus, TaskPriority, Attachment
-from backend.src.domain.ports.repositories.base import ITaskRepository, IFileStorage, ITaskListRepository
+from backend.src.application.dtos.task_dtos import (
+    TaskCreateDTO, TaskUpdateDTO, TaskPatchDTO, TaskCursorDTO, TaskBulkUpdateDTO
+)
+from backend.src.domain.entities.models import Task, TaskStatus, TaskPriority, TaskSort, Attachment
+from backend.src.domain.ports.repositories.base import ITaskRepository, IFileStorage, ITaskListRepository, ITaskSearch
 
 
 @pytest.mark.unit
@@ -84,6 +86,40 @@ class TestTaskUseCase:
         with pytest.raises(ValueError, match="Invalid task list ID"):
             await task_use_case.create_task(mock_user_id, dto)
     
+    @pytest.mark.asyncio
+    async def test_create_tasks_batch_reports_per_item(
+        self,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository,
+        mock_file_storage: IFileStorage
+    ):
+        """Test a batch checks each task list once and inserts only the valid items"""
+        # Arrange
+        owned_list, foreign_list = uuid4(), uuid4()
+        mock_task_list_repo = AsyncMock(spec=ITaskListRepository)
+        mock_task_list_repo.get_owned_ids = AsyncMock(return_value={owned_list})
+        mock_task_repository.create_many = AsyncMock(side_effect=lambda tasks: tasks)
+        use_case = TaskUseCase(mock_task_repository, mock_file_storage, mock_task_list_repo)
+        items = [
+            {"title": "A", "task_list_id": str(owned_list)},
+            {"title": ""},
+            {"title": "B", "task_list_id": str(foreign_list)},
+            {"title": "C", "task_list_id": str(owned_list)},
+        ]
+        
+        # Act
+        result = await use_case.create_tasks_batch(mock_user_id, items)
+        
+        # Assert
+        assert (result.created, result.failed) == (2, 2)
+        assert [r.status for r in result.results] == [201, 422, 400, 201]
+        assert result.results[1].error.startswith("title:")
+        assert result.results[2].error == "Invalid task list ID"
+        assert [r.task.title for r in result.results if r.task] == ["A", "C"]
+        mock_task_list_repo.get_owned_ids.assert_called_once()
+        assert set(mock_task_list_repo.get_owned_ids.call_args.args[1]) == {owned_list, foreign_list}
+        mock_task_repository.create_many.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_get_user_tasks(
         self,
@@ -107,6 +143,223 @@ class TestTaskUseCase:
             mock_user_id, {}, 20, 0
         )
     
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_page_returns_next_cursor(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository,
+        sample_task: Task
+    ):
+        """Test a full page yields a cursor that decodes to its last task"""
+        # Arrange
+        mock_task_repository.list_by_user = AsyncMock(return_value=[sample_task])
+        
+        # Act
+        tasks, next_cursor = await task_use_case.get_user_tasks_page(mock_user_id, {}, limit=1)
+        
+        # Assert
+        assert tasks == [sample_task]
+        position = TaskCursorDTO.decode(next_cursor)
+        assert position.id == sample_task.id
+        assert position.created_at == sample_task.created_at
+    
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_page_seeks_after_cursor(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository,
+        sample_task: Task
+    ):
+        """Test a cursor is passed to the repository as a keyset and replaces offset"""
+        # Arrange
+        mock_task_repository.list_by_user = AsyncMock(return_value=[])
+        cursor = TaskCursorDTO(created_at=sample_task.created_at, id=sample_task.id).encode()
+        
+        # Act
+        tasks, next_cursor = await task_use_case.get_user_tasks_page(
+            mock_user_id, {}, limit=20, offset=40, cursor=cursor
+        )
+        
+        # Assert
+        assert tasks == []
+        assert next_cursor is None
+        mock_task_repository.list_by_user.assert_called_once_with(
+            mock_user_id, {}, 20, 0, sort=TaskSort.NEWEST, after=(sample_task.created_at, sample_task.id),
+            include_archived=False
+        )
+    
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_page_cursor_follows_sort(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository,
+        sample_task: Task
+    ):
+        """Test a sorted page's cursor carries that sort's keyset and is rejected under another sort"""
+        # Arrange
+        mock_task_repository.list_by_user = AsyncMock(return_value=[sample_task])
+        _, cursor = await task_use_case.get_user_tasks_page(
+            mock_user_id, {}, limit=1, sort=TaskSort.PRIORITY
+        )
+        
+        # Act
+        await task_use_case.get_user_tasks_page(mock_user_id, {}, limit=1, cursor=cursor, sort=TaskSort.PRIORITY)
+        
+        # Assert
+        mock_task_repository.list_by_user.assert_called_with(
+            mock_user_id, {}, 1, 0, sort=TaskSort.PRIORITY,
+            after=(sample_task.priority, sample_task.created_at, sample_task.id), include_archived=False
+        )
+        with pytest.raises(ValueError, match="different sort"):
+            await task_use_case.get_user_tasks_page(mock_user_id, {}, cursor=cursor)
+    
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_page_invalid_cursor(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository
+    ):
+        """Test a malformed cursor is rejected"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await task_use_case.get_user_tasks_page(mock_user_id, {}, cursor="not-a-cursor")
+        mock_task_repository.list_by_user.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_page_uses_search_ranking(
+        self,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository,
+        mock_file_storage: IFileStorage
+    ):
+        """Test a search filter is answered by the search port in its relevance order"""
+        # Arrange
+        first = Task(user_id=mock_user_id, title="Best match")
+        second = Task(user_id=mock_user_id, title="Weaker match")
+        mock_search = AsyncMock(spec=ITaskSearch)
+        mock_search.search = AsyncMock(return_value=[first.id, second.id])
+        mock_task_repository.list_by_user = AsyncMock(return_value=[second, first])
+        use_case = TaskUseCase(mock_task_repository, mock_file_storage, task_search=mock_search)
+        filters = {"search": "match"}
+        
+        # Act
+        tasks, next_cursor = await use_case.get_user_tasks_page(mock_user_id, filters, limit=20, offset=0)
+        
+        # Assert
+        assert tasks == [first, second]
+        assert next_cursor is None
+        mock_search.search.assert_called_once_with(mock_user_id, "match", filters, 20, 0)
+        mock_task_repository.list_by_user.assert_called_once_with(
+            mock_user_id, {"task_ids": [first.id, second.id]}, 2
+        )
+    
+    @pytest.mark.asyncio
+    async def test_count_user_tasks_routes_search_to_search_port(
+        self,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository,
+        mock_file_storage: IFileStorage
+    ):
+        """Test totals with a search filter come from the search port's capped count"""
+        # Arrange
+        mock_search = AsyncMock(spec=ITaskSearch)
+        mock_search.count = AsyncMock(return_value=(1000, False))
+        mock_task_repository.count_by_user = AsyncMock(return_value=(7, True))
+        use_case = TaskUseCase(mock_task_repository, mock_file_storage, task_search=mock_search)
+        
+        # Act
+        searched = await use_case.count_user_tasks(mock_user_id, {"search": "report"}, 1000)
+        filtered = await use_case.count_user_tasks(mock_user_id, {"status": "done", "search": None}, 1000)
+        
+        # Assert
+        assert searched == (1000, False)
+        assert filtered == (7, True)
+        mock_search.count.assert_called_once_with(mock_user_id, "report", {"search": "report"}, 1000)
+        mock_task_repository.count_by_user.assert_called_once_with(
+            mock_user_id, {"status": "done", "search": None}, 1000, include_archived=False
+        )
+    
+    @pytest.mark.asyncio
+    async def test_patch_task_passes_only_sent_fields(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_id: UUID,
+        mock_task_repository: ITaskRepository,
+        sample_task: Task
+    ):
+        """Test a merge patch reaches the repository as just the sent fields, without reloading children"""
+        # Arrange
+        mock_task_repository.patch = AsyncMock(return_value=sample_task)
+        dto = TaskPatchDTO.model_validate({"status": "done", "due_date": None})
+        
+        # Act
+        result = await task_use_case.patch_task(mock_task_id, mock_user_id, dto)
+        
+        # Assert
+        assert result == sample_task
+        mock_task_repository.patch.assert_called_once_with(
+            mock_task_id, mock_user_id, {"status": TaskStatus.DONE, "due_date": None}
+        )
+        mock_task_repository.get_by_id.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_patch_task_with_invalid_task_list(
+        self,
+        mock_user_id: UUID,
+        mock_task_id: UUID,
+        mock_task_repository: ITaskRepository,
+        mock_file_storage: IFileStorage
+    ):
+        """Test a patch moving the task to someone else's list is rejected"""
+        # Arrange
+        mock_task_list_repo = AsyncMock(spec=ITaskListRepository)
+        mock_task_list_repo.get_by_id = AsyncMock(return_value=None)
+        use_case = TaskUseCase(mock_task_repository, mock_file_storage, mock_task_list_repo)
+        dto = TaskPatchDTO(task_list_id=uuid4())
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid task list ID"):
+            await use_case.patch_task(mock_task_id, mock_user_id, dto)
+        mock_task_repository.patch.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_update_tasks_by_filter(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_repository: ITaskRepository
+    ):
+        """Test a filter selection becomes one repository bulk update"""
+        # Arrange
+        updated_ids = [uuid4(), uuid4()]
+        mock_task_repository.bulk_update = AsyncMock(return_value=updated_ids)
+        dto = TaskBulkUpdateDTO(filter={"status": "in_progress", "tags": ["sprint-1"]}, changes={"status": "done"})
+        
+        # Act
+        result = await task_use_case.bulk_update_tasks(mock_user_id, dto)
+        
+        # Assert
+        assert result == updated_ids
+        mock_task_repository.bulk_update.assert_called_once_with(
+            mock_user_id,
+            {"status": "in_progress", "tags": ["sprint-1"], "tag_match": "any"},
+            {"status": TaskStatus.DONE}
+        )
+    
+    def test_bulk_update_requires_one_selector(self):
+        """Test a bulk update must select by ids or by a non-empty filter"""
+        with pytest.raises(ValueError, match="exactly one"):
+            TaskBulkUpdateDTO(changes={"status": "done"})
+        with pytest.raises(ValueError, match="exactly one"):
+            TaskBulkUpdateDTO(ids=[uuid4()], filter={"status": "todo"}, changes={"status": "done"})
+        with pytest.raises(ValueError, match="at least one criterion"):
+            TaskBulkUpdateDTO(filter={}, changes={"status": "done"})
+    
     @pytest.mark.asyncio
     async def test_get_task_success(
         self,
@@ -146,12 +399,34 @@ class TestTaskUseCase:
             priority=TaskPriority.MEDIUM
         )
         mock_task_repository.get_by_id = AsyncMock(return_value=task)
-        
+        mock_task_repository.get_archived_by_id = AsyncMock(return_value=None)
+
         # Act
         result = await task_use_case.get_task(mock_task_id, mock_user_id)
-        
+
         # Assert
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_task_falls_back_to_archive(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_id: UUID,
+        mock_task_repository: ITaskRepository,
+        sample_task: Task
+    ):
+        """Test a task missing from the live table is read from the archive"""
+        # Arrange
+        mock_task_repository.get_by_id = AsyncMock(return_value=None)
+        mock_task_repository.get_archived_by_id = AsyncMock(return_value=sample_task)
+
+        # Act
+        result = await task_use_case.get_task(mock_task_id, mock_user_id)
+
+        # Assert
+        assert result == sample_task
+        mock_task_repository.get_archived_by_id.assert_called_once_with(mock_task_id)
     
     @pytest.mark.asyncio
     async def test_update_task_success(
@@ -195,22 +470,10 @@ class TestTaskUseCase:
         mock_user_id: UUID,
         mock_task_id: UUID,
         mock_task_repository: ITaskRepository,
-        sample_task: Task,
         mock_file_storage: IFileStorage
     ):
-        """Test successful task deletion"""
+        """Test deleting a task only writes the owner-scoped tombstone"""
         # Arrange
-        attachment = Attachment(
-            id=uuid4(),
-            task_id=mock_task_id,
-            filename="test.pdf",
-            file_url="https://example.com/test.pdf",
-            file_size_bytes=1000,
-            content_type="application/pdf"
-        )
-        sample_task.attachments = [attachment]
-        
-        mock_task_repository.get_by_id = AsyncMock(return_value=sample_task)
         mock_task_repository.delete = AsyncMock(return_value=True)
         
         # Act
@@ -218,8 +481,9 @@ class TestTaskUseCase:
         
         # Assert
         assert result is True
-        mock_file_storage.delete.assert_called_once_with(attachment.file_url)
-        mock_task_repository.delete.assert_called_once_with(mock_task_id)
+        mock_task_repository.delete.assert_called_once_with(mock_task_id, mock_user_id)
+        mock_task_repository.get_by_id.assert_not_called()
+        mock_file_storage.delete.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_delete_task_not_found(
@@ -229,14 +493,84 @@ class TestTaskUseCase:
         mock_task_id: UUID,
         mock_task_repository: ITaskRepository
     ):
-        """Test task deletion fails when task not found"""
+        """Test task deletion fails when the user has no such live task"""
         # Arrange
-        mock_task_repository.get_by_id = AsyncMock(return_value=None)
+        mock_task_repository.delete = AsyncMock(return_value=False)
         
         # Act
         result = await task_use_case.delete_task(mock_task_id, mock_user_id)
         
         # Assert
         assert result is False
-        mock_task_repository.delete.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_restore_task_success(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_id: UUID,
+        mock_task_repository: ITaskRepository,
+        sample_task: Task
+    ):
+        """Test restoring clears the tombstone and returns the full task"""
+        # Arrange
+        mock_task_repository.restore = AsyncMock(return_value=True)
+        mock_task_repository.get_by_id = AsyncMock(return_value=sample_task)
+        
+        # Act
+        result = await task_use_case.restore_task(mock_task_id, mock_user_id)
+        
+        # Assert
+        assert result == sample_task
+        mock_task_repository.restore.assert_called_once_with(mock_task_id, mock_user_id)
+    
+    @pytest.mark.asyncio
+    async def test_restore_task_not_found(
+        self,
+        task_use_case: TaskUseCase,
+        mock_user_id: UUID,
+        mock_task_id: UUID,
+        mock_task_repository: ITaskRepository
+    ):
+        """Test restoring fails for a task that is not deleted, already purged or not owned"""
+        # Arrange
+        mock_task_repository.restore = AsyncMock(return_value=False)
+        
+        # Act
+        result = await task_use_case.restore_task(mock_task_id, mock_user_id)
+        
+        # Assert
+        assert result is None
+        mock_task_repository.get_by_id.assert_not_called()
 
+    
+    @pytest.mark.asyncio
+    async def test_remove_attachment_commits_before_deleting_file(
+        self,
+        mock_user_id: UUID,
+        mock_task_id: UUID,
+        sample_task: Task,
+        mock_task_repository: ITaskRepository,
+        mock_file_storage: IFileStorage
+    ):
+        """Test the row deletion is committed before the stored file is removed"""
+        # Arrange
+        attachment = Attachment(
+            task_id=mock_task_id, filename="a.txt", file_url="u", file_size_bytes=1, content_type="text/plain"
+        )
+        calls = []
+        uow = AsyncMock()
+        uow.commit = AsyncMock(side_effect=lambda: calls.append("commit"))
+        mock_file_storage.delete = AsyncMock(side_effect=lambda url: calls.append("delete_file"))
+        mock_task_repository.get_attachment_by_id = AsyncMock(return_value=attachment)
+        mock_task_repository.get_by_id = AsyncMock(return_value=sample_task)
+        mock_task_repository.delete_attachment = AsyncMock(return_value=True)
+        task_use_case = TaskUseCase(mock_task_repository, mock_file_storage, uow=uow)
+        
+        # Act
+        result = await task_use_case.remove_attachment(mock_user_id, attachment.id)
+        
+        # Assert
+        assert result is True
+        assert calls == ["commit", "delete_file"]
+        mock_file_storage.delete.assert_called_once_with("u")